@@ -68,6 +68,11 @@ def create_app(config_name=None):
     else:
         app.logger.info("Batch poller skipped (reloader process)")
 
+    # Detect the proxy video encoder in the background so the first proxy job doesn't wait
+    import threading
+    from app.utils.video_encoders import get_video_encoder
+    threading.Thread(target=get_video_encoder, name='encoder-detect', daemon=True).start()
+
     # Register blueprints
     from app.routes import (
         main, upload,
@@ -118,6 +123,14 @@ def create_app(config_name=None):
             'version': '1.0.0'
         }, 200
 
+    @app.route('/health/db')
+    def database_health():
+        from app.database import get_db
+        return {
+            'status': 'healthy',
+            'connection_pool': get_db().get_pool_stats()
+        }, 200
+
     # Template context processors
     @app.context_processor
     def utility_processor():
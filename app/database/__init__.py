@@ -21,6 +21,8 @@ from app.database.async_jobs import AsyncJobsMixin
 from app.database.search import SearchMixin
 from app.database.billing_cache import BillingCacheMixin
 from app.database.batch_jobs import BedrockBatchJobsMixin
+from app.database.query_cache import QueryEmbeddingCacheMixin
+from app.database.scan_index import ScanIndexMixin
 
 
 class Database(
@@ -33,7 +35,9 @@ class Database(
     AsyncJobsMixin,
     SearchMixin,
     BillingCacheMixin,
-    BedrockBatchJobsMixin
+    BedrockBatchJobsMixin,
+    QueryEmbeddingCacheMixin,
+    ScanIndexMixin
 ):
     """
     Unified database interface combining all domain-specific mixins.
@@ -49,6 +53,8 @@ class Database(
         - SearchMixin: Search and statistics operations
         - BillingCacheMixin: AWS billing cache operations
         - BedrockBatchJobsMixin: Bedrock batch job tracking operations
+        - QueryEmbeddingCacheMixin: Persistent search query embedding cache
+        - ScanIndexMixin: Per-directory index for incremental rescans
     """
     pass
 
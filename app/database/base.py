@@ -10,6 +10,8 @@ from datetime import datetime
 from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 
+from app.database.connection_pool import ConnectionPool, PooledConnection
+
 
 class DatabaseBase:
     """Base class with connection and schema management."""
@@ -18,8 +20,22 @@ class DatabaseBase:
         """Initialize database connection."""
         self.db_path = Path(db_path)
         self._ensure_db_directory()
+        self._pool = ConnectionPool(
+            self._open_connection,
+            max_size=self._get_int_env('DATABASE_POOL_SIZE', 8),
+            acquire_timeout=float(self._get_int_env('DATABASE_POOL_TIMEOUT', 5)),
+            health_check_interval=float(self._get_int_env('DATABASE_POOL_HEALTH_CHECK_INTERVAL', 30)),
+        )
         self._init_db()
 
+    @staticmethod
+    def _get_int_env(name: str, default: int) -> int:
+        """Read an integer setting from the environment."""
+        try:
+            return int(os.getenv(name, str(default)))
+        except ValueError:
+            return default
+
     def _ensure_db_directory(self):
         """Ensure database directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -33,6 +49,11 @@ class DatabaseBase:
 
     def _load_vector_extension(self, conn: sqlite3.Connection) -> bool:
         """Attempt to load the SQLite vector extension for this connection."""
+        # Pooled connections remember the outcome so the fallbacks run once
+        cached = getattr(conn, 'vec_loaded', None)
+        if cached is not None:
+            return cached
+
         try:
             conn.enable_load_extension(True)
         except Exception:
@@ -67,6 +88,8 @@ class DatabaseBase:
         except Exception:
             pass
 
+        if isinstance(conn, PooledConnection):
+            conn.vec_loaded = loaded
         return loaded
 
     def _ensure_embedding_tables(self, conn: sqlite3.Connection):
@@ -106,15 +129,216 @@ class DatabaseBase:
 
         if self._load_vector_extension(conn):
             dimension = self._get_embedding_dimension()
+            storage = self._get_embedding_storage()
+            filter_columns = self._vec_supports_metadata_columns(conn)
             cursor.execute(f'''
                 CREATE VIRTUAL TABLE IF NOT EXISTS nova_embeddings
-                USING vec0(embedding float[{dimension}])
+                USING vec0({self._vec0_columns(dimension, storage, filter_columns)})
             ''')
 
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        # Full-precision vectors used to re-rank quantized KNN candidates
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS nova_embedding_vectors (
+                rowid INTEGER PRIMARY KEY,
+                embedding BLOB NOT NULL
+            )
+        ''')
+
+    # sqlite-vec release that added metadata and partition key columns to vec0
+    VEC_METADATA_MIN_VERSION = (0, 1, 6)
+
+    # nova_embeddings vector storage: vec0 element type and the SQL used to
+    # convert a float32 blob into it
+    EMBEDDING_STORAGE_MODES = {
+        'float': ('float', '?'),
+        'int8': ('int8', "vec_quantize_int8(?, 'unit')"),
+        'bit': ('bit', 'vec_quantize_binary(?)'),
+    }
+
+    def _get_embedding_storage(self) -> str:
+        """Get configured vector storage mode for new vec0 tables (float, int8 or bit)."""
+        storage = os.getenv('NOVA_EMBED_STORAGE', 'float').strip().lower()
+        return storage if storage in self.EMBEDDING_STORAGE_MODES else 'float'
+
+    @classmethod
+    def _vec0_columns(cls, dimension: int, storage: str = 'float',
+                      filter_columns: bool = True) -> str:
+        """
+        vec0 column list for nova_embeddings.
+
+        With filter_columns, source_type is a partition key (vectors are sharded
+        per source type) and model_name and file_id are metadata columns usable
+        in the KNN WHERE clause. vec0 metadata can't be NULL, so a missing
+        file_id is stored as 0.
+        """
+        element_type = cls.EMBEDDING_STORAGE_MODES[storage][0]
+        columns = f'embedding {element_type}[{dimension}]'
+        if filter_columns:
+            columns += ', source_type text partition key, model_name text, file_id integer'
+        return columns
+
+    def _vec_supports_metadata_columns(self, conn: sqlite3.Connection) -> bool:
+        """Whether the loaded sqlite-vec build supports metadata/partition columns."""
+        try:
+            version = conn.execute('SELECT vec_version()').fetchone()[0]
+            parts = tuple(int(p) for p in str(version).lstrip('v').split('-')[0].split('.')[:3])
+            return parts >= self.VEC_METADATA_MIN_VERSION
+        except (sqlite3.Error, ValueError, TypeError):
+            return False
+
+    def _vec_table_layout(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """
+        Layout of the existing nova_embeddings table (cached).
+
+        Returns:
+            Dict with 'storage' (float/int8/bit) and 'filter_columns' (bool)
+        """
+        cached = getattr(self, '_vec_layout', None)
+        if cached is not None:
+            return cached
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'nova_embeddings'"
+        ).fetchone()
+        if row is None:
+            return {'storage': 'float', 'filter_columns': False}
+        sql = (row[0] or '').lower()
+        storage = 'float'
+        for mode, (element_type, _) in self.EMBEDDING_STORAGE_MODES.items():
+            if f'embedding {element_type}[' in sql:
+                storage = mode
+        self._vec_layout = {'storage': storage, 'filter_columns': 'source_type' in sql}
+        return self._vec_layout
+
+    def _vec_table_has_filter_columns(self, conn: sqlite3.Connection) -> bool:
+        """Whether nova_embeddings was created with the filter columns."""
+        return self._vec_table_layout(conn)['filter_columns']
+
+    # Full-text indexes kept in step with their content tables by triggers.
+    # Each entry: (fts table, content table, indexed columns)
+    FTS_TABLES = [
+        ('files_fts', 'files', ['filename', 'local_path', 'metadata', 'codec_video', 'codec_audio']),
+        ('transcripts_fts', 'transcripts', ['file_name', 'transcript_text']),
+        ('nova_jobs_fts', 'nova_jobs', [
+            'summary_result', 'chapters_result', 'elements_result',
+            'waterfall_classification_result', 'search_metadata'
+        ]),
+    ]
+
+    @staticmethod
+    def _detect_fts_tokenizer(conn: sqlite3.Connection) -> Optional[str]:
+        """
+        Pick the FTS5 tokenizer: 'trigram' (substring matching, SQLite 3.34+),
+        else 'unicode61' (word prefix matching), or None without FTS5.
+        """
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                conn.execute(
+                    f"CREATE VIRTUAL TABLE temp.fts_tokenizer_probe USING fts5(x, tokenize='{tokenizer}')"
+                )
+                conn.execute('DROP TABLE temp.fts_tokenizer_probe')
+                return tokenizer
+            except sqlite3.OperationalError:
+                continue
+        return None
+
+    def _ensure_fts_tables(self, conn: sqlite3.Connection) -> bool:
+        """
+        Ensure FTS5 search indexes and their sync triggers exist.
+
+        Indexes use external content (no duplicated text) and the trigram
+        tokenizer where available, so keyword search keeps substring
+        semantics ('fall' finds 'waterfall'). An index built with another
+        tokenizer is dropped and recreated; a newly created index is
+        populated from its content table with 'rebuild'.
+
+        Returns:
+            True if FTS5 is available and the indexes are ready
+        """
+        tokenizer = self._detect_fts_tokenizer(conn)
+        self.fts_tokenizer = tokenizer
+        if tokenizer is None:
+            return False  # SQLite built without FTS5
+
+        cursor = conn.cursor()
+        for fts_table, content_table, columns in self.FTS_TABLES:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (fts_table,)
+            )
+            row = cursor.fetchone()
+            exists = row is not None
+            if exists and ('trigram' in (row[0] or '')) != (tokenizer == 'trigram'):
+                # Built with a different tokenizer: recreate and repopulate
+                for suffix in ('ai', 'ad', 'au'):
+                    cursor.execute(f'DROP TRIGGER IF EXISTS {fts_table}_{suffix}')
+                cursor.execute(f'DROP TABLE {fts_table}')
+                exists = False
+            column_list = ', '.join(columns)
+            new_values = ', '.join(f'new.{c}' for c in columns)
+            old_values = ', '.join(f'old.{c}' for c in columns)
+
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+                USING fts5({column_list}, content='{content_table}', content_rowid='id',
+                           tokenize='{tokenizer}')
+            ''')
+
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {content_table} BEGIN
+                    INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {content_table} BEGIN
+                    INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                    VALUES ('delete', old.id, {old_values});
+                END
+            ''')
+            # Only re-index when an indexed column changes (not on status/progress updates)
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {content_table} BEGIN
+                    INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                    VALUES ('delete', old.id, {old_values});
+                    INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values});
+                END
+            ''')
+
+            if not exists:
+                cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+
+        return True
+
+    def rebuild_search_index(self, optimize: bool = True) -> Dict[str, int]:
+        """
+        Rebuild FTS5 search indexes from their content tables.
+
+        Args:
+            optimize: Merge index b-trees after rebuilding
+
+        Returns:
+            Dict of fts table name -> indexed row count
+        """
+        counts = {}
+        with self.get_connection() as conn:
+            if not self._ensure_fts_tables(conn):
+                raise RuntimeError("SQLite FTS5 extension not available")
+            cursor = conn.cursor()
+            for fts_table, _, _ in self.FTS_TABLES:
+                cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+                if optimize:
+                    cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('optimize')")
+                cursor.execute(f'SELECT COUNT(*) FROM {fts_table}')
+                counts[fts_table] = cursor.fetchone()[0]
+        return counts
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new connection for the pool."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=10.0,
+            factory=PooledConnection,
+            check_same_thread=False,  # Idle connections are handed between threads
+        )
         conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
         # Enable WAL mode for better concurrent access
         conn.execute('PRAGMA journal_mode=WAL')
@@ -124,14 +348,52 @@ class DatabaseBase:
             self._load_vector_extension(conn)
         except Exception:
             pass
+        return conn
+
+    @contextmanager
+    def get_connection(self):
+        """
+        Context manager for pooled database connections.
+
+        The outermost context on a thread commits or rolls back. Nested
+        contexts on the same thread reuse the connection inside a savepoint,
+        so an inner failure only undoes the inner work.
+        """
+        conn = self._pool.acquire()
+        depth = self._pool.depth()
+        savepoint = f'sp_nested_{depth}' if depth > 1 else None
         try:
+            if savepoint:
+                # A SAVEPOINT outside a transaction starts one and its RELEASE
+                # commits, so open the outer transaction first
+                if not conn.in_transaction:
+                    conn.execute('BEGIN')
+                conn.execute(f'SAVEPOINT {savepoint}')
             yield conn
-            conn.commit()
+            if savepoint:
+                conn.execute(f'RELEASE SAVEPOINT {savepoint}')
+            else:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if savepoint:
+                try:
+                    conn.execute(f'ROLLBACK TO SAVEPOINT {savepoint}')
+                    conn.execute(f'RELEASE SAVEPOINT {savepoint}')
+                except sqlite3.Error:
+                    pass
+            else:
+                conn.rollback()
             raise
         finally:
-            conn.close()
+            self._pool.release(conn)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool counters (hits/misses, open latency)."""
+        return self._pool.get_stats()
+
+    def close_pool(self):
+        """Close idle pooled connections."""
+        self._pool.close_all()
 
     def _init_db(self):
         """Initialize database schema."""
@@ -219,6 +481,12 @@ class DatabaseBase:
                 ('transcripts', 'transcript_summary', 'TEXT'),
                 # Performance: avoid JSON extraction for created date filtering
                 ('files', 'created_date', 'TEXT'),
+                # S3 ffprobe cache, valid while the object's ETag matches
+                ('files', 'probe_etag', 'TEXT'),
+                ('files', 'probe_metadata', 'JSON'),
+                # Partial content hash for rescan move detection, valid for this mtime
+                ('files', 'content_fingerprint', 'TEXT'),
+                ('files', 'content_fingerprint_mtime', 'REAL'),
             ]
             for table, column, col_type in migration_columns:
                 try:
@@ -331,6 +599,10 @@ class DatabaseBase:
                 ('bedrock_batch_jobs', 'results_fetched_at', 'TIMESTAMP'),
                 ('bedrock_batch_jobs', 'results_fetch_attempts', 'INTEGER DEFAULT 0'),
                 ('bedrock_batch_jobs', 'last_error', 'TEXT'),
+                # Batch poller schedule (see BatchPollerService._next_check_delay)
+                ('bedrock_batch_jobs', 'next_check_at', 'TIMESTAMP'),
+                ('bedrock_batch_jobs', 'check_count', 'INTEGER DEFAULT 0'),
+                ('bedrock_batch_jobs', 'last_bedrock_status', 'TEXT'),
             ]
             for table, column, col_type in bedrock_batch_columns:
                 try:
@@ -474,6 +746,46 @@ class DatabaseBase:
                 WHERE character_count IS NULL AND transcript_text IS NOT NULL
             ''')
 
+            # Search query embedding cache (skips Bedrock calls for repeated queries)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS query_embedding_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    normalized_query TEXT NOT NULL,
+                    model_id TEXT NOT NULL,
+                    dimension INTEGER NOT NULL,
+                    purpose TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    embed_latency_ms REAL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL,
+                    hit_count INTEGER DEFAULT 0
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_query_embedding_cache_last_used
+                ON query_embedding_cache(last_used_at DESC)
+            ''')
+
+            # Per-directory scan index (rescans skip directories whose mtime is unchanged)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS directory_scan_index (
+                    path TEXT PRIMARY KEY,
+                    root_path TEXT NOT NULL,
+                    mtime REAL NOT NULL,
+                    scanned_at REAL NOT NULL,
+                    extensions TEXT NOT NULL,
+                    files JSON NOT NULL,
+                    subdirs JSON NOT NULL
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_directory_scan_index_root
+                ON directory_scan_index(root_path)
+            ''')
+
+            # Full-text search indexes (FTS5) with sync triggers
+            self._fts_available = self._ensure_fts_tables(conn)
+
             # Embedding tables (requires vector extension for vec0 virtual table)
             self._ensure_embedding_tables(conn)
 
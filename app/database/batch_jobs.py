@@ -107,15 +107,35 @@ class BedrockBatchJobsMixin:
 
         return datetime.utcnow() - last_checked > timedelta(seconds=cache_seconds)
 
-    def mark_bedrock_batch_checked(self, batch_job_arn: str):
-        """Update last_checked_at timestamp."""
+    def mark_bedrock_batch_checked(self, batch_job_arn: str, next_check_at: str = None,
+                                   check_count: int = None, bedrock_status: str = None):
+        """
+        Update last_checked_at timestamp, and the poller's schedule when bedrock_status is given.
+
+        Args:
+            batch_job_arn: Batch job ARN
+            next_check_at: When the poller should check the job next (UTC,
+                'YYYY-MM-DD HH:MM:SS'); None for a job that needs no more checks
+            check_count: Consecutive checks that saw bedrock_status unchanged
+            bedrock_status: Status Bedrock reported
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE bedrock_batch_jobs
-                SET last_checked_at = CURRENT_TIMESTAMP
-                WHERE batch_job_arn = ?
-            ''', (batch_job_arn,))
+            if bedrock_status is None:
+                cursor.execute('''
+                    UPDATE bedrock_batch_jobs
+                    SET last_checked_at = CURRENT_TIMESTAMP
+                    WHERE batch_job_arn = ?
+                ''', (batch_job_arn,))
+            else:
+                cursor.execute('''
+                    UPDATE bedrock_batch_jobs
+                    SET last_checked_at = CURRENT_TIMESTAMP,
+                        next_check_at = ?,
+                        check_count = ?,
+                        last_bedrock_status = ?
+                    WHERE batch_job_arn = ?
+                ''', (next_check_at, check_count, bedrock_status, batch_job_arn))
 
     def get_old_bedrock_batch_jobs(self, days_old: int = 7) -> List[Dict[str, Any]]:
         """Get completed batch jobs older than specified days for cleanup."""
@@ -187,7 +207,6 @@ class BedrockBatchJobsMixin:
                 SET cleanup_completed_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (job_id,))
-            conn.commit()
 
     def get_pending_batch_jobs_for_polling(self, check_interval_seconds: int = 30) -> List[Dict[str, Any]]:
         """
@@ -220,6 +239,26 @@ class BedrockBatchJobsMixin:
                 jobs.append(job)
             return jobs
 
+    def get_recent_batch_job_durations(self, limit: int = 50) -> List[float]:
+        """
+        Submit-to-completion times of recently completed batch jobs.
+
+        Returns:
+            Durations in seconds, most recent first
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT (julianday(completed_at) - julianday(submitted_at)) * 86400 AS duration
+                FROM bedrock_batch_jobs
+                WHERE status = 'COMPLETED'
+                  AND completed_at IS NOT NULL AND submitted_at IS NOT NULL
+                ORDER BY completed_at DESC
+                LIMIT ?
+            ''', (limit,))
+            return [row['duration'] for row in cursor.fetchall()
+                    if row['duration'] is not None and row['duration'] > 0]
+
     def mark_results_fetched(self, batch_job_arn: str):
         """Mark that results have been successfully fetched."""
         with self.get_connection() as conn:
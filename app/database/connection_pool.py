@@ -0,0 +1,234 @@
+"""
+Thread-aware SQLite connection pool.
+
+Connections are opened once (pragmas applied, vector extension loaded) and
+then reused. A thread keeps the same connection for nested ``acquire`` calls,
+so helpers that call other helpers share one connection and one transaction.
+Idle connections are shared between threads, which suits Flask's
+thread-per-request model and the batch worker threads alike.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that can carry pool bookkeeping attributes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.vec_loaded: Optional[bool] = None
+        self.pool_created_at = time.monotonic()
+        self.pool_last_used = self.pool_created_at
+        self.pool_overflow = False
+
+
+class ConnectionPool:
+    """
+    Bounded pool of long-lived SQLite connections.
+
+    Args:
+        factory: Callable that opens and configures a new connection
+        max_size: Maximum number of pooled connections
+        acquire_timeout: Seconds to wait for an idle connection before opening
+                         a temporary overflow connection
+        health_check_interval: Idle seconds after which a connection is
+                               validated with ``SELECT 1`` before reuse
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], max_size: int = 8,
+                 acquire_timeout: float = 5.0, health_check_interval: float = 30.0):
+        self._factory = factory
+        self.max_size = max(1, int(max_size))
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+
+        self._lock = threading.Condition(threading.Lock())
+        self._local = threading.local()
+        self._idle: List[sqlite3.Connection] = []
+        self._open_count = 0
+        self._pid = os.getpid()
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            'hits': 0,
+            'misses': 0,
+            'nested_hits': 0,
+            'overflow_opens': 0,
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'health_check_failures': 0,
+            'fork_resets': 0,
+            'wait_count': 0,
+            'open_latency_ms_total': 0.0,
+            'open_latency_ms_max': 0.0,
+        }
+
+    def _check_fork(self):
+        """Drop inherited connections after os.fork(); never reuse them in the child."""
+        if os.getpid() == self._pid:
+            return
+        with self._lock:
+            if os.getpid() == self._pid:
+                return
+            # Do not close inherited handles - they belong to the parent process
+            self._idle = []
+            self._open_count = 0
+            self._local = threading.local()
+            self._pid = os.getpid()
+            fork_resets = self._stats['fork_resets'] + 1
+            self._stats = self._empty_stats()
+            self._stats['fork_resets'] = fork_resets
+
+    def _open(self, overflow: bool = False) -> sqlite3.Connection:
+        start = time.perf_counter()
+        conn = self._factory()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if isinstance(conn, PooledConnection):
+            conn.pool_overflow = overflow
+        with self._lock:
+            self._stats['connections_opened'] += 1
+            self._stats['open_latency_ms_total'] += elapsed_ms
+            self._stats['open_latency_ms_max'] = max(self._stats['open_latency_ms_max'], elapsed_ms)
+            if overflow:
+                self._stats['overflow_opens'] += 1
+        return conn
+
+    def _close(self, conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._stats['connections_closed'] += 1
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        last_used = getattr(conn, 'pool_last_used', None)
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            conn.execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection for the current thread (re-entrant)."""
+        self._check_fork()
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.depth += 1
+            with self._lock:
+                self._stats['nested_hits'] += 1
+            return conn
+
+        conn = None
+        overflow = False
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._lock:
+            while conn is None:
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._stats['hits'] += 1
+                    break
+                if self._open_count < self.max_size:
+                    self._open_count += 1
+                    self._stats['misses'] += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    overflow = True
+                    self._stats['misses'] += 1
+                    break
+                self._stats['wait_count'] += 1
+                self._lock.wait(remaining)
+
+        if conn is not None and not self._is_healthy(conn):
+            with self._lock:
+                self._stats['health_check_failures'] += 1
+            self._close(conn)
+            conn = None
+
+        if conn is None:
+            try:
+                conn = self._open(overflow=overflow)
+            except Exception:
+                if not overflow:
+                    with self._lock:
+                        self._open_count -= 1
+                        self._lock.notify()
+                raise
+
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> bool:
+        """
+        Return a connection checked out with acquire().
+
+        Returns:
+            True if this was the outermost release for the thread (the caller
+            should finish the transaction), False for a nested release.
+        """
+        if getattr(self._local, 'conn', None) is not conn:
+            # Connection from before a fork or a foreign thread - just close it
+            self._close(conn)
+            return True
+
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return False
+
+        self._local.conn = None
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+        conn.row_factory = sqlite3.Row
+
+        if getattr(conn, 'pool_overflow', False) or os.getpid() != self._pid:
+            self._close(conn)
+            return True
+
+        if isinstance(conn, PooledConnection):
+            conn.pool_last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(conn)
+            self._lock.notify()
+        return True
+
+    def depth(self) -> int:
+        """Nesting depth of the current thread's checkout (0 if none)."""
+        return getattr(self._local, 'depth', 0) if getattr(self._local, 'conn', None) else 0
+
+    def close_all(self):
+        """Close idle connections (in-use connections close on release)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._open_count -= len(idle)
+            self._lock.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool counters for monitoring."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['max_size'] = self.max_size
+            stats['open'] = self._open_count
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = self._open_count - len(self._idle)
+        checkouts = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / checkouts, 4) if checkouts else 0.0
+        opened = stats['connections_opened']
+        stats['open_latency_ms_avg'] = round(stats['open_latency_ms_total'] / opened, 3) if opened else 0.0
+        stats['open_latency_ms_total'] = round(stats['open_latency_ms_total'], 3)
+        stats['open_latency_ms_max'] = round(stats['open_latency_ms_max'], 3)
+        return stats
@@ -1,13 +1,23 @@
 """Embedding operations mixin for database."""
 import json
+import os
+import sqlite3
 import struct
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 
 class EmbeddingsMixin:
     """Mixin providing vector embedding operations."""
 
+    # sqlite-vec rejects KNN queries with k above this
+    VEC_MAX_K = 4096
+    # Legacy tables: initial over-fetch factor and growth per refill round
+    VEC_OVERFETCH_FACTOR = 4
+    # Quantized storage: coarse KNN candidates fetched per requested result
+    # before re-ranking with full-precision vectors
+    RERANK_FACTORS = {'int8': 4, 'bit': 16}
+
     def _serialize_embedding(self, vector: List[float]) -> bytes:
         """Serialize embedding vector to float32 bytes for sqlite-vec."""
         return struct.pack(f'{len(vector)}f', *vector)
@@ -18,6 +28,34 @@ class EmbeddingsMixin:
         if len(vector) != expected:
             raise ValueError(f"Embedding dimension mismatch: expected {expected}, got {len(vector)}")
 
+    def _get_rerank_factor(self, storage: str) -> int:
+        """Candidate multiplier for the quantized coarse pass (NOVA_EMBED_RERANK_FACTOR overrides)."""
+        try:
+            return max(1, int(os.getenv('NOVA_EMBED_RERANK_FACTOR', '')))
+        except ValueError:
+            return self.RERANK_FACTORS.get(storage, 1)
+
+    def _vec_insert_sql(self, layout: Dict[str, Any], with_rowid: bool = True) -> str:
+        """INSERT statement for nova_embeddings matching its layout."""
+        columns = ['embedding']
+        values = [self.EMBEDDING_STORAGE_MODES[layout['storage']][1]]
+        if with_rowid:
+            columns.insert(0, 'rowid')
+            values.insert(0, '?')
+        if layout['filter_columns']:
+            columns += ['source_type', 'model_name', 'file_id']
+            values += ['?', '?', '?']
+        return f"INSERT INTO nova_embeddings({', '.join(columns)}) VALUES ({', '.join(values)})"
+
+    @staticmethod
+    def _vec_insert_row(layout: Dict[str, Any], vector_blob: bytes, source_type: str,
+                        model_name: str, file_id: Optional[int], rowid: Optional[int] = None) -> tuple:
+        """Parameters for _vec_insert_sql()."""
+        row = (vector_blob,) if rowid is None else (rowid, vector_blob)
+        if layout['filter_columns']:
+            row += (source_type, model_name, file_id or 0)
+        return row
+
     def get_embedding_by_hash(self, source_type: str, source_id: int,
                               model_name: str, content_hash: str) -> Optional[Dict[str, Any]]:
         """Get embedding metadata by content hash."""
@@ -51,9 +89,18 @@ class EmbeddingsMixin:
             if existing:
                 return existing['rowid']
 
+            layout = self._vec_table_layout(conn)
             vector_blob = self._serialize_embedding(embedding_vector)
-            cursor.execute('INSERT INTO nova_embeddings(embedding) VALUES (?)', (vector_blob,))
+            cursor.execute(
+                self._vec_insert_sql(layout, with_rowid=False),
+                self._vec_insert_row(layout, vector_blob, source_type, model_name, file_id)
+            )
             rowid = cursor.lastrowid
+            if layout['storage'] != 'float':
+                cursor.execute(
+                    'INSERT OR REPLACE INTO nova_embedding_vectors(rowid, embedding) VALUES (?, ?)',
+                    (rowid, vector_blob)
+                )
             cursor.execute('''
                 INSERT INTO nova_embedding_metadata (
                     rowid, source_type, source_id, file_id, model_name, content_hash, created_at
@@ -61,64 +108,159 @@ class EmbeddingsMixin:
             ''', (rowid, source_type, source_id, file_id, model_name, content_hash, datetime.now().isoformat()))
             return rowid
 
+    def get_existing_embedding_hashes(self, source_type: str, source_id: int,
+                                      model_name: str, content_hashes: List[str]) -> set:
+        """Return the subset of content_hashes already embedded for a source (one query)."""
+        if not content_hashes:
+            return set()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ','.join('?' * len(content_hashes))
+            cursor.execute(f'''
+                SELECT content_hash FROM nova_embedding_metadata
+                WHERE source_type = ? AND source_id = ? AND model_name = ?
+                  AND content_hash IN ({placeholders})
+            ''', [source_type, source_id, model_name, *content_hashes])
+            return {row['content_hash'] for row in cursor.fetchall()}
+
+    def create_nova_embeddings_batch(self, embeddings: List[Dict[str, Any]]) -> int:
+        """
+        Store many embeddings with one executemany per table.
+
+        Each item needs embedding_vector, source_type, source_id, model_name,
+        content_hash and optionally file_id. Items already stored (or repeated
+        within the batch) are skipped.
+
+        Returns:
+            Number of embeddings inserted
+        """
+        if not embeddings:
+            return 0
+        for item in embeddings:
+            self._validate_embedding_dimension(item['embedding_vector'])
+
+        with self.get_connection() as conn:
+            if not self._load_vector_extension(conn):
+                raise RuntimeError("SQLite vector extension not available. Set SQLITE_VEC_PATH or install sqlite-vec.")
+
+            self._ensure_embedding_tables(conn)
+            cursor = conn.cursor()
+
+            # Take the write lock up front so the rowid range below is ours
+            if not conn.in_transaction:
+                cursor.execute('BEGIN IMMEDIATE')
+
+            seen = set()
+            pending = []
+            for item in embeddings:
+                key = (item['source_type'], item['source_id'], item['model_name'], item['content_hash'])
+                if key not in seen:
+                    seen.add(key)
+                    pending.append(item)
+
+            existing = set()
+            for source_key in {(i['source_type'], i['source_id'], i['model_name']) for i in pending}:
+                hashes = [i['content_hash'] for i in pending
+                          if (i['source_type'], i['source_id'], i['model_name']) == source_key]
+                placeholders = ','.join('?' * len(hashes))
+                cursor.execute(f'''
+                    SELECT content_hash FROM nova_embedding_metadata
+                    WHERE source_type = ? AND source_id = ? AND model_name = ?
+                      AND content_hash IN ({placeholders})
+                ''', [*source_key, *hashes])
+                existing.update((*source_key, row['content_hash']) for row in cursor.fetchall())
+            pending = [i for i in pending
+                       if (i['source_type'], i['source_id'], i['model_name'], i['content_hash']) not in existing]
+            if not pending:
+                return 0
+
+            # Assign explicit rowids so vectors and metadata stay paired
+            cursor.execute('SELECT COALESCE(MAX(rowid), 0) AS max_rowid FROM nova_embedding_metadata')
+            next_rowid = cursor.fetchone()['max_rowid']
+            try:
+                cursor.execute('SELECT COALESCE(MAX(rowid), 0) AS max_rowid FROM nova_embeddings_rowids')
+                next_rowid = max(next_rowid, cursor.fetchone()['max_rowid'])
+            except sqlite3.OperationalError:
+                pass  # Shadow table layout differs across sqlite-vec builds
+
+            created_at = datetime.now().isoformat()
+            layout = self._vec_table_layout(conn)
+            vector_rows = []
+            full_precision_rows = []
+            metadata_rows = []
+            for offset, item in enumerate(pending, start=1):
+                rowid = next_rowid + offset
+                vector_blob = self._serialize_embedding(item['embedding_vector'])
+                vector_rows.append(self._vec_insert_row(
+                    layout, vector_blob, item['source_type'], item['model_name'],
+                    item.get('file_id'), rowid=rowid
+                ))
+                full_precision_rows.append((rowid, vector_blob))
+                metadata_rows.append((
+                    rowid, item['source_type'], item['source_id'], item.get('file_id'),
+                    item['model_name'], item['content_hash'], created_at
+                ))
+
+            cursor.executemany(self._vec_insert_sql(layout), vector_rows)
+            if layout['storage'] != 'float':
+                cursor.executemany(
+                    'INSERT OR REPLACE INTO nova_embedding_vectors(rowid, embedding) VALUES (?, ?)',
+                    full_precision_rows
+                )
+            cursor.executemany('''
+                INSERT INTO nova_embedding_metadata (
+                    rowid, source_type, source_id, file_id, model_name, content_hash, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', metadata_rows)
+            return len(pending)
+
     def search_embeddings(
         self,
         query_vector: List[float],
         limit: int = 20,
         source_types: Optional[List[str]] = None,
-        min_similarity: float = 0.0
+        min_similarity: float = 0.0,
+        model_name: Optional[str] = None,
+        file_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Perform KNN vector search using sqlite-vec.
 
+        When nova_embeddings has the vec0 filter columns (see
+        migrate_embeddings_to_filtered_vec0) the filters run inside the KNN,
+        so all `limit` neighbours match. Older tables over-fetch and re-query
+        with a larger k until enough rows survive the metadata filter.
+
+        With int8/bit storage the KNN runs on the quantized vectors and the
+        candidates are re-ranked by exact L2 distance (see _vec_knn).
+
         Args:
             query_vector: Embedding vector for the query
             limit: Maximum results to return
             source_types: Filter by source type ('transcript', 'nova_analysis')
             min_similarity: Minimum cosine similarity (0.0-1.0)
+            model_name: Only match embeddings from this model
+            file_id: Only match embeddings belonging to this file
 
         Returns:
             List of matches with distance, source_type, source_id, etc.
         """
         self._validate_embedding_dimension(query_vector)
+        limit = max(1, min(int(limit), self.VEC_MAX_K))
 
         with self.get_connection() as conn:
             if not self._load_vector_extension(conn):
                 raise RuntimeError("SQLite vector extension not available")
 
             query_blob = self._serialize_embedding(query_vector)
-            cursor = conn.cursor()
-
-            # Build query with optional source_type filter.
-            # vec0 requires a k/limit constraint on the vector table itself.
-            sql = '''
-                SELECT
-                    e.rowid,
-                    e.distance,
-                    m.source_type,
-                    m.source_id,
-                    m.file_id,
-                    m.model_name,
-                    m.content_hash,
-                    m.created_at
-                FROM (
-                    SELECT rowid, distance
-                    FROM nova_embeddings
-                    WHERE embedding MATCH ? AND k = ?
-                ) e
-                JOIN nova_embedding_metadata m ON e.rowid = m.rowid
-            '''
-            params = [query_blob, max(1, int(limit))]
-
-            if source_types:
-                placeholders = ','.join('?' * len(source_types))
-                sql += f' AND m.source_type IN ({placeholders})'
-                params.extend(source_types)
-
-            sql += ' ORDER BY e.distance'
-
-            cursor.execute(sql, params)
-            results = [dict(row) for row in cursor.fetchall()]
+            if self._vec_table_has_filter_columns(conn):
+                results = self._search_embeddings_filtered(
+                    conn, query_blob, limit, source_types, model_name, file_id
+                )
+            else:
+                results = self._search_embeddings_refill(
+                    conn, query_blob, limit, source_types, model_name, file_id
+                )
 
             # Convert L2 distance to similarity score (optional normalization)
             for r in results:
@@ -131,6 +273,245 @@ class EmbeddingsMixin:
 
             return results
 
+    def _vec_knn(self, cursor, query_blob: bytes, k: int,
+                 conditions: Optional[List[str]] = None,
+                 params: Optional[List[Any]] = None) -> Tuple[List[tuple], bool]:
+        """
+        Run one KNN query against nova_embeddings.
+
+        Quantized tables fetch k * rerank factor candidates and order them by
+        exact L2 distance against nova_embedding_vectors before trimming to k.
+
+        Returns:
+            ((distance, rowid) pairs nearest first, whether the index is exhausted)
+        """
+        layout = self._vec_table_layout(cursor.connection)
+        storage = layout['storage']
+        fetch_k = k if storage == 'float' else min(k * self._get_rerank_factor(storage), self.VEC_MAX_K)
+
+        sql = (
+            'SELECT rowid, distance FROM nova_embeddings '
+            f'WHERE embedding MATCH {self.EMBEDDING_STORAGE_MODES[storage][1]} AND k = ?'
+        )
+        sql += ''.join(f' AND {condition}' for condition in conditions or [])
+        cursor.execute(sql, [query_blob, fetch_k, *(params or [])])
+        neighbours = [(row['distance'], row['rowid']) for row in cursor.fetchall()]
+        exhausted = len(neighbours) < fetch_k or fetch_k >= self.VEC_MAX_K
+
+        if storage != 'float' and neighbours:
+            rowids = [rowid for _, rowid in neighbours]
+            placeholders = ','.join('?' * len(rowids))
+            cursor.execute(f'''
+                SELECT rowid, vec_distance_l2(embedding, ?) AS distance
+                FROM nova_embedding_vectors
+                WHERE rowid IN ({placeholders})
+            ''', [query_blob, *rowids])
+            neighbours = sorted((row['distance'], row['rowid']) for row in cursor.fetchall())
+
+        return neighbours[:k], exhausted
+
+    def _search_embeddings_filtered(self, conn, query_blob: bytes, limit: int,
+                                    source_types: Optional[List[str]],
+                                    model_name: Optional[str],
+                                    file_id: Optional[int]) -> List[Dict[str, Any]]:
+        """KNN with filters pushed into vec0 (one query per source_type partition)."""
+        conditions: List[str] = []
+        params: List[Any] = []
+        if model_name:
+            conditions.append('model_name = ?')
+            params.append(model_name)
+        if file_id is not None:
+            conditions.append('file_id = ?')
+            params.append(file_id)
+
+        # Partition keys only support equality, so each type is its own KNN
+        partitions = list(dict.fromkeys(source_types)) if source_types else [None]
+        cursor = conn.cursor()
+        neighbours = []
+        for source_type in partitions:
+            if source_type is None:
+                found, _ = self._vec_knn(cursor, query_blob, limit, conditions, params)
+            else:
+                found, _ = self._vec_knn(cursor, query_blob, limit,
+                                         conditions + ['source_type = ?'], params + [source_type])
+            neighbours.extend(found)
+
+        neighbours.sort()
+        return self._join_embedding_metadata(cursor, neighbours[:limit])
+
+    def _search_embeddings_refill(self, conn, query_blob: bytes, limit: int,
+                                  source_types: Optional[List[str]],
+                                  model_name: Optional[str],
+                                  file_id: Optional[int]) -> List[Dict[str, Any]]:
+        """KNN on a vector-only vec0 table, growing k until the post-filter is satisfied."""
+        cursor = conn.cursor()
+        filtered = bool(source_types or model_name or file_id is not None)
+        k = min(limit * self.VEC_OVERFETCH_FACTOR, self.VEC_MAX_K) if filtered else limit
+
+        while True:
+            neighbours, exhausted = self._vec_knn(cursor, query_blob, k)
+            results = self._join_embedding_metadata(cursor, neighbours)
+            if source_types:
+                results = [r for r in results if r['source_type'] in source_types]
+            if model_name:
+                results = [r for r in results if r['model_name'] == model_name]
+            if file_id is not None:
+                results = [r for r in results if r['file_id'] == file_id]
+
+            if len(results) >= limit or exhausted or k >= self.VEC_MAX_K:
+                return results[:limit]
+            k = min(k * self.VEC_OVERFETCH_FACTOR, self.VEC_MAX_K)
+
+    def _join_embedding_metadata(self, cursor, neighbours: List[tuple]) -> List[Dict[str, Any]]:
+        """Attach metadata to (distance, rowid) pairs, keeping distance order."""
+        if not neighbours:
+            return []
+        rowids = [rowid for _, rowid in neighbours]
+        placeholders = ','.join('?' * len(rowids))
+        cursor.execute(f'''
+            SELECT rowid, source_type, source_id, file_id, model_name, content_hash, created_at
+            FROM nova_embedding_metadata
+            WHERE rowid IN ({placeholders})
+        ''', rowids)
+        metadata = {row['rowid']: dict(row) for row in cursor.fetchall()}
+
+        results = []
+        for distance, rowid in neighbours:
+            row = metadata.get(rowid)
+            if row is not None:
+                row['distance'] = distance
+                results.append(row)
+        return results
+
+    def iter_embedding_vectors(self, batch_size: int = 500):
+        """
+        Yield (metadata dict, float32 vector bytes) for every stored embedding.
+
+        Reads pages by rowid so no connection is held between pages.
+        """
+        last_rowid = 0
+        while True:
+            with self.get_connection() as conn:
+                if not self._load_vector_extension(conn):
+                    raise RuntimeError("SQLite vector extension not available")
+                layout = self._vec_table_layout(conn)
+                source_table = 'nova_embeddings' if layout['storage'] == 'float' else 'nova_embedding_vectors'
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT m.*, v.embedding AS embedding
+                    FROM nova_embedding_metadata m
+                    JOIN {source_table} v ON v.rowid = m.rowid
+                    WHERE m.rowid > ?
+                    ORDER BY m.rowid
+                    LIMIT ?
+                ''', (last_rowid, batch_size))
+                rows = [dict(row) for row in cursor.fetchall()]
+            if not rows:
+                return
+            for row in rows:
+                yield row, row.pop('embedding')
+            last_rowid = rows[-1]['rowid']
+
+    def migrate_embeddings_to_filtered_vec0(self) -> Dict[str, Any]:
+        """Rebuild nova_embeddings with source_type/model_name/file_id columns."""
+        return self.rebuild_embedding_index(filter_columns=True)
+
+    def rebuild_embedding_index(self, storage: Optional[str] = None,
+                                filter_columns: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Rebuild nova_embeddings with a different vector storage mode and/or filter columns.
+
+        Full-precision vectors (from the float vec0 table, or from
+        nova_embedding_vectors for quantized tables) are copied to a scratch
+        table, the vec0 table is recreated and refilled from the copy joined
+        with nova_embedding_metadata, all in one transaction. Vectors without
+        metadata are dropped. Quantized modes keep the float32 copies in
+        nova_embedding_vectors for re-ranking; float mode clears them.
+
+        Args:
+            storage: 'float', 'int8' or 'bit' (default: keep current)
+            filter_columns: Add vec0 filter columns (default: keep current)
+
+        Returns:
+            Dict with status, storage, filter_columns and migrated/dropped counts
+        """
+        with self.get_connection() as conn:
+            if not self._load_vector_extension(conn):
+                raise RuntimeError("SQLite vector extension not available. Set SQLITE_VEC_PATH or install sqlite-vec.")
+
+            self._ensure_embedding_tables(conn)
+            current = self._vec_table_layout(conn)
+            storage = (storage or current['storage']).lower()
+            if storage not in self.EMBEDDING_STORAGE_MODES:
+                raise ValueError(f"Unknown embedding storage mode: {storage}")
+            if filter_columns is None:
+                filter_columns = current['filter_columns']
+            if filter_columns and not self._vec_supports_metadata_columns(conn):
+                raise RuntimeError(
+                    "Installed sqlite-vec does not support metadata columns "
+                    f"(need v{'.'.join(map(str, self.VEC_METADATA_MIN_VERSION))} or newer)"
+                )
+
+            target = {'storage': storage, 'filter_columns': filter_columns}
+            if current == target:
+                return {'status': 'already_migrated', **target, 'migrated': 0, 'dropped': 0}
+
+            cursor = conn.cursor()
+            if not conn.in_transaction:
+                cursor.execute('BEGIN IMMEDIATE')
+
+            source_table = 'nova_embeddings' if current['storage'] == 'float' else 'nova_embedding_vectors'
+            cursor.execute('DROP TABLE IF EXISTS nova_embeddings_migration')
+            cursor.execute('''
+                CREATE TABLE nova_embeddings_migration (
+                    rowid INTEGER PRIMARY KEY,
+                    embedding BLOB NOT NULL
+                )
+            ''')
+            cursor.execute(f'''
+                INSERT INTO nova_embeddings_migration (rowid, embedding)
+                SELECT rowid, embedding FROM {source_table}
+            ''')
+            total = cursor.rowcount
+
+            cursor.execute('DROP TABLE nova_embeddings')
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE nova_embeddings
+                USING vec0({self._vec0_columns(self._get_embedding_dimension(), storage, filter_columns)})
+            ''')
+
+            vector_expr = self.EMBEDDING_STORAGE_MODES[storage][1].replace('?', 'v.embedding')
+            if filter_columns:
+                cursor.execute(f'''
+                    INSERT INTO nova_embeddings (rowid, embedding, source_type, model_name, file_id)
+                    SELECT v.rowid, {vector_expr}, m.source_type, m.model_name, COALESCE(m.file_id, 0)
+                    FROM nova_embeddings_migration v
+                    JOIN nova_embedding_metadata m ON m.rowid = v.rowid
+                    ORDER BY v.rowid
+                ''')
+            else:
+                cursor.execute(f'''
+                    INSERT INTO nova_embeddings (rowid, embedding)
+                    SELECT v.rowid, {vector_expr}
+                    FROM nova_embeddings_migration v
+                    JOIN nova_embedding_metadata m ON m.rowid = v.rowid
+                    ORDER BY v.rowid
+                ''')
+            migrated = cursor.rowcount
+
+            cursor.execute('DELETE FROM nova_embedding_vectors')
+            if storage != 'float':
+                cursor.execute('''
+                    INSERT INTO nova_embedding_vectors (rowid, embedding)
+                    SELECT v.rowid, v.embedding
+                    FROM nova_embeddings_migration v
+                    JOIN nova_embedding_metadata m ON m.rowid = v.rowid
+                ''')
+            cursor.execute('DROP TABLE nova_embeddings_migration')
+
+            self._vec_layout = target
+            return {'status': 'migrated', **target, 'migrated': migrated, 'dropped': max(0, total - migrated)}
+
     def get_content_for_embedding_results(
         self,
         results: List[Dict[str, Any]]
@@ -246,9 +627,10 @@ class EmbeddingsMixin:
             if not rowids:
                 return 0
 
-            # Delete from both tables
+            # Delete vectors, full-precision copies and metadata
             placeholders = ','.join('?' * len(rowids))
             cursor.execute(f'DELETE FROM nova_embeddings WHERE rowid IN ({placeholders})', rowids)
+            cursor.execute(f'DELETE FROM nova_embedding_vectors WHERE rowid IN ({placeholders})', rowids)
             cursor.execute(f'DELETE FROM nova_embedding_metadata WHERE rowid IN ({placeholders})', rowids)
 
             return len(rowids)
@@ -275,8 +657,11 @@ class EmbeddingsMixin:
             cursor.execute('SELECT COUNT(*) as total FROM nova_embedding_metadata')
             total = cursor.fetchone()['total']
 
+            storage = self._vec_table_layout(conn)['storage'] if self._load_vector_extension(conn) else None
+
             return {
                 'total_embeddings': total,
                 'by_source_and_model': by_source,
-                'dimension': self._get_embedding_dimension()
+                'dimension': self._get_embedding_dimension(),
+                'storage': storage
             }
@@ -3,7 +3,7 @@ import json
 import hashlib
 import os
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 
 class FilesMixin:
@@ -46,6 +46,29 @@ class FilesMixin:
                 file['metadata'] = self._parse_json_field(file['metadata'], default={})
             return file
 
+    def get_cached_probe_metadata(self, s3_key: str, etag: str) -> Optional[Dict[str, Any]]:
+        """Get cached S3 probe metadata if it was stored for this exact object version (ETag)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT probe_metadata FROM files WHERE s3_key = ? AND probe_etag = ?',
+                (s3_key, etag)
+            )
+            row = cursor.fetchone()
+            if not row or not row['probe_metadata']:
+                return None
+            return self._parse_json_field(row['probe_metadata'], default=None)
+
+    def set_cached_probe_metadata(self, s3_key: str, etag: str, metadata: Dict[str, Any]) -> bool:
+        """Cache S3 probe metadata on the file row for s3_key. Returns False if no row matches."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'UPDATE files SET probe_etag = ?, probe_metadata = ? WHERE s3_key = ?',
+                (etag, json.dumps(metadata), s3_key)
+            )
+            return cursor.rowcount > 0
+
     def get_file_with_transcript_summary(self, file_id: int) -> Optional[Dict[str, Any]]:
         """
         Get file record with associated transcript summary via LEFT JOIN.
@@ -128,39 +151,69 @@ class FilesMixin:
         """Create a source file record with media metadata."""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-
-            # Compute created_date from metadata timestamps
             meta = metadata or {}
-            file_mtime = meta.get('file_mtime')
-            file_ctime = meta.get('file_ctime')
-
-            created_date = None
-            if file_mtime is None and file_ctime is None:
-                created_date = datetime.now().isoformat()
-            elif file_mtime is None:
-                created_date = datetime.fromtimestamp(file_ctime).isoformat()
-            elif file_ctime is None:
-                created_date = datetime.fromtimestamp(file_mtime).isoformat()
-            elif file_mtime <= file_ctime:
-                created_date = datetime.fromtimestamp(file_mtime).isoformat()
-            else:
-                created_date = datetime.fromtimestamp(file_ctime).isoformat()
-
-            cursor.execute('''
-                INSERT INTO files (
-                    filename, s3_key, file_type, size_bytes, content_type,
-                    is_proxy, source_file_id, local_path,
-                    resolution_width, resolution_height, frame_rate,
-                    codec_video, codec_audio, duration_seconds, bitrate,
-                    metadata, created_date
-                )
-                VALUES (?, ?, ?, ?, ?, 0, NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (filename, s3_key, file_type, size_bytes, content_type,
-                  local_path, resolution_width, resolution_height, frame_rate,
-                  codec_video, codec_audio, duration_seconds, bitrate,
-                  json.dumps(meta), created_date))
+            cursor.execute(self._SOURCE_FILE_INSERT_SQL, (
+                filename, s3_key, file_type, size_bytes, content_type,
+                local_path, resolution_width, resolution_height, frame_rate,
+                codec_video, codec_audio, duration_seconds, bitrate,
+                json.dumps(meta), self._source_created_date(meta)))
             return cursor.lastrowid
 
+    def create_source_files_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Insert many source file records in one transaction.
+
+        Args:
+            records: Dicts with the keyword arguments of create_source_file()
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = []
+        for record in records:
+            meta = record.get('metadata') or {}
+            rows.append((
+                record['filename'], record.get('s3_key'), record['file_type'],
+                record['size_bytes'], record['content_type'], record.get('local_path'),
+                record.get('resolution_width'), record.get('resolution_height'),
+                record.get('frame_rate'), record.get('codec_video'), record.get('codec_audio'),
+                record.get('duration_seconds'), record.get('bitrate'),
+                json.dumps(meta), self._source_created_date(meta)))
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self._SOURCE_FILE_INSERT_SQL, rows)
+            return len(rows)
+
+    _SOURCE_FILE_INSERT_SQL = '''
+        INSERT INTO files (
+            filename, s3_key, file_type, size_bytes, content_type,
+            is_proxy, source_file_id, local_path,
+            resolution_width, resolution_height, frame_rate,
+            codec_video, codec_audio, duration_seconds, bitrate,
+            metadata, created_date
+        )
+        VALUES (?, ?, ?, ?, ?, 0, NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    @staticmethod
+    def _source_created_date(meta: Dict) -> str:
+        """created_date from metadata timestamps: the earlier of file_mtime/file_ctime, else now."""
+        file_mtime = meta.get('file_mtime')
+        file_ctime = meta.get('file_ctime')
+
+        if file_mtime is None and file_ctime is None:
+            return datetime.now().isoformat()
+        elif file_mtime is None:
+            return datetime.fromtimestamp(file_ctime).isoformat()
+        elif file_ctime is None:
+            return datetime.fromtimestamp(file_mtime).isoformat()
+        elif file_mtime <= file_ctime:
+            return datetime.fromtimestamp(file_mtime).isoformat()
+        else:
+            return datetime.fromtimestamp(file_ctime).isoformat()
+
     def create_proxy_file(self, source_file_id: int, filename: str, s3_key: str,
                          size_bytes: int, content_type: str,
                          local_path: Optional[str] = None,
@@ -259,6 +312,23 @@ class FilesMixin:
                     file['metadata'] = self._parse_json_field(file['metadata'], default={})
             return files
 
+    def get_local_paths_under(self, directory_path: str) -> set:
+        """
+        Return the set of local_path values below a directory.
+
+        Lets a bulk import check for existing files in memory instead of
+        querying once per file. Uses a range scan on idx_files_local_path.
+        """
+        prefix = directory_path.rstrip('/\\') + os.sep
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Every string starting with prefix sorts in [prefix, prefix + U+10FFFF)
+            cursor.execute(
+                'SELECT local_path FROM files WHERE local_path >= ? AND local_path < ?',
+                (prefix, prefix + '\U0010ffff')
+            )
+            return {row['local_path'] for row in cursor.fetchall()}
+
     def get_file_by_local_path(self, local_path: str) -> Optional[Dict[str, Any]]:
         """Get file by local_path."""
         with self.get_connection() as conn:
@@ -475,6 +545,57 @@ class FilesMixin:
             ''', (new_local_path, json.dumps(metadata), file_id))
             return cursor.rowcount > 0
 
+    def bulk_update_file_local_paths(self, updates: List[Tuple[int, str, str]]) -> List[int]:
+        """
+        Batch form of update_file_local_path_and_metadata(), in one transaction.
+
+        Args:
+            updates: (file_id, new_local_path, new_source_directory) tuples
+
+        Returns:
+            IDs that were updated (IDs no longer in the table are left out)
+        """
+        if not updates:
+            return []
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            ids = [file_id for file_id, _, _ in updates]
+            current = {}
+            for start in range(0, len(ids), self._MAX_IN_PARAMS):
+                chunk = ids[start:start + self._MAX_IN_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'SELECT id, metadata FROM files WHERE id IN ({placeholders})', chunk)
+                for row in cursor.fetchall():
+                    current[row['id']] = self._parse_json_field(row['metadata'], default={})
+
+            rows = []
+            for file_id, new_local_path, new_source_directory in updates:
+                metadata = current.get(file_id)
+                if metadata is None:
+                    continue
+                metadata['source_directory'] = new_source_directory
+                rows.append((new_local_path, json.dumps(metadata), file_id))
+
+            cursor.executemany('UPDATE files SET local_path = ?, metadata = ? WHERE id = ?', rows)
+            return [file_id for _, _, file_id in rows]
+
+    def set_content_fingerprints(self, fingerprints: List[Tuple[int, str, float]]) -> None:
+        """
+        Cache content fingerprints in one transaction.
+
+        Args:
+            fingerprints: (file_id, content_fingerprint, file mtime it was taken at) tuples
+        """
+        if not fingerprints:
+            return
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                UPDATE files SET content_fingerprint = ?, content_fingerprint_mtime = ?
+                WHERE id = ?
+            ''', [(fingerprint, mtime, file_id) for file_id, fingerprint, mtime in fingerprints])
+
     def get_all_local_files(self) -> List[Dict[str, Any]]:
         """Get all files with local_path set (imported files only)."""
         with self.get_connection() as conn:
@@ -487,15 +608,23 @@ class FilesMixin:
             return files
 
     def bulk_delete_files_by_ids(self, file_ids: List[int]) -> int:
-        """Delete multiple files by ID (cascades to related tables)."""
+        """Delete multiple files by ID (cascades to related tables) in one transaction."""
         if not file_ids:
             return 0
 
+        deleted = 0
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            placeholders = ','.join('?' * len(file_ids))
-            cursor.execute(f'DELETE FROM files WHERE id IN ({placeholders})', file_ids)
-            return cursor.rowcount
+            # Chunk the IN list to stay under SQLite's bound-parameter limit
+            for start in range(0, len(file_ids), self._MAX_IN_PARAMS):
+                chunk = file_ids[start:start + self._MAX_IN_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'DELETE FROM files WHERE id IN ({placeholders})', chunk)
+                deleted += cursor.rowcount
+            return deleted
+
+    # 999 was SQLite's default limit before 3.32
+    _MAX_IN_PARAMS = 900
 
     def list_source_files_with_stats(
         self,
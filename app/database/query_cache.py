@@ -0,0 +1,91 @@
+"""Query embedding cache operations mixin for database."""
+import time
+from typing import Optional, Dict, Any
+
+
+class QueryEmbeddingCacheMixin:
+    """Mixin providing persistent storage for search query embeddings."""
+
+    def get_cached_query_embedding(self, cache_key: str,
+                                   max_age_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached query embedding and bump its usage stats.
+
+        Args:
+            cache_key: Hash of (normalized query, model id, dimension, purpose)
+            max_age_seconds: Ignore entries older than this (TTL)
+
+        Returns:
+            Cache row dict (embedding as float32 bytes) or None
+        """
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM query_embedding_cache WHERE cache_key = ?', (cache_key,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            if max_age_seconds is not None and now - row['created_at'] > max_age_seconds:
+                cursor.execute('DELETE FROM query_embedding_cache WHERE cache_key = ?', (cache_key,))
+                return None
+            cursor.execute('''
+                UPDATE query_embedding_cache
+                SET last_used_at = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+            ''', (now, cache_key))
+            return dict(row)
+
+    def store_query_embedding(self, cache_key: str, normalized_query: str, model_id: str,
+                              dimension: int, purpose: str, embedding: bytes,
+                              embed_latency_ms: float):
+        """Insert or replace a cached query embedding."""
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO query_embedding_cache
+                (cache_key, normalized_query, model_id, dimension, purpose, embedding,
+                 embed_latency_ms, created_at, last_used_at, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+            ''', (cache_key, normalized_query, model_id, dimension, purpose, embedding,
+                  embed_latency_ms, now, now))
+
+    def prune_query_embedding_cache(self, max_entries: int,
+                                    max_age_seconds: Optional[float] = None) -> int:
+        """
+        Evict expired entries, then least-recently-used entries beyond max_entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if max_age_seconds is not None:
+                cursor.execute(
+                    'DELETE FROM query_embedding_cache WHERE created_at < ?',
+                    (time.time() - max_age_seconds,)
+                )
+                deleted += cursor.rowcount
+            cursor.execute('''
+                DELETE FROM query_embedding_cache
+                WHERE cache_key IN (
+                    SELECT cache_key FROM query_embedding_cache
+                    ORDER BY last_used_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            ''', (max(0, int(max_entries)),))
+            deleted += cursor.rowcount
+        return deleted
+
+    def get_query_embedding_cache_stats(self) -> Dict[str, Any]:
+        """Get persistent query cache size and lifetime hit count."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT COUNT(*) as entries,
+                       COALESCE(SUM(hit_count), 0) as total_hits,
+                       COALESCE(SUM(hit_count * embed_latency_ms), 0) as saved_latency_ms
+                FROM query_embedding_cache
+            ''')
+            return dict(cursor.fetchone())
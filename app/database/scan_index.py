@@ -0,0 +1,80 @@
+"""Directory scan index operations mixin for database."""
+import json
+import time
+from typing import Dict, Any, Iterable
+
+
+class ScanIndexMixin:
+    """Mixin providing the persisted per-directory index used by incremental rescans."""
+
+    def get_directory_scan_index(self, root_path: str, extensions: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load index rows for a directory tree.
+
+        Args:
+            root_path: Absolute root directory of the scan
+            extensions: Extension signature the caller scans with; rows stored
+                under a different signature are ignored
+
+        Returns:
+            Dict of directory path -> {'mtime', 'scanned_at', 'files', 'subdirs'}
+        """
+        prefix = root_path.rstrip('/\\')
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Range comparisons on the binary-collated path: case-sensitive
+            # (unlike LIKE) and free of wildcard characters. Children sort in
+            # [prefix + '/', prefix + '0') or [prefix + '\\', prefix + ']').
+            cursor.execute('''
+                SELECT path, mtime, scanned_at, files, subdirs
+                FROM directory_scan_index
+                WHERE (path = ?
+                       OR (path >= ? AND path < ?)
+                       OR (path >= ? AND path < ?))
+                  AND extensions = ?
+            ''', (prefix, prefix + '/', prefix + '0', prefix + '\\', prefix + ']', extensions))
+            return {
+                row['path']: {
+                    'mtime': row['mtime'],
+                    'scanned_at': row['scanned_at'],
+                    'files': json.loads(row['files']),
+                    'subdirs': json.loads(row['subdirs']),
+                }
+                for row in cursor.fetchall()
+            }
+
+    def save_directory_scan_index(self, root_path: str, extensions: str,
+                                  entries: Dict[str, Dict[str, Any]],
+                                  stale_paths: Iterable[str] = ()) -> None:
+        """
+        Store rescanned directories and drop ones that no longer exist, in one transaction.
+
+        Args:
+            root_path: Absolute root directory of the scan
+            extensions: Extension signature the entries were scanned with
+            entries: Dict of directory path -> {'mtime', 'files', 'subdirs'}
+            stale_paths: Directories to remove from the index
+        """
+        now = time.time()
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                'DELETE FROM directory_scan_index WHERE path = ?',
+                [(path,) for path in stale_paths]
+            )
+            cursor.executemany('''
+                INSERT OR REPLACE INTO directory_scan_index
+                (path, root_path, mtime, scanned_at, extensions, files, subdirs)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (path, root_path, entry['mtime'], now, extensions,
+                 json.dumps(entry['files']), json.dumps(entry['subdirs']))
+                for path, entry in entries.items()
+            ])
+
+    def clear_directory_scan_index(self, root_path: str) -> int:
+        """Forget a scanned tree so its next rescan walks everything. Returns rows deleted."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM directory_scan_index WHERE root_path = ?', (root_path,))
+            return cursor.rowcount
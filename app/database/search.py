@@ -1,5 +1,6 @@
 """Search and stats operations mixin for database."""
 import json
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any, Tuple
 
@@ -672,6 +673,133 @@ class SearchMixin:
 
     # Search methods
 
+    # FTS5 column weights for bm25() ranking (higher = more important)
+    FTS_RANK_WEIGHTS = {
+        'file': '10.0, 5.0, 1.0, 2.0, 2.0',
+        'transcript': '5.0, 1.0',
+        'nova': '2.0, 1.0, 1.0, 1.0, 3.0',
+    }
+
+    # Columns reported as match_field, in priority order
+    FTS_MATCH_FIELDS = {
+        'file': [
+            ('filename', 'filename'), ('local_path', 'path'), ('metadata', 'metadata'),
+            ('codec_video', 'codec_video'), ('codec_audio', 'codec_audio')
+        ],
+        'nova': [
+            ('summary_result', 'summary'), ('chapters_result', 'chapters'),
+            ('elements_result', 'elements'),
+            ('waterfall_classification_result', 'waterfall_classification'),
+            ('search_metadata', 'search_metadata')
+        ],
+    }
+
+    def _build_fts_match(self, query: str) -> Optional[str]:
+        """
+        Convert free text into an FTS5 MATCH expression.
+
+        Terms are AND-ed. With the trigram tokenizer each word matches as a
+        substring, like the LIKE search ("fall" finds "waterfall"); words
+        shorter than three characters can't be matched by trigrams, so such
+        queries return None and use the LIKE search. With the unicode61
+        fallback tokenizer each word is a prefix term ("fall" finds "falls"
+        but not "waterfall").
+        """
+        terms = re.findall(r'\w+', query or '')
+        if not terms:
+            return None
+        if getattr(self, 'fts_tokenizer', 'trigram') == 'trigram':
+            if any(len(term) < 3 for term in terms):
+                return None
+            return ' '.join(f'"{term}"' for term in terms)
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def _fts_source_clause(
+        self,
+        source: str,
+        match_expr: str,
+        file_type: Optional[str] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        status: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build the FROM/WHERE clause and params for one search source."""
+        params: List[Any] = [match_expr]
+
+        if source == 'file':
+            clause = '''
+                FROM files_fts
+                JOIN files f ON f.id = files_fts.rowid
+                WHERE files_fts MATCH ?
+            '''
+            if file_type:
+                clause += ' AND f.file_type = ?'
+                params.append(file_type)
+            if from_date:
+                clause += ' AND f.uploaded_at >= ?'
+                params.append(from_date)
+            if to_date:
+                clause += ' AND f.uploaded_at <= ?'
+                params.append(to_date)
+
+        elif source == 'transcript':
+            clause = '''
+                FROM transcripts_fts
+                JOIN transcripts t ON t.id = transcripts_fts.rowid
+                WHERE transcripts_fts MATCH ?
+                AND t.status = 'COMPLETED'
+            '''
+            if model:
+                clause += ' AND t.model_name = ?'
+                params.append(model)
+            if status:
+                clause += ' AND t.status = ?'
+                params.append(status)
+            if from_date:
+                clause += ' AND t.created_at >= ?'
+                params.append(from_date)
+            if to_date:
+                clause += ' AND t.created_at <= ?'
+                params.append(to_date)
+
+        else:  # nova
+            clause = '''
+                FROM nova_jobs_fts
+                JOIN nova_jobs nj ON nj.id = nova_jobs_fts.rowid
+                JOIN analysis_jobs aj ON nj.analysis_job_id = aj.id
+                JOIN files f ON aj.file_id = f.id
+                WHERE nova_jobs_fts MATCH ?
+                AND nj.status = 'COMPLETED'
+            '''
+            if file_type:
+                clause += ' AND f.file_type = ?'
+                params.append(file_type)
+            if model:
+                clause += ' AND nj.model = ?'
+                params.append(model)
+            if from_date:
+                clause += ' AND nj.completed_at >= ?'
+                params.append(from_date)
+            if to_date:
+                clause += ' AND nj.completed_at <= ?'
+                params.append(to_date)
+
+        return clause, params
+
+    def _fts_match_field_sql(self, source: str, fts_table: str, id_column: str,
+                             match_expr: str) -> Tuple[str, List[Any]]:
+        """Build a CASE expression naming the first indexed column that matched."""
+        cases = []
+        params: List[Any] = []
+        for column, label in self.FTS_MATCH_FIELDS[source]:
+            cases.append(
+                f"WHEN {id_column} IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?) "
+                f"THEN '{label}'"
+            )
+            params.append(f'{column} : ({match_expr})')
+        return 'CASE ' + ' '.join(cases) + ' END', params
+
     def search_all(
         self,
         query: str,
@@ -688,7 +816,183 @@ class SearchMixin:
         offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
-        Unified search across all data sources.
+        Unified search across all data sources using the FTS5 indexes.
+
+        Returns list of search result dictionaries with:
+        - source_type: 'file', 'transcript', 'nova', 'collection'
+        - source_id: Primary key from source table
+        - title: Display title
+        - category: Result category
+        - timestamp: Relevant date/time
+        - match_field: Which field matched
+        - size_bytes: File size (if applicable)
+        - duration_seconds: Duration (if applicable)
+        - relevance: bm25 score (higher is more relevant)
+
+        sort_by='relevance' orders by bm25 score, ties broken by date.
+        """
+        match_expr = self._build_fts_match(query)
+        if not getattr(self, '_fts_available', False) or match_expr is None:
+            return self._search_all_like(
+                query, sources=sources, file_type=file_type, from_date=from_date,
+                to_date=to_date, status=status, analysis_type=analysis_type, model=model,
+                sort_by=sort_by, sort_order=sort_order, limit=limit, offset=offset
+            )
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            all_sources = ['file', 'transcript', 'nova', 'collection']
+            active_sources = sources if sources else all_sources
+            filters = dict(file_type=file_type, from_date=from_date, to_date=to_date,
+                           status=status, model=model)
+
+            union_queries = []
+            params: List[Any] = []
+
+            # 1. Search in files
+            if 'file' in active_sources:
+                match_field, match_params = self._fts_match_field_sql('file', 'files_fts', 'f.id', match_expr)
+                clause, clause_params = self._fts_source_clause('file', match_expr, **filters)
+                union_queries.append(f'''
+                SELECT
+                    'file' as source_type,
+                    f.id as source_id,
+                    f.filename as title,
+                    f.file_type as category,
+                    f.uploaded_at as timestamp,
+                    {match_field} as match_field,
+                    f.size_bytes,
+                    f.duration_seconds,
+                    -bm25(files_fts, {self.FTS_RANK_WEIGHTS['file']}) as relevance
+                {clause}
+                ''')
+                params.extend(match_params + clause_params)
+
+            # 2. Search in transcripts
+            if 'transcript' in active_sources:
+                clause, clause_params = self._fts_source_clause('transcript', match_expr, **filters)
+                union_queries.append(f'''
+                SELECT
+                    'transcript' as source_type,
+                    t.id as source_id,
+                    t.file_name as title,
+                    'Transcript (' || t.model_name || ')' as category,
+                    t.created_at as timestamp,
+                    'transcript' as match_field,
+                    NULL as size_bytes,
+                    t.duration_seconds,
+                    -bm25(transcripts_fts, {self.FTS_RANK_WEIGHTS['transcript']}) as relevance
+                {clause}
+                ''')
+                params.extend(clause_params)
+
+            # 3. Search in Nova analysis
+            if 'nova' in active_sources:
+                match_field, match_params = self._fts_match_field_sql('nova', 'nova_jobs_fts', 'nj.id', match_expr)
+                clause, clause_params = self._fts_source_clause('nova', match_expr, **filters)
+                union_queries.append(f'''
+                SELECT
+                    'nova' as source_type,
+                    nj.id as source_id,
+                    f.filename || ' - Nova ' || nj.model as title,
+                    'Nova Analysis' as category,
+                    nj.completed_at as timestamp,
+                    {match_field} as match_field,
+                    f.size_bytes,
+                    f.duration_seconds,
+                    -bm25(nova_jobs_fts, {self.FTS_RANK_WEIGHTS['nova']}) as relevance
+                {clause}
+                ''')
+                params.extend(match_params + clause_params)
+
+            if not union_queries:
+                return []
+
+            final_query = ' UNION ALL '.join(union_queries)
+
+            direction = 'ASC' if sort_order.lower() == 'asc' else 'DESC'
+            if sort_by == 'date':
+                final_query += f' ORDER BY timestamp {direction}'
+            elif sort_by == 'name':
+                final_query += f' ORDER BY title {direction}'
+            else:  # relevance
+                final_query += f' ORDER BY relevance {direction}, timestamp DESC'
+
+            final_query += ' LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
+
+            cursor.execute(final_query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+    def count_search_results(
+        self,
+        query: str,
+        sources: Optional[List[str]] = None,
+        file_type: Optional[str] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        status: Optional[str] = None,
+        analysis_type: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Count search results by source type using the FTS5 indexes.
+
+        Returns: {
+            'total': 145,
+            'file': 23,
+            'transcript': 67,
+            'nova': 19,
+            'collection': 2
+        }
+        """
+        match_expr = self._build_fts_match(query)
+        if not getattr(self, '_fts_available', False) or match_expr is None:
+            return self._count_search_results_like(
+                query, sources=sources, file_type=file_type, from_date=from_date,
+                to_date=to_date, status=status, analysis_type=analysis_type, model=model
+            )
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            all_sources = ['file', 'transcript', 'nova', 'collection']
+            active_sources = sources if sources else all_sources
+
+            counts = {}
+            total = 0
+            for source in ('file', 'transcript', 'nova'):
+                if source not in active_sources:
+                    continue
+                clause, params = self._fts_source_clause(
+                    source, match_expr, file_type=file_type, from_date=from_date,
+                    to_date=to_date, status=status, model=model
+                )
+                cursor.execute(f'SELECT COUNT(*) as count {clause}', params)
+                counts[source] = cursor.fetchone()['count']
+                total += counts[source]
+
+            counts['total'] = total
+            return counts
+
+    def _search_all_like(
+        self,
+        query: str,
+        sources: Optional[List[str]] = None,
+        file_type: Optional[str] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        status: Optional[str] = None,
+        analysis_type: Optional[str] = None,
+        model: Optional[str] = None,
+        sort_by: str = 'relevance',
+        sort_order: str = 'desc',
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Unified search using LIKE scans (fallback when FTS5 is unavailable).
 
         Returns list of search result dictionaries with:
         - source_type: 'file', 'transcript', 'nova', 'collection'
@@ -875,7 +1179,7 @@ class SearchMixin:
 
             return results
 
-    def count_search_results(
+    def _count_search_results_like(
         self,
         query: str,
         sources: Optional[List[str]] = None,
@@ -887,7 +1191,7 @@ class SearchMixin:
         model: Optional[str] = None
     ) -> Dict[str, int]:
         """
-        Count search results by source type.
+        Count search results by source type using LIKE scans (FTS5 fallback).
 
         Returns: {
             'total': 145,
@@ -54,12 +54,14 @@ def batch_create_proxy():
     Create proxies for specified files (from currently filtered view).
 
     Supports both video and image files in the same batch:
-    - Videos: 720p/15fps proxies using FFmpeg NVENC
+    - Videos: 720p/15fps proxies using FFmpeg (NVENC, VAAPI, QSV or libx264)
     - Images: 896px optimized proxies for Nova 2 Lite using Pillow
 
     Request body:
         {
-            "file_ids": [1, 2, 3, ...]  # List of file IDs to process (videos and/or images)
+            "file_ids": [1, 2, 3, ...],  # List of file IDs to process (videos and/or images)
+            "video_concurrency": 4,      # Optional: parallel ffmpeg jobs (BATCH_PROXY_VIDEO_CONCURRENCY)
+            "image_concurrency": 8       # Optional: parallel image proxies (BATCH_PROXY_IMAGE_CONCURRENCY)
         }
 
     Returns:
@@ -125,7 +127,12 @@ def batch_create_proxy():
         # Create batch job
         job_id = f"batch-proxy-{uuid.uuid4().hex[:8]}"
         job = BatchJob(job_id, 'proxy', len(eligible_file_ids), eligible_file_ids)
-        job.options = {'file_types': file_types, 'force': force}  # Store file type mapping and options for routing
+        job.options = {  # Store file type mapping and options for routing
+            'file_types': file_types,
+            'force': force,
+            'video_concurrency': data.get('video_concurrency'),
+            'image_concurrency': data.get('image_concurrency'),
+        }
 
         set_batch_job(job_id, job)
 
@@ -627,8 +634,7 @@ def cancel_batch_job(job_id: str):
         if job.status in ('COMPLETED', 'CANCELLED', 'FAILED'):
             return jsonify({'error': f'Job already {job.status.lower()}'}), 400
 
-        job.status = 'CANCELLED'
-        job.end_time = time.time()
+        job.cancel()
 
         return jsonify({'message': 'Batch job cancelled'}), 200
 
@@ -641,12 +647,30 @@ def cancel_batch_job(job_id: str):
 # BATCH PROCESSING WORKERS
 # ============================================================================
 
+def _get_proxy_concurrency(requested, env_name: str, default: int) -> int:
+    """Resolve a batch proxy pool size from the request, environment or default."""
+    for value in (requested, os.getenv(env_name)):
+        if value in (None, ''):
+            continue
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            continue
+    return max(1, default)
+
+
 def _run_batch_proxy(app, job: BatchJob):
-    """Background worker for batch proxy creation (supports both videos and images)."""
+    """
+    Background worker for batch proxy creation (supports both videos and images).
+
+    Videos (ffmpeg) and images (Pillow) run on separate thread pools, sized by
+    BATCH_PROXY_VIDEO_CONCURRENCY and BATCH_PROXY_IMAGE_CONCURRENCY (or the
+    request's video_concurrency/image_concurrency). Cancelling the job kills
+    in-flight ffmpeg processes and skips files that have not started.
+    """
     with app.app_context():
-        from app.routes.upload import create_proxy_internal, create_image_proxy_internal
+        from concurrent.futures import ThreadPoolExecutor, wait
         from pathlib import Path
-        import traceback
         import logging
 
         logger = logging.getLogger('app')
@@ -654,8 +678,23 @@ def _run_batch_proxy(app, job: BatchJob):
         file_types = options.get('file_types', {})
         force = bool(options.get('force', False))
 
-        logger.info(f"Batch proxy worker started for job {job.job_id} with {len(job.file_ids)} files")
-        print(f"[BATCH PROXY] Worker started for job {job.job_id} with {len(job.file_ids)} files", flush=True)
+        from app.utils.video_encoders import default_video_concurrency
+
+        video_workers = _get_proxy_concurrency(
+            options.get('video_concurrency'), 'BATCH_PROXY_VIDEO_CONCURRENCY', default_video_concurrency()
+        )
+        image_workers = _get_proxy_concurrency(
+            options.get('image_concurrency'), 'BATCH_PROXY_IMAGE_CONCURRENCY', min(8, os.cpu_count() or 1)
+        )
+
+        logger.info(
+            f"Batch proxy worker started for job {job.job_id} with {len(job.file_ids)} files "
+            f"({video_workers} video / {image_workers} image workers)"
+        )
+        print(
+            f"[BATCH PROXY] Worker started for job {job.job_id} with {len(job.file_ids)} files "
+            f"({video_workers} video / {image_workers} image workers)", flush=True
+        )
 
         # Calculate total batch size before processing
         db = get_db()
@@ -666,42 +705,107 @@ def _run_batch_proxy(app, job: BatchJob):
                     local_path = file['local_path']
                     if Path(local_path).exists():
                         job.total_batch_size += Path(local_path).stat().st_size
+                if file and file_id not in file_types:
+                    file_types[file_id] = file.get('file_type', 'video')
             except Exception:
                 pass  # Skip files that can't be accessed
 
-        for file_id in job.file_ids:
-            if job.status == 'CANCELLED':
-                logger.info(f"Batch job {job.job_id} was cancelled")
-                print(f"[BATCH PROXY] Job {job.job_id} was cancelled", flush=True)
-                break
+        video_pool = ThreadPoolExecutor(max_workers=video_workers, thread_name_prefix='batch-proxy-video')
+        image_pool = ThreadPoolExecutor(max_workers=image_workers, thread_name_prefix='batch-proxy-image')
+        try:
+            futures = []
+            for file_id in job.file_ids:
+                file_type = file_types.get(file_id, 'video')
+                pool = image_pool if file_type == 'image' else video_pool
+                futures.append(pool.submit(
+                    _process_proxy_file, app, job, file_id, file_type, force, video_workers
+                ))
+            wait(futures)
+        finally:
+            video_pool.shutdown(wait=True, cancel_futures=True)
+            image_pool.shutdown(wait=True, cancel_futures=True)
+
+        if job.is_cancelled:
+            logger.info(f"Batch job {job.job_id} was cancelled")
+            print(f"[BATCH PROXY] Job {job.job_id} was cancelled", flush=True)
 
-            try:
-                # Get file info
-                db = get_db()
-                file = db.get_file(file_id)
-                if not file:
-                    raise Exception(f'File {file_id} not found')
+        # Mark job as complete
+        with job.lock:
+            job.status = 'COMPLETED' if not job.is_cancelled else 'CANCELLED'
+            job.end_time = time.time()
+            job.current_file = None
+        logger.info(
+            f"Batch proxy job {job.job_id} completed: "
+            f"{job.completed_videos} videos, {job.completed_images} images succeeded, "
+            f"{job.failed_videos} videos, {job.failed_images} images failed, status: {job.status}"
+        )
+        print(
+            f"[BATCH PROXY] Job {job.job_id} completed: "
+            f"{job.completed_videos} videos, {job.completed_images} images succeeded, "
+            f"{job.failed_videos} videos, {job.failed_images} images failed, status: {job.status}", flush=True
+        )
 
-                job.current_file = file['filename']
-                file_type = file_types.get(file_id, file.get('file_type', 'video'))
 
-                logger.info(f"Processing {file_type} file {file_id}: {file['filename']}")
-                print(f"[BATCH PROXY] Processing {file_type} file {file_id}: {file['filename']}", flush=True)
+def _process_proxy_file(app, job: BatchJob, file_id: int, file_type: str, force: bool,
+                        video_workers: int = None):
+    """
+    Create the proxy for one file of a batch (runs on a batch proxy pool thread).
 
-                # Get source file size for tracking
-                source_file_size = 0
-                if file.get('local_path') and Path(file['local_path']).exists():
-                    source_file_size = Path(file['local_path']).stat().st_size
+    video_workers is the batch's video encode concurrency; libx264 threads
+    are split across that many encodes.
+    """
+    if job.is_cancelled:
+        return
+
+    with app.app_context():
+        from app.routes.upload import (
+            create_proxy_internal, create_image_proxy_internal, ProxyCancelledError
+        )
+        from pathlib import Path
+        import traceback
+        import logging
+
+        logger = logging.getLogger('app')
+        file = None
+        filename = f'File {file_id}'
+        source_file_size = None
+        started = False
+
+        try:
+            # Get file info
+            db = get_db()
+            file = db.get_file(file_id)
+            if not file:
+                raise Exception(f'File {file_id} not found')
+
+            filename = file['filename']
+            job.start_file(filename)
+            started = True
+
+            logger.info(f"Processing {file_type} file {file_id}: {filename}")
+            print(f"[BATCH PROXY] Processing {file_type} file {file_id}: {filename}", flush=True)
+
+            # Get source file size for tracking
+            source_file_size = 0
+            if file.get('local_path') and Path(file['local_path']).exists():
+                source_file_size = Path(file['local_path']).stat().st_size
 
-                # Route to appropriate proxy creation function based on file type
+            # Route to appropriate proxy creation function based on file type
+            if file_type == 'image':
+                result = create_image_proxy_internal(file_id, force=force)
+                proxy_size = result.get('proxy_size_bytes', 0)
+            else:  # video
+                result = create_proxy_internal(
+                    file_id, upload_to_s3=False, cancel_event=job.cancel_event,
+                    encode_concurrency=video_workers
+                )
+                proxy_size = result.get('size_bytes', 0)
+
+            with job.lock:
                 if file_type == 'image':
-                    result = create_image_proxy_internal(file_id, force=force)
-                    proxy_size = result.get('proxy_size_bytes', 0)
                     job.total_image_proxy_size += proxy_size
                     job.completed_images += 1
-                else:  # video
-                    result = create_proxy_internal(file_id, upload_to_s3=False)
-                    proxy_size = result.get('size_bytes', 0)
+                else:
                     job.total_video_proxy_size += proxy_size
                     job.completed_videos += 1
 
@@ -714,17 +818,23 @@ def _run_batch_proxy(app, job: BatchJob):
                 job.completed_files += 1
                 job.results.append({
                     'file_id': file_id,
-                    'filename': file['filename'],
+                    'filename': filename,
                     'file_type': file_type,
                     'success': True,
                     'result': result
                 })
-                logger.info(f"Successfully created {file_type} proxy for file {file_id}: {file['filename']}")
-                print(f"[BATCH PROXY] Successfully created {file_type} proxy for file {file_id}: {file['filename']}", flush=True)
+            logger.info(f"Successfully created {file_type} proxy for file {file_id}: {filename}")
+            print(f"[BATCH PROXY] Successfully created {file_type} proxy for file {file_id}: {filename}", flush=True)
 
-            except Exception as e:
+        except ProxyCancelledError:
+            logger.info(f"Proxy creation for file {file_id} cancelled with job {job.job_id}")
+            print(f"[BATCH PROXY] Cancelled in-flight proxy for file {file_id}: {filename}", flush=True)
+
+        except Exception as e:
+            error_msg = str(e)
+            tb = traceback.format_exc()
+            with job.lock:
                 job.failed_files += 1
-                file_type = file_types.get(file_id, file.get('file_type', 'unknown') if 'file' in locals() else 'unknown')
 
                 # Track failures by type
                 if file_type == 'image':
@@ -732,40 +842,24 @@ def _run_batch_proxy(app, job: BatchJob):
                 elif file_type == 'video':
                     job.failed_videos += 1
 
-                error_msg = str(e)
-                tb = traceback.format_exc()
                 job.errors.append({
                     'file_id': file_id,
-                    'filename': file.get('filename', f'File {file_id}') if 'file' in locals() and file else f'File {file_id}',
+                    'filename': filename,
                     'file_type': file_type,
                     'error': error_msg
                 })
 
                 # Track failed file size too if available
-                try:
-                    if 'source_file_size' in locals():
-                        job.processed_files_sizes.append(source_file_size)
-                except Exception:
-                    pass
+                if source_file_size is not None:
+                    job.processed_files_sizes.append(source_file_size)
 
-                logger.error(f"Batch proxy error for {file_type} file {file_id}: {e}", exc_info=True)
-                print(f"[BATCH PROXY ERROR] {file_type} file {file_id}: {e}", flush=True)
-                print(f"[BATCH PROXY ERROR] Full traceback:\n{tb}", flush=True)
+            logger.error(f"Batch proxy error for {file_type} file {file_id}: {e}", exc_info=True)
+            print(f"[BATCH PROXY ERROR] {file_type} file {file_id}: {e}", flush=True)
+            print(f"[BATCH PROXY ERROR] Full traceback:\n{tb}", flush=True)
 
-        # Mark job as complete
-        job.status = 'COMPLETED' if job.status != 'CANCELLED' else 'CANCELLED'
-        job.end_time = time.time()
-        job.current_file = None
-        logger.info(
-            f"Batch proxy job {job.job_id} completed: "
-            f"{job.completed_videos} videos, {job.completed_images} images succeeded, "
-            f"{job.failed_videos} videos, {job.failed_images} images failed, status: {job.status}"
-        )
-        print(
-            f"[BATCH PROXY] Job {job.job_id} completed: "
-            f"{job.completed_videos} videos, {job.completed_images} images succeeded, "
-            f"{job.failed_videos} videos, {job.failed_images} images failed, status: {job.status}", flush=True
-        )
+        finally:
+            if started:
+                job.finish_file(filename)
 
 
 def _run_batch_transcribe(app, job: BatchJob):
@@ -158,7 +158,8 @@ def apply_rescan_changes():
             "moved": [1, 3, 5],       // File IDs to update
             "deleted": [2],            // File IDs to delete
             "new": ["/path/to/new.mp4"] // Paths to import
-        }
+        },
+        "dry_run": false  // Preview only: counts plus a "diff" of moved/deleted/new
     }
 
     Response:
@@ -196,7 +197,8 @@ def apply_rescan_changes():
             'import_new': actions.get('import_new', False),
             'handle_ambiguous': actions.get('handle_ambiguous', 'skip'),
             'selected_files': selected_files,
-            'directory_path': directory_path  # Pass for import metadata
+            'directory_path': directory_path,  # Pass for import metadata
+            'dry_run': bool(data.get('dry_run', False))
         }
 
         results = rescan_service.apply_changes(reconcile_results, options)
@@ -223,7 +225,7 @@ def apply_rescan_changes_async():
             "update_moved": true,
             "delete_missing": true,
             "import_new": true,
-            "handle_ambiguous": "skip"
+            "handle_ambiguous": "skip"  // Ignored: async jobs always skip ambiguous matches
         },
         "selected_files": {
             "moved": [1, 3, 5],
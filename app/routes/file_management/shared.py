@@ -46,9 +46,41 @@ class BatchJob:
         self.failed_images = 0
         self.total_video_proxy_size = 0
         self.total_image_proxy_size = 0
+        # Parallel workers (batch proxy) update counters under this lock
+        self.lock = threading.RLock()
+        self.cancel_event = threading.Event()
+        self.active_files: List[str] = []
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set() or self.status == 'CANCELLED'
+
+    def cancel(self) -> None:
+        """Mark the job cancelled and signal workers to stop in-flight work."""
+        with self.lock:
+            self.status = 'CANCELLED'
+            self.end_time = time.time()
+        self.cancel_event.set()
+
+    def start_file(self, filename: str) -> None:
+        """Record a file as in progress (several may run at once)."""
+        with self.lock:
+            self.active_files.append(filename)
+            self.current_file = ', '.join(self.active_files)
+
+    def finish_file(self, filename: str) -> None:
+        """Remove a file from the in-progress list."""
+        with self.lock:
+            if filename in self.active_files:
+                self.active_files.remove(filename)
+            self.current_file = ', '.join(self.active_files) or None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response."""
+        with self.lock:
+            return self._to_dict()
+
+    def _to_dict(self) -> Dict[str, Any]:
         elapsed = (self.end_time or time.time()) - self.start_time
         processed_count = self.completed_files + self.failed_files
         progress = processed_count / self.total_files * 100 if self.total_files > 0 else 0
@@ -100,8 +132,9 @@ class BatchJob:
             'avg_tokens_per_file': round(avg_tokens_per_file, 1) if avg_tokens_per_file is not None else None,
             'total_cost_usd': round(self.total_cost_usd, 2) if self.total_cost_usd is not None else None,
             'avg_cost_per_file': round(avg_cost_per_file, 4) if avg_cost_per_file is not None else None,
-            'errors': self.errors,
-            'results': self.results,
+            'errors': list(self.errors),
+            'results': list(self.results),
+            'active_files': list(self.active_files),
             'completed_videos': self.completed_videos,
             'completed_images': self.completed_images,
             'failed_videos': self.failed_videos,
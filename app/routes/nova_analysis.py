@@ -531,7 +531,9 @@ def start_nova_analysis():
             "analysis_types": ["summary", "chapters", "elements", "waterfall_classification"],
             "options": {
                 "summary_depth": "standard",  # 'brief', 'standard', 'detailed'
-                "language": "auto"  # 'auto' or ISO code like 'en', 'es'
+                "language": "auto",  # 'auto' or ISO code like 'en', 'es'
+                "chunk_concurrency": 4,  # Long videos: chunks analyzed at once
+                "sequential_chunks": false  # Long videos: one chunk at a time with previous-chunk context
             }
         }
 
@@ -1251,11 +1253,11 @@ def process_completed_batches():
                 'error': 'Batch poller not initialized'
             }), 400
 
-        # Trigger an immediate poll cycle
+        # Trigger an immediate poll cycle, ignoring the per-job schedule
         logger.info("Manual trigger: processing completed batches")
 
         with current_app.app_context():
-            batch_poller._poll_cycle()
+            batch_poller._poll_cycle(force=True)
 
         return jsonify({
             'success': True,
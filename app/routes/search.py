@@ -11,6 +11,7 @@ import logging
 
 # Import for semantic search
 from app.services.embedding_manager import EmbeddingManager
+from app.services.semantic_result_cache import get_semantic_result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -298,6 +299,7 @@ def search():
         sort_order: Sort order (asc/desc, default: desc)
         page: Page number (default: 1)
         per_page: Results per page (default: 50, max: 200)
+        cursor: Opaque next-page cursor (semantic search only; must be reused with the same q and sources)
 
     Returns:
         JSON response with search results and pagination
@@ -365,7 +367,8 @@ def search():
             sources=sources,
             page=page,
             per_page=per_page,
-            start_time=start_time
+            start_time=start_time,
+            cursor=request.args.get('cursor')
         )
 
     # Execute search (keyword search)
@@ -416,7 +419,8 @@ def search():
                 'source_id': row.get('source_id'),
                 'match_field': row.get('match_field'),
                 'size_bytes': row.get('size_bytes'),
-                'duration_seconds': row.get('duration_seconds')
+                'duration_seconds': row.get('duration_seconds'),
+                'relevance': row.get('relevance')
             }
 
             response_results.append({
@@ -542,60 +546,119 @@ def semantic_search(
     sources: Optional[List[str]],
     page: int,
     per_page: int,
-    start_time: float
+    start_time: float,
+    cursor: Optional[str] = None
 ) -> Any:
     """
     Perform semantic vector search using Nova embeddings.
 
+    The ranked KNN neighbour list is cached briefly (SemanticResultCache), so
+    later pages are sliced from it instead of re-running the KNN with
+    k = per_page * page. Pass the returned pagination.next_cursor to fetch
+    the next page without re-embedding the query; a cursor is only valid
+    with the same q and sources it was issued for.
+
+    The KNN is capped at the index's VEC_MAX_K neighbours, and only the
+    neighbours fetched so far are counted, so pagination.total is a lower
+    bound on the matches while has_more is true (total_exact says which).
+
     Args:
         query: Search query text
         sources: List of source types to search (file, transcript, nova, collection)
-        page: Page number
+        page: Page number (ignored when cursor is given)
         per_page: Results per page
         start_time: Request start time for performance tracking
+        cursor: Opaque cursor from a previous response
 
     Returns:
         JSON response with semantic search results
     """
     try:
         db = get_db()
-        manager = EmbeddingManager(db)
-
-        # Generate query embedding (optimized for retrieval)
-        query_embedding = manager.embeddings_service.embed_query(query)
-
-        # Map source names to source_types for embedding search
-        # Only transcript and nova_analysis have embeddings
-        source_type_map = {
-            'transcript': 'transcript',
-            'nova': 'nova_analysis'
-        }
-
-        # Filter sources to only those that support semantic search
-        if sources:
-            filtered_sources = []
-            for s in sources:
-                if s in source_type_map:
-                    filtered_sources.append(source_type_map[s])
-            source_types = filtered_sources if filtered_sources else None
-        else:
-            # Default to both transcript and nova_analysis
-            source_types = ['transcript', 'nova_analysis']
-
-        # Vector search (fetch enough for pagination)
-        results = db.search_embeddings(
-            query_vector=query_embedding,
-            limit=per_page * page,  # Fetch enough for current page
-            source_types=source_types if source_types else None,
-            min_similarity=0.0  # No minimum threshold by default
-        )
+        result_cache = get_semantic_result_cache()
+
+        offset = (page - 1) * per_page
+        result_set = None
+        embed_ms = 0
+        vector_search_ms = 0
+        embedding_cache = None
+        result_set_hit = True
+
+        cursor_scope = result_cache.cursor_scope(query, sources)
+
+        if cursor:
+            decoded = result_cache.decode_cursor(cursor)
+            if decoded is None:
+                return jsonify({
+                    'error': 'Invalid cursor',
+                    'details': "Parameter 'cursor' is malformed"
+                }), 400
+            result_key, offset, scope = decoded
+            if scope != cursor_scope:
+                return jsonify({
+                    'error': 'Invalid cursor',
+                    'details': "Parameter 'cursor' was issued for a different query or sources"
+                }), 400
+            page = offset // per_page + 1
+            result_set = result_cache.get(result_key)
+
+        end = offset + per_page
+
+        if result_set is None or not result_set.covers(end):
+            manager = EmbeddingManager(db)
+
+            # Generate query embedding (optimized for retrieval, cached across requests)
+            embed_start = time.time()
+            query_embedding, embedding_cache = manager.embed_query(query)
+            embed_ms = int((time.time() - embed_start) * 1000)
+
+            # Map source names to source_types for embedding search
+            # Only transcript and nova_analysis have embeddings
+            source_type_map = {
+                'transcript': 'transcript',
+                'nova': 'nova_analysis'
+            }
+
+            # Filter sources to only those that support semantic search
+            if sources:
+                filtered_sources = []
+                for s in sources:
+                    if s in source_type_map:
+                        filtered_sources.append(source_type_map[s])
+                source_types = filtered_sources if filtered_sources else None
+            else:
+                # Default to both transcript and nova_analysis
+                source_types = ['transcript', 'nova_analysis']
+
+            result_key = result_cache.make_key(query_embedding, source_types)
+            result_set = result_cache.get(result_key)
+
+            if result_set is None or not result_set.covers(end):
+                # Vector search once for a generous depth; later pages slice the cached list
+                # search_embeddings caps k at VEC_MAX_K; record the depth actually searched
+                depth = result_cache.depth_for(end, previous=result_set, max_depth=db.VEC_MAX_K)
+                vector_start = time.time()
+                results = db.search_embeddings(
+                    query_vector=query_embedding,
+                    limit=depth,
+                    source_types=source_types if source_types else None,
+                    min_similarity=0.0  # No minimum threshold by default
+                )
+                vector_search_ms = int((time.time() - vector_start) * 1000)
+                result_set = result_cache.put(
+                    result_key, results, depth, at_max_depth=depth >= db.VEC_MAX_K
+                )
+                result_set_hit = False
+
+        results = result_set.results
 
         # Paginate results
-        start = (page - 1) * per_page
-        paginated = results[start:start + per_page]
+        paginated = results[offset:end]
 
         # Enrich with actual content
+        enrich_start = time.time()
         enriched = db.get_content_for_embedding_results(paginated)
+        enrich_ms = int((time.time() - enrich_start) * 1000)
 
         # Format response to match existing search API
         response_results = []
@@ -620,9 +683,11 @@ def semantic_search(
                 'actions': build_action_links(source_display, r)
             })
 
-        # Calculate pagination
+        # Calculate pagination (total counts neighbours fetched so far)
         total_results = len(results)
         total_pages = (total_results + per_page - 1) // per_page
+        has_more = end < total_results or not result_set.exhausted
+        next_cursor = result_cache.encode_cursor(result_set.key, end, cursor_scope) if has_more else None
 
         # Calculate search time
         search_time_ms = int((time.time() - start_time) * 1000)
@@ -644,13 +709,23 @@ def semantic_search(
                 'page': page,
                 'per_page': per_page,
                 'total': total_results,
-                'pages': total_pages
+                'pages': total_pages,
+                'has_more': has_more,
+                'next_cursor': next_cursor,
+                'total_exact': not has_more
             },
             'filters_applied': {
                 'sources': sources,
                 'semantic': True
             },
             'search_time_ms': search_time_ms,
+            'search_time_breakdown': {
+                'embed_query_ms': embed_ms,
+                'vector_search_ms': vector_search_ms,
+                'enrich_ms': enrich_ms,
+                'query_embedding_cache': embedding_cache,
+                'result_set_cached': result_set_hit
+            },
             'semantic': True
         })
 
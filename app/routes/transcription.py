@@ -84,6 +84,21 @@ def _validate_provider(provider: str) -> Optional[str]:
     return None
 
 
+def _parse_workers(value) -> tuple:
+    """Validate a requested replica count; returns (workers, error)."""
+    if value is None or value == '':
+        return None, None
+    if isinstance(value, bool):
+        return None, 'workers must be a non-negative integer'
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        return None, 'workers must be a non-negative integer'
+    if workers < 0:
+        return None, 'workers must be a non-negative integer'
+    return workers, None
+
+
 @bp.route('/')
 def index():
     """Render transcription page."""
@@ -403,6 +418,7 @@ def start_batch():
             "language": "en",  # optional
             "force": false,  # optional
             "model_size": "large-v3",  # optional (whisper only)
+            "workers": 2,  # optional (whisper only) model replicas, 0 = one file at a time
             "provider": "whisper"  # optional (whisper or nova_sonic)
         }
 
@@ -419,6 +435,10 @@ def start_batch():
         language = data.get('language')
         force = data.get('force', False)
         model_size = data.get('model_size')  # Whisper model size
+        # Whisper model replicas (pipelined batch)
+        workers, workers_error = _parse_workers(data.get('workers'))
+        if workers_error:
+            return jsonify({'error': workers_error}), 400
         provider = _normalize_provider(data.get('provider', 'whisper'))
         provider_error = _validate_provider(provider)
         if provider_error:
@@ -437,6 +457,9 @@ def start_batch():
             service = get_transcription_service()
             if model_size:
                 service.set_model_size(model_size)
+            if workers is not None:
+                # Each replica is a full model (TRANSCRIBE_MAX_WORKERS; 1 on CUDA by default)
+                workers = min(workers, service.get_max_workers(service.device))
 
         # Get app reference for background thread
         app = current_app._get_current_object()
@@ -477,6 +500,7 @@ def start_batch():
                             db_callback=db_callback,
                             force=force,
                             model_size=model_size,
+                            workers=workers,
                             language=language
                         )
                 except Exception as e:
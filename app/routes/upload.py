@@ -9,7 +9,13 @@ from app.utils.validators import (
     get_file_type, ValidationError
 )
 from app.utils.formatters import format_file_size, format_timestamp, format_duration
-from app.utils.media_metadata import extract_media_metadata, MediaMetadataError
+from app.utils.media_metadata import (
+    extract_media_metadata, MediaMetadataError, probe_media, parse_media_metadata,
+    select_audio_stream_index, derive_proxy_metadata, has_square_pixels
+)
+from app.utils.video_encoders import (
+    EncoderProfile, get_video_encoder, get_fallback_encoder, get_encoder_threads
+)
 import uuid
 import os
 import re
@@ -25,10 +31,17 @@ bp = Blueprint('upload', __name__, url_prefix='/api/upload')
 
 DEFAULT_PROXY_SPEC = '720p15'
 
+# How often a cancellable ffmpeg run checks its cancel event
+FFMPEG_CANCEL_POLL_SECONDS = 0.5
+
+
+class ProxyCancelledError(Exception):
+    """Raised when proxy creation is cancelled while ffmpeg is running."""
+
 
 def _build_proxy_filename(source_filename: str, source_file_id: int, proxy_spec: str) -> str:
     name_parts = Path(source_filename)
-    # Always use .mp4 for proxy videos since we encode with H.264 (h264_nvenc)
+    # Always use .mp4 for proxy videos since we encode with H.264 (NVENC/VAAPI/QSV/libx264)
     # which requires MP4 container (WebM only supports VP8/VP9/AV1)
     return f"{name_parts.stem}_{source_file_id}_{proxy_spec}.mp4"
 
@@ -104,30 +117,209 @@ def _select_audio_stream(file_path: str):
     return candidates[0][1]
 
 
-def _create_proxy_video(source_path: str, proxy_path: str):
-    audio_stream_index = _select_audio_stream(source_path)
+def _run_ffmpeg(command, cancel_event=None) -> subprocess.CompletedProcess:
+    """
+    Run an ffmpeg command, killing it if cancel_event is set.
+
+    Raises:
+        ProxyCancelledError: If cancel_event was set before ffmpeg finished
+    """
+    if cancel_event is None:
+        return subprocess.run(command, capture_output=True, text=True, check=False)
+
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    while True:
+        try:
+            stdout, stderr = process.communicate(timeout=FFMPEG_CANCEL_POLL_SECONDS)
+            return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+        except subprocess.TimeoutExpired:
+            if cancel_event.is_set():
+                process.kill()
+                process.communicate()
+                raise ProxyCancelledError('Proxy creation cancelled')
+
+
+def _build_proxy_command(source_path: str, proxy_path: str, audio_stream_index,
+                         encoder: EncoderProfile, threads: int,
+                         thumbnail_path: str = None, thumbnail_at: float = None):
+    """
+    Build the proxy ffmpeg command.
+
+    With thumbnail_path the scaled stream is split so the same decode also
+    writes a 320px JPEG of the first frame at or after thumbnail_at seconds.
+    """
     command = [
         'ffmpeg',
         '-y',
+        *encoder.input_args,
+        '-threads', str(threads),
         '-i', source_path,
-        '-vf', 'scale=-2:720,fps=15',
-        '-map', '0:v:0'
     ]
+    if thumbnail_path:
+        command.extend([
+            '-filter_complex_threads', str(threads),
+            '-filter_complex',
+            f"[0:v:0]scale=-2:720,fps=15,split=2[pv][tv];"
+            f"[pv]null{encoder.filter_suffix}[proxy];"
+            f"[tv]select='gte(t,{thumbnail_at or 0:.3f})',scale=320:-1[thumb]",
+            '-map', '[proxy]'
+        ])
+    else:
+        command.extend([
+            '-filter_threads', str(threads),
+            '-vf', f'scale=-2:720,fps=15{encoder.filter_suffix}',
+            '-map', '0:v:0'
+        ])
     if audio_stream_index is not None:
         command.extend(['-map', f'0:{audio_stream_index}'])
-    command.extend([
-        '-c:v', 'h264_nvenc',
-        '-preset', 'p4',
-        '-cq', '28',
-        '-pix_fmt', 'yuv420p'
-    ])
+    command.extend(encoder.output_args)
+    command.extend(['-threads', str(threads)])
     if audio_stream_index is not None:
         command.extend(['-c:a', 'aac', '-b:a', '96k', '-ac', '2'])
     command.extend(['-movflags', '+faststart', proxy_path])
+    if thumbnail_path:
+        command.extend(['-map', '[thumb]', '-frames:v', '1', '-f', 'image2', '-update', '1', thumbnail_path])
+    return command
 
-    result = subprocess.run(command, capture_output=True, text=True, check=False)
-    if result.returncode != 0:
-        raise RuntimeError(result.stderr or 'ffmpeg failed')
+
+def _create_proxy_video(source_path: str, proxy_path: str, cancel_event=None,
+                        probe_data: dict = None, thumbnail_path: str = None,
+                        thumbnail_at: float = None, encode_concurrency: int = None) -> bool:
+    """
+    Encode a 720p/15fps H.264 proxy with the best available encoder.
+
+    A hardware encode that fails (e.g. NVENC session limit reached) is retried
+    once with libx264.
+
+    Args:
+        probe_data: probe_media() output for the source (avoids another ffprobe)
+        thumbnail_path: Also write a thumbnail JPEG from the same decode
+        thumbnail_at: Thumbnail timestamp in seconds
+        encode_concurrency: Encodes running at once (sizes libx264 threads)
+
+    Returns:
+        True if the thumbnail was written
+    """
+    if probe_data is not None:
+        audio_stream_index = select_audio_stream_index(probe_data)
+    else:
+        audio_stream_index = _select_audio_stream(source_path)
+    encoder = get_video_encoder()
+
+    # A JPEG left by an earlier run must not pass for this run's thumbnail
+    if thumbnail_path:
+        Path(thumbnail_path).unlink(missing_ok=True)
+
+    while True:
+        command = _build_proxy_command(
+            source_path, proxy_path, audio_stream_index, encoder, get_encoder_threads(encoder, encode_concurrency),
+            thumbnail_path=thumbnail_path, thumbnail_at=thumbnail_at
+        )
+        try:
+            result = _run_ffmpeg(command, cancel_event)
+        except ProxyCancelledError:
+            # Don't leave a truncated proxy or thumbnail behind
+            Path(proxy_path).unlink(missing_ok=True)
+            if thumbnail_path:
+                Path(thumbnail_path).unlink(missing_ok=True)
+            raise
+        if result.returncode == 0:
+            return bool(thumbnail_path) and os.path.isfile(thumbnail_path)
+        if not encoder.hardware:
+            raise RuntimeError(result.stderr or 'ffmpeg failed')
+        current_app.logger.warning(
+            f"{encoder.name} encode failed for {source_path}, retrying with libx264: "
+            f"{(result.stderr or '').strip()[-300:]}"
+        )
+        encoder = get_fallback_encoder()
+
+
+def _proxy_metadata_from_probe(probe_data: dict, proxy_path: str, proxy_size: int) -> dict:
+    """
+    Proxy metadata derived from the source probe.
+
+    Sources with non-square pixels keep a non-1:1 sample aspect ratio
+    through scale=-2, which derive_proxy_metadata() doesn't model, so the
+    proxy itself is probed for those.
+    """
+    if not has_square_pixels(probe_data):
+        try:
+            return extract_media_metadata(proxy_path)
+        except MediaMetadataError as e:
+            current_app.logger.warning(f"Failed to probe proxy {proxy_path}, deriving metadata: {e}")
+    return derive_proxy_metadata(
+        probe_data, proxy_size, has_audio=select_audio_stream_index(probe_data) is not None
+    )
+
+
+def _create_proxy_single_pass(source_path: str, proxy_path: str, thumbnail_path: str = None,
+                              cancel_event=None, encode_concurrency: int = None) -> dict:
+    """
+    Probe, encode and thumbnail a video with one ffprobe and one ffmpeg run.
+
+    The source probe supplies the audio stream choice, the thumbnail midpoint
+    and the proxy metadata, and the thumbnail comes from the same decode as the
+    proxy. Falls back to the separate thumbnail/metadata steps only when the
+    probe or the thumbnail output fails.
+
+    Returns:
+        dict with source_metadata, proxy_metadata, proxy_size and thumbnail_path
+        (None if no thumbnail could be made)
+    """
+    try:
+        probe_data = probe_media(source_path)
+    except MediaMetadataError as e:
+        current_app.logger.warning(f"Failed to probe {source_path}: {e}")
+        probe_data = None
+
+    source_metadata = parse_media_metadata(probe_data) if probe_data else {}
+    duration = source_metadata.get('duration_seconds')
+    thumbnail_at = duration / 2 if duration else 0.5
+
+    thumbnail_created = _create_proxy_video(
+        source_path, proxy_path, cancel_event,
+        probe_data=probe_data, thumbnail_path=thumbnail_path, thumbnail_at=thumbnail_at,
+        encode_concurrency=encode_concurrency
+    )
+    proxy_size = os.path.getsize(proxy_path)
+
+    if probe_data:
+        proxy_metadata = _proxy_metadata_from_probe(probe_data, proxy_path, proxy_size)
+    else:
+        try:
+            proxy_metadata = extract_media_metadata(proxy_path)
+        except MediaMetadataError as e:
+            current_app.logger.error(f"Failed to extract proxy metadata from {proxy_path}: {e}", exc_info=True)
+            # Provide complete fallback metadata with all expected fields
+            proxy_metadata = {
+                'resolution_width': 1280,
+                'resolution_height': 720,
+                'frame_rate': 15.0,
+                'codec_video': 'h264',
+                'codec_audio': 'aac',
+                'duration_seconds': None,  # Cannot infer duration, must be extracted
+                'bitrate': None
+            }
+
+    if thumbnail_path and not thumbnail_created:
+        # e.g. the probed duration overshot the stream; grab a frame from the proxy instead
+        current_app.logger.warning(f"Single-pass thumbnail missing for {source_path}, extracting from proxy")
+        thumbnail_created = _extract_thumbnail_from_proxy(
+            proxy_path, thumbnail_path, proxy_metadata.get('duration_seconds')
+        )
+
+    return {
+        'source_metadata': source_metadata,
+        'proxy_metadata': proxy_metadata,
+        'proxy_size': proxy_size,
+        'thumbnail_path': thumbnail_path if thumbnail_created else None
+    }
 
 
 def _extract_thumbnail_from_proxy(proxy_path: str, thumbnail_path: str, duration_seconds: float = None) -> bool:
@@ -260,11 +452,13 @@ def upload_file_direct():
                     temp_source_path.unlink()
                 return jsonify({'error': str(e)}), 400
 
-            # Extract media metadata from source video
+            # Probe the source once; the JSON also drives the proxy encode and proxy metadata
             try:
-                source_metadata = extract_media_metadata(str(temp_source_path))
+                probe_data = probe_media(str(temp_source_path))
+                source_metadata = parse_media_metadata(probe_data)
             except MediaMetadataError as e:
                 current_app.logger.warning(f"Failed to extract metadata: {e}")
+                probe_data = None
                 source_metadata = {}
 
             db = get_db()
@@ -310,7 +504,7 @@ def upload_file_direct():
             proxy_local_path = proxy_video_dir / proxy_filename
 
             try:
-                _create_proxy_video(str(source_local_path), str(proxy_local_path))
+                _create_proxy_video(str(source_local_path), str(proxy_local_path), probe_data=probe_data)
             except RuntimeError as e:
                 if source_local_path.exists():
                     source_local_path.unlink()
@@ -321,9 +515,13 @@ def upload_file_direct():
 
             proxy_size_bytes = os.path.getsize(proxy_local_path)
 
-            # Extract media metadata from proxy video
+            # Proxy metadata follows from the source probe and the encode settings
             try:
-                proxy_metadata = extract_media_metadata(str(proxy_local_path))
+                if probe_data is None:
+                    raise MediaMetadataError('source probe unavailable')
+                proxy_metadata = _proxy_metadata_from_probe(
+                    probe_data, str(proxy_local_path), proxy_size_bytes
+                )
             except MediaMetadataError as e:
                 current_app.logger.error(f"Failed to extract proxy metadata from {proxy_local_path}: {e}", exc_info=True)
                 # Provide complete fallback metadata with all expected fields
@@ -471,7 +669,8 @@ def upload_file_direct():
         return jsonify({'error': 'Failed to upload file'}), 500
 
 
-def create_proxy_internal(file_id: int, force: bool = False, upload_to_s3: bool = False):
+def create_proxy_internal(file_id: int, force: bool = False, upload_to_s3: bool = False,
+                          cancel_event=None, encode_concurrency: int = None):
     """
     Internal function to create a proxy video for a file.
 
@@ -479,11 +678,15 @@ def create_proxy_internal(file_id: int, force: bool = False, upload_to_s3: bool
         file_id: The file ID to create proxy for
         force: If True, recreate proxy even if it exists
         upload_to_s3: If True, upload proxy to S3 (default True). If False, only create local proxy.
+        cancel_event: Optional threading.Event; setting it kills the running ffmpeg
+        encode_concurrency: Proxy encodes running at once, e.g. a batch's video
+            workers (default: BATCH_PROXY_VIDEO_CONCURRENCY)
 
     Returns:
         dict with proxy info
 
     Raises:
+        ProxyCancelledError: If cancel_event was set while ffmpeg was running
         Exception: If proxy creation fails
     """
     db = get_db()
@@ -523,6 +726,11 @@ def create_proxy_internal(file_id: int, force: bool = False, upload_to_s3: bool
     source_filename = file['filename']
     proxy_filename = _build_proxy_filename(source_filename, file_id, proxy_spec)
 
+    # Thumbnail is written by the same ffmpeg run: {name}_{file_id}_thumbnail.jpg
+    thumbnail_dir = Path('proxy_video')
+    thumbnail_dir.mkdir(parents=True, exist_ok=True)
+    thumbnail_path = str(thumbnail_dir / f"{Path(source_filename).stem}_{file_id}_thumbnail.jpg")
+
     # Determine where to save proxy
     if upload_to_s3:
         # Use temporary directory, will upload to S3
@@ -530,14 +738,16 @@ def create_proxy_internal(file_id: int, force: bool = False, upload_to_s3: bool
             proxy_path = os.path.join(tmp_dir, proxy_filename)
 
             try:
-                _create_proxy_video(local_path, proxy_path)
+                encoded = _create_proxy_single_pass(
+                    local_path, proxy_path, thumbnail_path, cancel_event, encode_concurrency
+                )
             except RuntimeError as e:
                 current_app.logger.error(f"ffmpeg error: {e}")
                 raise Exception(f'Failed to create proxy video: {e}')
 
             # Upload to S3
             proxy_s3_key = f"proxies/{proxy_filename}"
-            proxy_size = os.path.getsize(proxy_path)
+            proxy_size = encoded['proxy_size']
 
             with open(proxy_path, 'rb') as proxy_file:
                 s3_service.upload_file(proxy_file, proxy_s3_key, 'video/mp4')
@@ -550,51 +760,23 @@ def create_proxy_internal(file_id: int, force: bool = False, upload_to_s3: bool
         proxy_path = str(proxy_video_dir / proxy_filename)
 
         try:
-            _create_proxy_video(local_path, proxy_path)
+            encoded = _create_proxy_single_pass(
+                local_path, proxy_path, thumbnail_path, cancel_event, encode_concurrency
+            )
         except RuntimeError as e:
             current_app.logger.error(f"ffmpeg error: {e}")
             raise Exception(f'Failed to create proxy video: {e}')
 
         proxy_s3_key = None  # No S3 upload
-        proxy_size = os.path.getsize(proxy_path)
+        proxy_size = encoded['proxy_size']
         proxy_local_path = proxy_path
 
-    # Extract media metadata from proxy
-    try:
-        from app.utils.media_metadata import extract_media_metadata
-        proxy_metadata = extract_media_metadata(proxy_path)
-    except Exception as e:
-        current_app.logger.error(f"Failed to extract proxy metadata from {proxy_path}: {e}", exc_info=True)
-        # Provide complete fallback metadata with all expected fields
-        # This ensures database records are properly populated even if extraction fails
-        proxy_metadata = {
-            'resolution_width': 1280,
-            'resolution_height': 720,
-            'frame_rate': 15.0,
-            'codec_video': 'h264',
-            'codec_audio': 'aac',
-            'duration_seconds': None,  # Cannot infer duration, must be extracted
-            'bitrate': None
-        }
-
-    # Extract thumbnail from proxy video
-    thumbnail_local_path = None
-    try:
-        # Build thumbnail filename: {name}_{file_id}_thumbnail.jpg
-        thumbnail_filename = f"{Path(source_filename).stem}_{file_id}_thumbnail.jpg"
-        thumbnail_dir = Path('proxy_video')
-        thumbnail_dir.mkdir(parents=True, exist_ok=True)
-        thumbnail_path = str(thumbnail_dir / thumbnail_filename)
-
-        # Extract thumbnail using duration from metadata
-        duration = proxy_metadata.get('duration_seconds')
-        if _extract_thumbnail_from_proxy(proxy_path, thumbnail_path, duration):
-            thumbnail_local_path = thumbnail_path
-            current_app.logger.info(f"Thumbnail created: {thumbnail_path}")
-        else:
-            current_app.logger.warning(f"Failed to extract thumbnail for proxy {proxy_filename}")
-    except Exception as e:
-        current_app.logger.error(f"Error extracting thumbnail: {e}", exc_info=True)
+    proxy_metadata = encoded['proxy_metadata']
+    thumbnail_local_path = encoded['thumbnail_path']
+    if thumbnail_local_path:
+        current_app.logger.info(f"Thumbnail created: {thumbnail_local_path}")
+    else:
+        current_app.logger.warning(f"Failed to extract thumbnail for proxy {proxy_filename}")
 
     # Create proxy file record in database
     proxy_id = db.create_proxy_file(
@@ -2,16 +2,28 @@
 Background service for polling Bedrock batch jobs and processing completed ones.
 
 This service runs in a background thread and:
-1. Polls pending Bedrock batch jobs every 60 seconds
+1. Checks each pending Bedrock batch job on its own backoff schedule
 2. Fetches results automatically when jobs complete
 3. Cleans up S3 files after successful result storage
+
+Each job's next check time comes from its Bedrock status, how long the status
+has been unchanged and the job's age (see _next_check_delay). Due times are
+kept in a priority queue and persisted as next_check_at, so a restart resumes
+the schedule.
+
+Status checks run concurrently on a bounded thread pool sharing one Bedrock
+client. Completed jobs are handed to a separate result-fetch pool, so a slow
+S3 download never holds up the status checks of other jobs.
 """
+import heapq
 import logging
+import statistics
 import threading
 import time
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +31,23 @@ logger = logging.getLogger(__name__)
 class BatchPollerService:
     """Background service for polling Bedrock batch jobs."""
 
+    # Base delay between checks per Bedrock status, as a multiple of
+    # batch_check_interval (doubled for each check that sees no change)
+    STATUS_CHECK_MULTIPLIERS = {
+        'Submitted': 1,
+        'Validating': 1,
+        'Scheduled': 4,
+        'InProgress': 2,
+    }
+
+    # A job is checked at least every AGE_CHECK_FRACTION of its age, so
+    # freshly submitted jobs are checked often
+    AGE_CHECK_FRACTION = 0.25
+
+    # An InProgress job older than this share of the typical completion time
+    # is treated as almost done and checked every 2 * batch_check_interval
+    ALMOST_DONE_FRACTION = 0.8
+
     def __init__(self, app):
         """
         Initialize the batch poller service.
@@ -32,10 +61,37 @@ class BatchPollerService:
 
         # Configuration from environment variables
         self.enabled = os.getenv('BATCH_POLLER_ENABLED', 'true').lower() == 'true'
+        # How often new jobs are picked up from the database
         self.poll_interval = int(os.getenv('BATCH_POLLER_INTERVAL', '60'))
+        # Shortest and longest delay between checks of one job
         self.batch_check_interval = int(os.getenv('BATCH_CHECK_INTERVAL', '30'))
+        self.max_check_interval = int(os.getenv('BATCH_CHECK_MAX_INTERVAL', '1800'))
         self.auto_cleanup = os.getenv('BATCH_AUTO_CLEANUP', 'true').lower() == 'true'
         self.max_retries = int(os.getenv('BATCH_RESULT_FETCH_MAX_RETRIES', '3'))
+        self.check_workers = max(1, int(os.getenv('BATCH_POLLER_CHECK_WORKERS', '8')))
+        self.fetch_workers = max(1, int(os.getenv('BATCH_POLLER_FETCH_WORKERS', '2')))
+
+        # Shared by all worker threads (boto3 clients are thread-safe)
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+
+        # Worker pools, created on first use and torn down by stop()
+        self._check_pool: Optional[ThreadPoolExecutor] = None
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+        self._pools_lock = threading.Lock()
+
+        # batch_job_arns queued for or in result fetching
+        self._fetching = set()
+        self._fetching_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        # Check schedule: heap of (due epoch, arn); _due_at holds each
+        # scheduled job's current due time, so superseded heap entries are skipped
+        self._schedule: List[tuple] = []
+        self._due_at: Dict[str, float] = {}
+        self._scheduled_jobs: Dict[str, Dict[str, Any]] = {}
+        self._schedule_lock = threading.Lock()
+        self._typical_duration: Optional[float] = None
 
         # Stats tracking
         self.stats = {
@@ -45,6 +101,8 @@ class BatchPollerService:
             'jobs_failed': 0,
             'results_fetched': 0,
             'cleanups_performed': 0,
+            'result_bytes_downloaded': 0,
+            'last_result_fetch': None,
             'last_poll_time': None,
             'errors': []
         }
@@ -78,6 +136,16 @@ class BatchPollerService:
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
 
+        # Queued checks and fetches are dropped; running ones finish
+        with self._pools_lock:
+            for pool in (self._check_pool, self._fetch_pool):
+                if pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._check_pool = None
+            self._fetch_pool = None
+        with self._fetching_lock:
+            self._fetching.clear()
+
         logger.info("Batch poller stopped")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -88,9 +156,64 @@ class BatchPollerService:
             'enabled': self.enabled,
             'poll_interval': self.poll_interval,
             'batch_check_interval': self.batch_check_interval,
+            'max_check_interval': self.max_check_interval,
+            'jobs_scheduled': len(self._due_at),
+            'next_check_in_seconds': self._seconds_until_next_check(),
             'auto_cleanup': self.auto_cleanup,
+            'check_workers': self.check_workers,
+            'fetch_workers': self.fetch_workers,
+            'result_fetches_pending': len(self._fetching),
         }
 
+    def _get_client(self, service_name: str) -> Any:
+        """Shared boto3 client for a service, created on first use."""
+        with self._clients_lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                import boto3
+                from botocore.config import Config
+
+                # Enough pooled connections for every check worker at once
+                config = Config(max_pool_connections=max(10, self.check_workers + self.fetch_workers))
+                client = boto3.client(service_name, region_name=os.getenv('AWS_REGION', 'us-east-1'),
+                                      config=config)
+                self._clients[service_name] = client
+            return client
+
+    def _get_nova_service(self):
+        """Shared NovaVideoService for result fetching, created on first use."""
+        with self._clients_lock:
+            nova_service = self._clients.get('nova_service')
+            if nova_service is None:
+                from app.services.nova_service import NovaVideoService
+
+                nova_service = NovaVideoService(
+                    bucket_name=os.getenv('S3_BUCKET_NAME'),
+                    region=os.getenv('AWS_REGION', 'us-east-1')
+                )
+                self._clients['nova_service'] = nova_service
+            return nova_service
+
+    def _get_pools(self):
+        """(status check pool, result fetch pool), created on first use."""
+        with self._pools_lock:
+            if self._check_pool is None:
+                self._check_pool = ThreadPoolExecutor(max_workers=self.check_workers,
+                                                      thread_name_prefix='batch-check')
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers,
+                                                      thread_name_prefix='batch-fetch')
+            return self._check_pool, self._fetch_pool
+
+    def _increment_stat(self, name: str):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _in_app_context(self, func: Callable, *args):
+        """Run func on a worker thread inside the app context."""
+        with self.app.app_context():
+            return func(*args)
+
     def _poll_loop(self):
         """Main polling loop - runs in background thread."""
         logger.info("Batch poller loop started")
@@ -113,16 +236,25 @@ class BatchPollerService:
                 # Keep only last 10 errors
                 self.stats['errors'] = self.stats['errors'][-10:]
 
-            # Sleep in small increments to allow faster shutdown
-            for _ in range(self.poll_interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Sleep until the next job is due, waking at least every
+            # poll_interval to pick up new jobs; small increments allow
+            # faster shutdown
+            wake_at = time.time() + self.poll_interval
+            next_due = self._next_due()
+            if next_due is not None:
+                wake_at = min(wake_at, next_due)
+            while self.running and time.time() < wake_at:
+                time.sleep(min(1, max(0.0, wake_at - time.time())))
 
         logger.info("Batch poller loop exited")
 
-    def _poll_cycle(self):
-        """Execute one poll cycle."""
+    def _poll_cycle(self, force: bool = False):
+        """
+        Execute one poll cycle: check the jobs that are due.
+
+        Args:
+            force: Check every pending job now, ignoring the schedule
+        """
         with self.app.app_context():
             from app.database import get_db
 
@@ -130,30 +262,160 @@ class BatchPollerService:
             self.stats['polls_count'] += 1
             self.stats['last_poll_time'] = datetime.utcnow().isoformat()
 
-            # Get pending jobs
-            pending_jobs = db.get_pending_batch_jobs_for_polling(self.batch_check_interval)
+            self._sync_schedule(db)
+            due_jobs = self._pop_due_jobs(float('inf') if force else time.time())
 
-            if not pending_jobs:
-                logger.debug(f"No pending batch jobs to check (poll #{self.stats['polls_count']})")
+            if not due_jobs:
+                logger.debug(f"No batch jobs due for checking (poll #{self.stats['polls_count']})")
                 return
 
-            logger.info(f"Checking {len(pending_jobs)} pending batch jobs")
+            logger.info(
+                f"Checking {len(due_jobs)} due batch jobs "
+                f"({len(self._due_at)} scheduled for later)"
+            )
 
-            for job in pending_jobs:
-                if not self.running:
-                    break
+            self._check_jobs(due_jobs, count_checks=True)
+
+    def _sync_schedule(self, db):
+        """
+        Bring the schedule in line with the database.
 
-                try:
-                    self._check_and_process_job(job)
-                    self.stats['jobs_checked'] += 1
-                except Exception as e:
-                    logger.error(
-                        f"Error processing job {job.get('batch_job_arn')}: {e}",
-                        exc_info=True
-                    )
+        New SUBMITTED/IN_PROGRESS jobs are scheduled at their persisted
+        next_check_at (now if never scheduled); jobs that left those states
+        are dropped. Also refreshes the typical completion time.
+        """
+        jobs = {
+            job['batch_job_arn']: job
+            for job in db.get_pending_bedrock_batch_jobs()
+            if job['status'] in ('SUBMITTED', 'IN_PROGRESS')
+        }
+        durations = db.get_recent_batch_job_durations()
+
+        now = time.time()
+        with self._schedule_lock:
+            self._typical_duration = statistics.median(durations) if durations else None
+            self._scheduled_jobs = jobs
+            for batch_job_arn in list(self._due_at):
+                if batch_job_arn not in jobs:
+                    del self._due_at[batch_job_arn]
+            for batch_job_arn, job in jobs.items():
+                if batch_job_arn not in self._due_at:
+                    due = self._parse_utc(job.get('next_check_at'))
+                    self._push_schedule(batch_job_arn, due if due is not None else now)
+
+    def _schedule_check(self, batch_job_arn: str, delay_seconds: float):
+        """Schedule the next check of a job."""
+        with self._schedule_lock:
+            self._push_schedule(batch_job_arn, time.time() + delay_seconds)
+
+    def _push_schedule(self, batch_job_arn: str, due: float):
+        # Caller holds _schedule_lock
+        self._due_at[batch_job_arn] = due
+        heapq.heappush(self._schedule, (due, batch_job_arn))
+
+    def _pop_due_jobs(self, now: float) -> List[Dict[str, Any]]:
+        """Remove and return the jobs due by now (earliest first)."""
+        due_jobs = []
+        with self._schedule_lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                due, batch_job_arn = heapq.heappop(self._schedule)
+                if self._due_at.get(batch_job_arn) != due:
+                    continue  # Superseded or dropped
+                del self._due_at[batch_job_arn]
+                job = self._scheduled_jobs.get(batch_job_arn)
+                if job:
+                    due_jobs.append(job)
+        return due_jobs
+
+    def _next_due(self) -> Optional[float]:
+        """Epoch time the next scheduled job is due, if any."""
+        with self._schedule_lock:
+            while self._schedule and self._due_at.get(self._schedule[0][1]) != self._schedule[0][0]:
+                heapq.heappop(self._schedule)
+            return self._schedule[0][0] if self._schedule else None
+
+    def _seconds_until_next_check(self) -> Optional[int]:
+        next_due = self._next_due()
+        return None if next_due is None else max(0, int(next_due - time.time()))
+
+    def _next_check_delay(self, batch_job: Dict[str, Any], bedrock_status: str,
+                          check_count: int) -> float:
+        """
+        Seconds until a running job's next status check.
+
+        The status's base delay doubles for each consecutive check that saw
+        the same status (a status change resets it), capped at
+        max_check_interval. Young jobs are checked at least every
+        AGE_CHECK_FRACTION of their age, and InProgress jobs nearing the
+        typical completion time every 2 * batch_check_interval.
+
+        Args:
+            batch_job: Batch job record from database
+            bedrock_status: Status Bedrock just reported
+            check_count: Consecutive checks with this status, 0 after a change
+        """
+        min_interval = self.batch_check_interval
+        multiplier = self.STATUS_CHECK_MULTIPLIERS.get(bedrock_status, 1)
+        delay = min_interval * multiplier * (2 ** min(check_count, 10))
+
+        submitted_at = self._parse_utc(batch_job.get('submitted_at'))
+        if submitted_at is not None:
+            age = max(0.0, time.time() - submitted_at)
+            delay = min(delay, max(min_interval, age * self.AGE_CHECK_FRACTION))
+
+            typical = self._typical_duration
+            if (typical and bedrock_status == 'InProgress'
+                    and age >= typical * self.ALMOST_DONE_FRACTION):
+                delay = min(delay, min_interval * 2)
+
+        return max(min_interval, min(delay, self.max_check_interval))
+
+    @staticmethod
+    def _parse_utc(value: Optional[str]) -> Optional[float]:
+        """Epoch seconds from a stored UTC timestamp (SQLite or ISO format)."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    def _check_jobs(self, jobs: List[Dict[str, Any]], count_checks: bool = False):
+        """Check job statuses on the check pool and wait for all of them."""
+        check_pool, _ = self._get_pools()
+
+        def check(job: Dict[str, Any]):
+            if not self.running:
+                return
+            self._in_app_context(self._check_and_process_job, job)
+            if count_checks:
+                self._increment_stat('jobs_checked')
+
+        futures = {check_pool.submit(check, job): job for job in jobs}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(
+                    f"Error processing job {futures[future].get('batch_job_arn')}: {e}",
+                    exc_info=True
+                )
 
     def _check_orphaned_jobs(self):
-        """Check for jobs that may have completed while app was down."""
+        """
+        Resume the check schedule for jobs from a previous session.
+
+        SUBMITTED/IN_PROGRESS jobs keep their persisted next_check_at: those
+        that came due while the app was down (or were never scheduled) are
+        checked by the first poll cycle, the rest wait for their slot instead
+        of all being re-checked at once. Other non-terminal jobs (e.g.
+        RESULT_FETCH_FAILED) are checked once now.
+        """
         logger.info("Checking for orphaned batch jobs from previous session...")
 
         with self.app.app_context():
@@ -161,44 +423,45 @@ class BatchPollerService:
 
             db = get_db()
 
-            # Get all non-terminal jobs (IN_PROGRESS or SUBMITTED)
+            # Get all non-terminal jobs
             pending_jobs = db.get_pending_bedrock_batch_jobs()
 
             if not pending_jobs:
                 logger.info("No orphaned jobs found")
                 return
 
-            logger.info(f"Found {len(pending_jobs)} potentially orphaned jobs, checking status...")
+            self._sync_schedule(db)
+            now = time.time()
+            with self._schedule_lock:
+                due_now = sum(1 for due in self._due_at.values() if due <= now)
+            logger.info(
+                f"Resuming schedule for {len(self._due_at)} pending batch jobs "
+                f"({due_now} due now)"
+            )
 
-            for job in pending_jobs:
-                try:
-                    self._check_and_process_job(job)
-                except Exception as e:
-                    logger.error(
-                        f"Error checking orphaned job {job.get('batch_job_arn')}: {e}",
-                        exc_info=True
-                    )
+            other_jobs = [job for job in pending_jobs if job['status'] not in ('SUBMITTED', 'IN_PROGRESS')]
+            if other_jobs:
+                logger.info(f"Checking {len(other_jobs)} other unfinished jobs...")
+                self._check_jobs(other_jobs)
 
     def _check_and_process_job(self, batch_job: Dict[str, Any]) -> bool:
         """
-        Check single job status and process if completed.
+        Check single job status and queue result fetching if completed.
 
         Args:
             batch_job: Batch job record from database
 
         Returns:
-            True if job was processed successfully, False otherwise
+            True if the job completed and its results were queued for
+            fetching, False otherwise
         """
         from app.database import get_db
-        from app.services.nova_service import NovaVideoService
-        import boto3
 
         db = get_db()
         batch_job_arn = batch_job['batch_job_arn']
 
         try:
-            # Initialize Bedrock client
-            bedrock = boto3.client('bedrock', region_name=os.getenv('AWS_REGION', 'us-east-1'))
+            bedrock = self._get_client('bedrock')
 
             # Check job status
             response = bedrock.get_model_invocation_job(jobIdentifier=batch_job_arn)
@@ -206,8 +469,33 @@ class BatchPollerService:
 
             logger.debug(f"Job {batch_job_arn}: Bedrock status = {bedrock_status}")
 
-            # Update last_checked_at
-            db.mark_bedrock_batch_checked(batch_job_arn)
+            # Schedule the next check. Completed jobs are re-checked at the
+            # shortest interval in case fetching their results fails.
+            if bedrock_status in ['Failed', 'Stopped', 'Expired']:
+                next_delay = None
+                check_count = 0
+            else:
+                if batch_job.get('last_bedrock_status') == bedrock_status:
+                    check_count = (batch_job.get('check_count') or 0) + 1
+                else:
+                    check_count = 0
+                if bedrock_status == 'Completed':
+                    next_delay = self.batch_check_interval
+                else:
+                    next_delay = self._next_check_delay(batch_job, bedrock_status, check_count)
+
+            # Update last_checked_at and persist the schedule
+            next_check_at = None
+            if next_delay is not None:
+                next_check_at = (datetime.utcnow() + timedelta(seconds=next_delay)).strftime('%Y-%m-%d %H:%M:%S')
+            db.mark_bedrock_batch_checked(
+                batch_job_arn,
+                next_check_at=next_check_at,
+                check_count=check_count,
+                bedrock_status=bedrock_status
+            )
+            if next_delay is not None:
+                self._schedule_check(batch_job_arn, next_delay)
 
             # Map Bedrock status to internal status
             if bedrock_status in ['Submitted', 'Validating', 'Scheduled', 'InProgress']:
@@ -218,31 +506,8 @@ class BatchPollerService:
                 return False
 
             elif bedrock_status == 'Completed':
-                # Job completed! Fetch results
-                logger.info(f"Job {batch_job_arn}: COMPLETED - fetching results")
-
-                success = self._fetch_and_store_results(batch_job)
-
-                if success:
-                    self.stats['jobs_completed'] += 1
-                    self.stats['results_fetched'] += 1
-
-                    # Mark batch job as completed
-                    db.update_bedrock_batch_job(batch_job_arn, {
-                        'status': 'COMPLETED',
-                        'completed_at': datetime.utcnow().isoformat()
-                    })
-
-                    # Trigger cleanup if enabled
-                    if self.auto_cleanup and batch_job.get('s3_folder'):
-                        cleanup_success = self._cleanup_batch_files(batch_job)
-                        if cleanup_success:
-                            self.stats['cleanups_performed'] += 1
-
-                    return True
-                else:
-                    # Result fetching failed - mark for retry or failure
-                    return False
+                # Job completed! Fetch results on the fetch pool
+                return self._queue_result_fetch(batch_job)
 
             elif bedrock_status in ['Failed', 'Stopped', 'Expired']:
                 # Job failed
@@ -264,7 +529,7 @@ class BatchPollerService:
                         'error_message': failure_message
                     })
 
-                self.stats['jobs_failed'] += 1
+                self._increment_stat('jobs_failed')
                 return False
 
             else:
@@ -286,20 +551,94 @@ class BatchPollerService:
                 return False
 
             elif any(x in error_str for x in ['ThrottlingException', 'ServiceUnavailable']):
-                # Transient error - will retry next cycle
+                # Transient error - back off before retrying
                 logger.warning(f"Job {batch_job_arn}: Transient error, will retry: {error_str}")
+                self._schedule_check(batch_job_arn, self.batch_check_interval * 2)
                 return False
 
             else:
-                # Unknown error - log and continue
+                # Unknown error - log and retry after the longest interval
                 logger.error(f"Job {batch_job_arn}: Error checking status: {e}", exc_info=True)
                 db.increment_fetch_attempts(batch_job_arn, error=error_str)
+                self._schedule_check(batch_job_arn, self.max_check_interval)
                 return False
 
+    def _queue_result_fetch(self, batch_job: Dict[str, Any]) -> bool:
+        """
+        Hand a completed job to the result fetch pool.
+
+        Returns:
+            False if the job's results are already queued or being fetched
+        """
+        batch_job_arn = batch_job['batch_job_arn']
+        with self._fetching_lock:
+            if batch_job_arn in self._fetching:
+                return False
+            self._fetching.add(batch_job_arn)
+
+        _, fetch_pool = self._get_pools()
+        try:
+            fetch_pool.submit(self._in_app_context, self._process_completed_job, batch_job)
+        except RuntimeError:
+            # Pool shut down by stop(); the next poll picks the job up again
+            with self._fetching_lock:
+                self._fetching.discard(batch_job_arn)
+            return False
+
+        logger.info(f"Job {batch_job_arn}: COMPLETED - queued result fetch")
+        return True
+
+    def _process_completed_job(self, batch_job: Dict[str, Any]) -> bool:
+        """
+        Fetch and store results of a completed job, then clean up (fetch pool).
+
+        Returns:
+            True if results were stored, False otherwise
+        """
+        from app.database import get_db
+
+        db = get_db()
+        batch_job_arn = batch_job['batch_job_arn']
+
+        try:
+            success = self._fetch_and_store_results(batch_job)
+
+            if success:
+                self._increment_stat('jobs_completed')
+                self._increment_stat('results_fetched')
+
+                # Mark batch job as completed
+                db.update_bedrock_batch_job(batch_job_arn, {
+                    'status': 'COMPLETED',
+                    'completed_at': datetime.utcnow().isoformat()
+                })
+
+                # Trigger cleanup if enabled
+                if self.auto_cleanup and batch_job.get('s3_folder'):
+                    cleanup_success = self._cleanup_batch_files(batch_job)
+                    if cleanup_success:
+                        self._increment_stat('cleanups_performed')
+
+            # On failure the job stays pending (or RESULT_FETCH_FAILED) for retry
+            return success
+
+        except Exception as e:
+            logger.error(f"Job {batch_job_arn}: Error processing completed job: {e}", exc_info=True)
+            return False
+
+        finally:
+            with self._fetching_lock:
+                self._fetching.discard(batch_job_arn)
+
     def _fetch_and_store_results(self, batch_job: Dict[str, Any]) -> bool:
         """
         Fetch results from S3 and update database.
 
+        Each batch output location is downloaded and parsed once: records are
+        grouped by the nova jobs' record prefixes (file-<id>:), results are
+        built per nova job, and all nova_jobs/analysis_jobs updates are
+        written in one transaction.
+
         Args:
             batch_job: Batch job record from database
 
@@ -307,8 +646,7 @@ class BatchPollerService:
             True if results fetched successfully, False otherwise
         """
         from app.database import get_db
-        from app.services.nova_service import NovaVideoService
-        import boto3
+        import json as json_module
 
         db = get_db()
         batch_job_arn = batch_job['batch_job_arn']
@@ -319,10 +657,7 @@ class BatchPollerService:
             return False
 
         try:
-            # Initialize Nova service with required parameters
-            bucket_name = os.getenv('S3_BUCKET_NAME')
-            region = os.getenv('AWS_REGION', 'us-east-1')
-            nova_service = NovaVideoService(bucket_name=bucket_name, region=region)
+            nova_service = self._get_nova_service()
 
             # Get S3 output location
             s3_folder = batch_job.get('s3_folder')
@@ -336,110 +671,154 @@ class BatchPollerService:
                 f"from {output_s3_prefix}"
             )
 
-            # Process each nova_job
             success_count = 0
             fail_count = 0
 
+            # Nova jobs still waiting for results, grouped by output location
+            pending_by_location: Dict[str, List[Dict[str, Any]]] = {}
             for nova_job_id in nova_job_ids:
-                try:
-                    # Get nova_job details
-                    nova_job = db.get_nova_job(nova_job_id)
-                    if not nova_job:
-                        logger.error(f"Nova job {nova_job_id} not found")
-                        fail_count += 1
+                nova_job = db.get_nova_job(nova_job_id)
+                if not nova_job:
+                    logger.error(f"Nova job {nova_job_id} not found")
+                    fail_count += 1
+                    continue
+
+                # Skip if already completed
+                if nova_job.get('status') == 'COMPLETED':
+                    logger.debug(f"Nova job {nova_job_id} already completed, skipping")
+                    success_count += 1
+                    continue
+
+                # Handle both string and already-parsed values
+                analysis_types = nova_job.get('analysis_types', [])
+                if isinstance(analysis_types, str):
+                    analysis_types = json_module.loads(analysis_types)
+
+                user_options = nova_job.get('user_options', {})
+                if isinstance(user_options, str):
+                    user_options = json_module.loads(user_options)
+
+                record_prefix = user_options.get('batch_record_prefix')
+                pending_by_location.setdefault(nova_job['batch_output_s3_prefix'], []).append({
+                    'id': nova_job_id,
+                    'nova_job': nova_job,
+                    'analysis_types': analysis_types,
+                    'user_options': user_options,
+                    'record_prefix': str(record_prefix) if record_prefix else None,
+                    'record_outputs': {}
+                })
+
+            # Read each location once, routing records to their nova jobs
+            read_stats = {}
+            read_started = time.monotonic()
+            for location, entries in pending_by_location.items():
+                by_prefix: Dict[str, List[Dict[str, Any]]] = {}
+                unprefixed = []
+                for entry in entries:
+                    if entry['record_prefix']:
+                        by_prefix.setdefault(entry['record_prefix'], []).append(entry)
+                    else:
+                        unprefixed.append(entry)
+
+                for record_id, output in nova_service.iter_batch_records(location, stats=read_stats):
+                    record_id = str(record_id)
+                    for entry in unprefixed:
+                        entry['record_outputs'][record_id] = output
+                    if not by_prefix:
                         continue
 
-                    # Skip if already completed
-                    if nova_job.get('status') == 'COMPLETED':
-                        logger.debug(f"Nova job {nova_job_id} already completed, skipping")
-                        success_count += 1
+                    # Record ids look like 'file-<id>:<type>'
+                    head, sep, _ = record_id.partition(':')
+                    record_prefix = head + sep if sep and head + sep in by_prefix else None
+                    if record_prefix is None:
+                        record_prefix = next((p for p in by_prefix if record_id.startswith(p)), None)
+                    if record_prefix is None:
                         continue
+                    for entry in by_prefix[record_prefix]:
+                        entry['record_outputs'][record_id[len(record_prefix):]] = output
+            read_seconds = time.monotonic() - read_started
+
+            # Build every nova job's results before opening the write transaction
+            build_started = time.monotonic()
+            updates = []
+            failures = []
+            for location, entries in pending_by_location.items():
+                for entry in entries:
+                    nova_job = entry['nova_job']
+                    try:
+                        results = nova_service.build_batch_results(
+                            entry['record_outputs'],
+                            model=nova_job['model'],
+                            analysis_types=entry['analysis_types'],
+                            options=entry['user_options'],
+                            s3_prefix=location
+                        )
+                        updates.append((entry, results, self._build_nova_job_update(results)))
+                    except Exception as e:
+                        failures.append((entry, e))
+                    # Parsed outputs are no longer needed
+                    entry['record_outputs'] = None
+            build_seconds = time.monotonic() - build_started
+
+            with db.get_connection() as conn:
+                # One transaction for every job's update; each db call below
+                # nests inside it as a savepoint
+                if not conn.in_transaction:
+                    conn.execute('BEGIN IMMEDIATE')
+
+                for entry, results, update_data in updates:
+                    nova_job = entry['nova_job']
+                    try:
+                        db.update_nova_job(entry['id'], update_data)
 
-                    # Parse options and analysis types
-                    import json as json_module
-
-                    # Handle both string and already-parsed values
-                    analysis_types = nova_job.get('analysis_types', [])
-                    if isinstance(analysis_types, str):
-                        analysis_types = json_module.loads(analysis_types)
-
-                    user_options = nova_job.get('user_options', {})
-                    if isinstance(user_options, str):
-                        user_options = json_module.loads(user_options)
-
-                    # Fetch batch results from S3
-                    results = nova_service.fetch_batch_results(
-                        s3_prefix=nova_job['batch_output_s3_prefix'],
-                        model=nova_job['model'],
-                        analysis_types=analysis_types,
-                        options=user_options,
-                        record_prefix=user_options.get('batch_record_prefix')
-                    )
-
-                    # Update nova_job with results
-                    update_data = {
-                        'status': 'COMPLETED',
-                        'progress_percent': 100,
-                        'tokens_total': results['totals']['tokens_total'],
-                        'processing_time_seconds': results['totals']['processing_time_seconds'],
-                        'cost_usd': results['totals']['cost_total_usd'],
-                        'batch_status': 'COMPLETED',
-                        'completed_at': datetime.utcnow().isoformat()
-                    }
-
-                    if 'summary' in results:
-                        update_data['summary_result'] = json_module.dumps(results['summary'])
-                        update_data['tokens_input'] = results['summary'].get('tokens_input', 0)
-                        update_data['tokens_output'] = results['summary'].get('tokens_output', 0)
-
-                    if 'chapters' in results:
-                        update_data['chapters_result'] = json_module.dumps(results['chapters'])
-
-                    if 'elements' in results:
-                        update_data['elements_result'] = json_module.dumps(results['elements'])
-
-                    if 'waterfall_classification' in results:
-                        update_data['waterfall_classification_result'] = json_module.dumps(results['waterfall_classification'])
-
-                    if 'search_metadata' in results:
-                        update_data['search_metadata'] = json_module.dumps(results['search_metadata'])
-
-                    db.update_nova_job(nova_job_id, update_data)
-
-                    # Update analysis_job
-                    db.update_analysis_job(
-                        nova_job['analysis_job_id'],
-                        status='COMPLETED',
-                        results=results
-                    )
+                        # Update analysis_job
+                        db.update_analysis_job(
+                            nova_job['analysis_job_id'],
+                            status='COMPLETED',
+                            results=results
+                        )
 
-                    success_count += 1
-                    logger.debug(f"Successfully processed results for nova_job {nova_job_id}")
+                        success_count += 1
+                        logger.debug(f"Successfully processed results for nova_job {entry['id']}")
+                    except Exception as e:
+                        failures.append((entry, e))
 
-                except Exception as e:
-                    logger.error(
-                        f"Error fetching results for nova_job {nova_job_id}: {e}",
-                        exc_info=True
-                    )
+                for entry, error in failures:
+                    logger.error(f"Error fetching results for nova_job {entry['id']}: {error}")
                     # Update job as failed
                     try:
-                        db.update_nova_job(nova_job_id, {
+                        db.update_nova_job(entry['id'], {
                             'status': 'FAILED',
-                            'error_message': f'Failed to fetch batch results: {str(e)}',
+                            'error_message': f'Failed to fetch batch results: {str(error)}',
                             'batch_status': 'RESULT_FETCH_FAILED'
                         })
                         db.update_analysis_job(
-                            nova_job.get('analysis_job_id') if 'nova_job' in locals() and nova_job else None,
+                            entry['nova_job'].get('analysis_job_id'),
                             status='FAILED',
-                            error_message=f'Failed to fetch batch results: {str(e)}'
+                            error_message=f'Failed to fetch batch results: {str(error)}'
                         )
                     except Exception as update_error:
                         logger.error(f"Failed to update job status: {update_error}")
                     fail_count += 1
 
+            with self._stats_lock:
+                self.stats['result_bytes_downloaded'] += read_stats.get('bytes', 0)
+                self.stats['last_result_fetch'] = {
+                    'batch_job_arn': batch_job_arn,
+                    'objects': read_stats.get('objects', 0),
+                    'bytes_downloaded': read_stats.get('bytes', 0),
+                    'records': read_stats.get('records', 0),
+                    'read_seconds': round(read_seconds, 3),
+                    'build_seconds': round(build_seconds, 3),
+                }
+
             logger.info(
                 f"Job {batch_job_arn}: Results fetched - "
-                f"{success_count} succeeded, {fail_count} failed"
+                f"{success_count} succeeded, {fail_count} failed; read "
+                f"{read_stats.get('records', 0)} records "
+                f"({read_stats.get('bytes', 0) / 1024 / 1024:.2f} MB in "
+                f"{read_stats.get('objects', 0)} objects) in {read_seconds:.2f}s, "
+                f"built results in {build_seconds:.2f}s"
             )
 
             # Mark results as fetched
@@ -465,6 +844,40 @@ class BatchPollerService:
 
             return False
 
+    @staticmethod
+    def _build_nova_job_update(results: Dict[str, Any]) -> Dict[str, Any]:
+        """nova_jobs fields for a job whose batch results were built."""
+        import json as json_module
+
+        update_data = {
+            'status': 'COMPLETED',
+            'progress_percent': 100,
+            'tokens_total': results['totals']['tokens_total'],
+            'processing_time_seconds': results['totals']['processing_time_seconds'],
+            'cost_usd': results['totals']['cost_total_usd'],
+            'batch_status': 'COMPLETED',
+            'completed_at': datetime.utcnow().isoformat()
+        }
+
+        if 'summary' in results:
+            update_data['summary_result'] = json_module.dumps(results['summary'])
+            update_data['tokens_input'] = results['summary'].get('tokens_input', 0)
+            update_data['tokens_output'] = results['summary'].get('tokens_output', 0)
+
+        if 'chapters' in results:
+            update_data['chapters_result'] = json_module.dumps(results['chapters'])
+
+        if 'elements' in results:
+            update_data['elements_result'] = json_module.dumps(results['elements'])
+
+        if 'waterfall_classification' in results:
+            update_data['waterfall_classification_result'] = json_module.dumps(results['waterfall_classification'])
+
+        if 'search_metadata' in results:
+            update_data['search_metadata'] = json_module.dumps(results['search_metadata'])
+
+        return update_data
+
     def _cleanup_batch_files(self, batch_job: Dict[str, Any]) -> bool:
         """
         Delete S3 batch files after successful result storage.
@@ -477,7 +890,6 @@ class BatchPollerService:
         """
         from app.database import get_db
         from app.services.batch_s3_manager import BatchS3Manager
-        import boto3
 
         db = get_db()
         batch_job_arn = batch_job['batch_job_arn']
@@ -489,9 +901,8 @@ class BatchPollerService:
 
         try:
             # Initialize S3 manager
-            s3_client = boto3.client('s3', region_name=os.getenv('AWS_REGION', 'us-east-1'))
             bucket_name = os.getenv('S3_BUCKET_NAME')
-            s3_manager = BatchS3Manager(s3_client, bucket_name)
+            s3_manager = BatchS3Manager(self._get_client('s3'), bucket_name)
 
             # Cleanup batch folder
             stats = s3_manager.cleanup_batch_folder(s3_folder)
@@ -6,15 +6,17 @@ parses the Parquet files, and aggregates costs by service and date.
 """
 
 import os
-import io
 import logging
+import tempfile
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict
 
 import boto3
 from botocore.exceptions import ClientError
-import pyarrow.parquet as pq
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,19 @@ class BillingError(Exception):
     pass
 
 
+# CUR columns read by parse_cur_parquet (everything else is skipped)
+CUR_LINE_ITEM_TYPE = 'line_item_line_item_type'
+CUR_USAGE_START = 'line_item_usage_start_date'
+CUR_VALUE_COLUMNS = {
+    'service_code': 'line_item_product_code',
+    'cost': 'line_item_blended_cost',
+    'operation': 'line_item_operation',
+    'usage_type': 'line_item_usage_type',
+    'usage_amount': 'line_item_usage_amount',
+}
+CUR_GROUP_KEYS = ['service_code', 'usage_date', 'operation', 'usage_type']
+CUR_SCAN_BATCH_ROWS = 131072
+
 # Service code to friendly name mapping
 SERVICE_NAME_MAP = {
     'AmazonS3': 'Amazon S3',
@@ -224,13 +239,21 @@ class BillingService:
         """
         Parse CUR Parquet file from S3 and extract usage rows.
 
+        The file is downloaded to a temporary file and scanned column-wise: only
+        the CUR columns used for reporting are read, the 'Usage' line item
+        filter (and a coarse usage date range) is pushed down to the Parquet
+        scan, and each record batch is reduced with a group_by. Rows come back
+        already summed per (service, date, operation, usage type), which gives
+        the same totals in every aggregate_* method as the raw line items.
+
         Args:
             s3_key: S3 key of the CUR Parquet file
             start_date: Start date for filtering (YYYY-MM-DD)
             end_date: End date for filtering (YYYY-MM-DD)
 
         Returns:
-            List of dicts containing parsed CUR rows
+            List of dicts containing parsed CUR rows; 'line_items' is the
+            number of CUR line items summed into each row
 
         Raises:
             BillingError: If parsing fails
@@ -238,68 +261,67 @@ class BillingService:
         try:
             logger.info(f"Parsing CUR Parquet file: {s3_key}")
 
-            # Get object from S3
-            response = self.s3_client.get_object(
-                Bucket=self.billing_bucket_name,
-                Key=s3_key
-            )
-
-            # Read Parquet file from S3 body
-            parquet_bytes = response['Body'].read()
-            parquet_file = pq.read_table(io.BytesIO(parquet_bytes))
-
-            # Convert to pandas-like dict for easier processing
-            df_dict = parquet_file.to_pydict()
-
-            rows = []
-            num_rows = len(df_dict.get('line_item_line_item_type', []))
-
-            for i in range(num_rows):
-                # Filter for usage rows only (exclude credits, discounts, etc.)
-                line_item_type = df_dict.get('line_item_line_item_type', [None] * num_rows)[i]
-                if line_item_type != 'Usage':
-                    continue
-
-                # Extract relevant fields
-                try:
-                    service_code = df_dict.get('line_item_product_code', [None] * num_rows)[i] or 'Unknown'
-                    cost = float(df_dict.get('line_item_blended_cost', [0] * num_rows)[i] or 0)
-                    usage_date_obj = df_dict.get('line_item_usage_start_date', [None] * num_rows)[i]
-
-                    # Extract operation details for granular breakdown
-                    operation = df_dict.get('line_item_operation', [None] * num_rows)[i] or ''
-                    usage_type = df_dict.get('line_item_usage_type', [None] * num_rows)[i] or ''
-                    usage_amount = float(df_dict.get('line_item_usage_amount', [0] * num_rows)[i] or 0)
-
-                    # Parse usage date
-                    if usage_date_obj:
-                        # Convert to string date
-                        if hasattr(usage_date_obj, 'strftime'):
-                            usage_date = usage_date_obj.strftime('%Y-%m-%d')
-                        else:
-                            usage_date = str(usage_date_obj).split('T')[0].split(' ')[0]
-                    else:
-                        continue
-
-                    # Filter by date range
-                    if usage_date < start_date or usage_date > end_date:
-                        continue
-
-                    rows.append({
-                        'service_code': service_code,
-                        'cost': cost,
-                        'usage_date': usage_date,
-                        'operation': operation,
-                        'usage_type': usage_type,
-                        'usage_amount': usage_amount,
-                    })
-
-                except (ValueError, KeyError, IndexError) as e:
-                    # Skip malformed rows
-                    logger.warning(f"Skipping malformed row in {s3_key}: {e}")
-                    continue
+            # Download to disk instead of holding the object in memory. The
+            # file is closed before it is scanned by name (Windows can't
+            # reopen an open NamedTemporaryFile)
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.parquet')
+            temp_path = temp_file.name
+            temp_file.close()
+            try:
+                self.s3_client.download_file(self.billing_bucket_name, s3_key, temp_path)
+
+                dataset = ds.dataset(temp_path, format='parquet')
+                schema = dataset.schema
+                if CUR_LINE_ITEM_TYPE not in schema.names or CUR_USAGE_START not in schema.names:
+                    logger.warning(f"CUR file {s3_key} has no line item type/usage date columns")
+                    return []
+
+                columns = [CUR_LINE_ITEM_TYPE, CUR_USAGE_START] + [
+                    name for name in CUR_VALUE_COLUMNS.values() if name in schema.names
+                ]
+                scanner = dataset.scanner(
+                    columns=columns,
+                    filter=self._cur_scan_filter(schema, start_date, end_date),
+                    batch_size=CUR_SCAN_BATCH_ROWS
+                )
 
-            logger.info(f"Parsed {len(rows)} usage rows from {s3_key}")
+                partials = []
+                for batch in scanner.to_batches():
+                    if batch.num_rows:
+                        partials.append(self._aggregate_cur_batch(batch, start_date, end_date))
+            finally:
+                # Drop the scan's file handles before deleting
+                dataset = scanner = None
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+            if not partials:
+                logger.info(f"Parsed 0 usage rows from {s3_key}")
+                return []
+
+            totals = pa.concat_tables(partials).group_by(CUR_GROUP_KEYS).aggregate([
+                ('cost', 'sum'),
+                ('usage_amount', 'sum'),
+                ('line_items', 'sum')
+            ])
+
+            rows = [
+                {
+                    'service_code': row['service_code'],
+                    'cost': row['cost_sum'],
+                    'usage_date': row['usage_date'],
+                    'operation': row['operation'],
+                    'usage_type': row['usage_type'],
+                    'usage_amount': row['usage_amount_sum'],
+                    'line_items': row['line_items_sum'],
+                }
+                for row in totals.to_pylist()
+            ]
+
+            logger.info(
+                f"Parsed {sum(row['line_items'] for row in rows)} usage rows from {s3_key} "
+                f"({len(rows)} after grouping)"
+            )
             return rows
 
         except ClientError as e:
@@ -307,6 +329,78 @@ class BillingService:
         except Exception as e:
             raise BillingError(f"Failed to parse CUR Parquet file {s3_key}: {e}")
 
+    @staticmethod
+    def _cur_scan_filter(schema, start_date: str, end_date: str):
+        """
+        Filter expression pushed down to the Parquet scan.
+
+        Always keeps only 'Usage' line items. For timestamp usage dates the
+        range is widened by a day on each side (the exact per-day check runs
+        after dates are formatted in the column's own timezone).
+        """
+        expression = ds.field(CUR_LINE_ITEM_TYPE) == 'Usage'
+
+        usage_type = schema.field(CUR_USAGE_START).type
+        if pa.types.is_timestamp(usage_type):
+            lower = datetime.strptime(start_date, '%Y-%m-%d') - timedelta(days=1)
+            upper = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=2)
+            expression &= (ds.field(CUR_USAGE_START) >= pa.scalar(lower, type=usage_type))
+            expression &= (ds.field(CUR_USAGE_START) < pa.scalar(upper, type=usage_type))
+
+        return expression
+
+    @staticmethod
+    def _aggregate_cur_batch(batch, start_date: str, end_date: str):
+        """Filter one record batch to the date range and sum it per CUR_GROUP_KEYS."""
+        num_rows = batch.num_rows
+        names = batch.schema.names
+
+        def column(key: str, default, value_type):
+            name = CUR_VALUE_COLUMNS[key]
+            if name not in names:
+                return pa.repeat(pa.scalar(default, type=value_type), num_rows)
+            return pc.fill_null(pc.cast(batch.column(name), value_type), default)
+
+        usage_start = batch.column(CUR_USAGE_START)
+        if pa.types.is_timestamp(usage_start.type) or pa.types.is_date(usage_start.type):
+            usage_date = pc.strftime(usage_start, format='%Y-%m-%d')
+        else:
+            # ISO strings ('2025-12-01T00:00:00Z' / '2025-12-01 00:00:00')
+            usage_date = pc.utf8_slice_codeunits(pc.cast(usage_start, pa.string()), 0, 10)
+
+        service_code = column('service_code', 'Unknown', pa.string())
+        service_code = pc.if_else(pc.equal(service_code, ''), 'Unknown', service_code)
+
+        table = pa.table({
+            'service_code': service_code,
+            'usage_date': usage_date,
+            'operation': column('operation', '', pa.string()),
+            'usage_type': column('usage_type', '', pa.string()),
+            'cost': column('cost', 0.0, pa.float64()),
+            'usage_amount': column('usage_amount', 0.0, pa.float64()),
+            'line_items': pa.repeat(pa.scalar(1, type=pa.int64()), num_rows),
+        })
+
+        # Rows without a usage date are dropped, as the filter yields null for them
+        in_range = pc.and_(
+            pc.greater_equal(table['usage_date'], start_date),
+            pc.less_equal(table['usage_date'], end_date)
+        )
+        table = table.filter(in_range)
+
+        partial = table.group_by(CUR_GROUP_KEYS).aggregate([
+            ('cost', 'sum'),
+            ('usage_amount', 'sum'),
+            ('line_items', 'sum')
+        ])
+        # Output column order differs between pyarrow versions, so select by name
+        return pa.table({
+            **{key: partial[key] for key in CUR_GROUP_KEYS},
+            'cost': partial['cost_sum'],
+            'usage_amount': partial['usage_amount_sum'],
+            'line_items': partial['line_items_sum'],
+        })
+
     def aggregate_by_service(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Aggregate cost data by service.
@@ -537,7 +631,7 @@ class BillingService:
             'service_by_date': service_by_date,  # Add detailed breakdown
             'operations_by_service': operations_by_service,  # Operation-level detail
             'total_cost': total_cost,
-            'rows_processed': len(all_rows)
+            'rows_processed': sum(row.get('line_items', 1) for row in all_rows)
         }
 
 
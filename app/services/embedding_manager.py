@@ -39,25 +39,38 @@ class EmbeddingManager:
     DEFAULT_CHUNK_SIZE = 4000  # Characters per chunk (well under 8K token limit)
     DEFAULT_CHUNK_OVERLAP = 200  # Overlap between chunks
 
+    # Embeddings stored per executemany batch
+    STORE_BATCH_SIZE = int(os.getenv('NOVA_EMBED_STORE_BATCH_SIZE', '32'))
+
     # Sentence-ending patterns for smart chunking
     SENTENCE_END_PATTERN = re.compile(r'[.!?]\s+')
 
     def __init__(
         self,
         db: Database,
-        embeddings_service: Optional[NovaEmbeddingsService] = None
+        embeddings_service: Optional[NovaEmbeddingsService] = None,
+        max_concurrency: Optional[int] = None
     ):
         self.db = db
-        self.embeddings_service = embeddings_service or self._create_default_service()
+        self.embeddings_service = embeddings_service or self._create_default_service(max_concurrency)
+
+    def _create_default_service(self, max_concurrency: Optional[int] = None) -> NovaEmbeddingsService:
+        """
+        Create embeddings service from environment variables.
 
-    def _create_default_service(self) -> NovaEmbeddingsService:
-        """Create embeddings service from environment variables."""
+        max_concurrency overrides NOVA_EMBED_CONCURRENCY; it also sizes the
+        Bedrock client's connection pool, so it must be set here rather than
+        on the service afterwards.
+        """
         return NovaEmbeddingsService(
             region=os.getenv('AWS_REGION', 'us-east-1'),
             dimension=int(os.getenv('NOVA_EMBED_DIMENSION', '1024')),
             aws_access_key=os.getenv('AWS_ACCESS_KEY_ID'),
             aws_secret_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-            s3_bucket=os.getenv('S3_BUCKET_NAME')
+            s3_bucket=os.getenv('S3_BUCKET_NAME'),
+            max_concurrency=max_concurrency or int(os.getenv('NOVA_EMBED_CONCURRENCY', '4')),
+            requests_per_second=float(os.getenv('NOVA_EMBED_REQUESTS_PER_SECOND', '10')),
+            max_retries=int(os.getenv('NOVA_EMBED_MAX_RETRIES', '5'))
         )
 
     def _chunk_text(
@@ -118,6 +131,29 @@ class EmbeddingManager:
 
         return chunks
 
+    def embed_query(self, query: str) -> Tuple[List[float], Dict[str, Any]]:
+        """
+        Embed a search query, reusing cached vectors for repeated queries.
+
+        Returns:
+            (vector, cache_info) - see QueryEmbeddingCache.get_or_compute()
+        """
+        from app.services.query_embedding_cache import get_query_embedding_cache
+
+        cache = get_query_embedding_cache(self.db)
+        vector, info = cache.get_or_compute(
+            query,
+            model_id=self.embeddings_service.MODEL_ID,
+            dimension=self.embeddings_service.dimension,
+            purpose=EmbeddingPurpose.GENERIC_RETRIEVAL.value,
+            compute=self.embeddings_service.embed_query
+        )
+        stats = cache.get_stats()
+        info['hit'] = info['source'] != 'bedrock'
+        info['hit_rate'] = stats['hit_rate']
+        info['total_saved_ms'] = stats['saved_latency_ms']
+        return vector, info
+
     @staticmethod
     def _compute_hash(content: str) -> str:
         """Compute deterministic hash for content."""
@@ -161,39 +197,15 @@ class EmbeddingManager:
 
         model_name = self.embeddings_service.MODEL_ID
 
-        for chunk in chunks:
-            content_hash = self._compute_hash(chunk.text)
-
-            # Check if already embedded (idempotency)
-            if not force:
-                existing = self.db.get_embedding_by_hash(
-                    source_type='transcript',
-                    source_id=transcript_id,
-                    model_name=model_name,
-                    content_hash=content_hash
-                )
-                if existing:
-                    stats['skipped'] += 1
-                    continue
-
-            try:
-                # Generate embedding
-                embedding = self.embeddings_service.embed_text(chunk.text)
-
-                # Store embedding
-                self.db.create_nova_embedding(
-                    embedding_vector=embedding,
-                    source_type='transcript',
-                    source_id=transcript_id,
-                    model_name=model_name,
-                    content_hash=content_hash,
-                    file_id=transcript.get('file_id')
-                )
-                stats['embedded'] += 1
-
-            except NovaEmbeddingsError as e:
-                logger.error(f"Failed to embed chunk {chunk.chunk_index}: {e}")
-                stats['failed'] += 1
+        self._embed_batch(
+            contents=[chunk.text for chunk in chunks],
+            source_type='transcript',
+            source_id=transcript_id,
+            model_name=model_name,
+            file_id=transcript.get('file_id'),
+            force=force,
+            stats=stats
+        )
 
         stats['status'] = 'completed'
         return stats
@@ -230,6 +242,7 @@ class EmbeddingManager:
         }
 
         model_name = self.embeddings_service.MODEL_ID
+        contents: List[str] = []
 
         # Embed summary
         summary_result = job.get('summary_result')
@@ -243,15 +256,7 @@ class EmbeddingManager:
                 summary_text = str(summary_result)
 
             if summary_text:
-                self._embed_content(
-                    content=summary_text,
-                    source_type='nova_analysis',
-                    source_id=nova_job_id,
-                    model_name=model_name,
-                    file_id=job.get('file_id'),
-                    force=force,
-                    stats=stats
-                )
+                contents.append(summary_text)
 
         # Embed chapters
         chapters_result = job.get('chapters_result')
@@ -260,15 +265,7 @@ class EmbeddingManager:
                 content = f"Chapter: {chapter.get('title', 'Untitled')}\n"
                 content += f"Summary: {chapter.get('summary', '')}"
 
-                self._embed_content(
-                    content=content,
-                    source_type='nova_analysis',
-                    source_id=nova_job_id,
-                    model_name=model_name,
-                    file_id=job.get('file_id'),
-                    force=force,
-                    stats=stats
-                )
+                contents.append(content)
 
         # Embed elements
         elements_result = job.get('elements_result')
@@ -278,15 +275,7 @@ class EmbeddingManager:
                 content += f"Name: {element.get('name', '')}\n"
                 content += f"Description: {element.get('description', '')}"
 
-                self._embed_content(
-                    content=content,
-                    source_type='nova_analysis',
-                    source_id=nova_job_id,
-                    model_name=model_name,
-                    file_id=job.get('file_id'),
-                    force=force,
-                    stats=stats
-                )
+                contents.append(content)
 
         # Embed waterfall classification
         classification_result = job.get('waterfall_classification_result')
@@ -310,15 +299,17 @@ class EmbeddingManager:
                 f"Evidence: {', '.join(classification.get('evidence', []) or [])}"
             )
 
-            self._embed_content(
-                content=content,
-                source_type='nova_analysis',
-                source_id=nova_job_id,
-                model_name=model_name,
-                file_id=job.get('file_id'),
-                force=force,
-                stats=stats
-            )
+            contents.append(content)
+
+        self._embed_batch(
+            contents=contents,
+            source_type='nova_analysis',
+            source_id=nova_job_id,
+            model_name=model_name,
+            file_id=job.get('file_id'),
+            force=force,
+            stats=stats
+        )
 
         stats['status'] = 'completed'
         return stats
@@ -334,33 +325,67 @@ class EmbeddingManager:
         stats: Dict[str, int]
     ):
         """Helper to embed a single piece of content."""
-        if not content or not content.strip():
+        self._embed_batch([content], source_type, source_id, model_name, file_id, force, stats)
+
+    def _embed_batch(
+        self,
+        contents: List[str],
+        source_type: str,
+        source_id: int,
+        model_name: str,
+        file_id: Optional[int],
+        force: bool,
+        stats: Dict[str, int]
+    ):
+        """
+        Embed and store all contents for one source.
+
+        Already-embedded hashes are found with a single lookup, the remaining
+        texts are embedded concurrently by the service, and results are stored
+        with one executemany insert per batch of STORE_BATCH_SIZE.
+        """
+        contents = [c for c in contents if c and c.strip()]
+        if not contents:
             return
 
-        content_hash = self._compute_hash(content)
+        # Hash and de-duplicate (repeated chapters/elements hash identically)
+        pending: Dict[str, str] = {}
+        for content in contents:
+            pending.setdefault(self._compute_hash(content), content)
 
         if not force:
-            existing = self.db.get_embedding_by_hash(
-                source_type=source_type,
-                source_id=source_id,
-                model_name=model_name,
-                content_hash=content_hash
-            )
-            if existing:
-                stats['skipped'] += 1
-                return
-
-        try:
-            embedding = self.embeddings_service.embed_text(content)
-            self.db.create_nova_embedding(
-                embedding_vector=embedding,
+            existing = self.db.get_existing_embedding_hashes(
                 source_type=source_type,
                 source_id=source_id,
                 model_name=model_name,
-                content_hash=content_hash,
-                file_id=file_id
+                content_hashes=list(pending)
             )
-            stats['embedded'] += 1
-        except NovaEmbeddingsError as e:
-            logger.error(f"Failed to embed content: {e}")
-            stats['failed'] += 1
+            stats['skipped'] += len(contents) - len(pending) + len(existing)
+            for content_hash in existing:
+                pending.pop(content_hash, None)
+        else:
+            stats['skipped'] += len(contents) - len(pending)
+
+        items = list(pending.items())
+        for start in range(0, len(items), self.STORE_BATCH_SIZE):
+            batch = items[start:start + self.STORE_BATCH_SIZE]
+            vectors = self.embeddings_service.embed_texts([content for _, content in batch])
+
+            rows = []
+            for (content_hash, _), vector in zip(batch, vectors):
+                if isinstance(vector, NovaEmbeddingsError):
+                    logger.error(f"Failed to embed content for {source_type} {source_id}: {vector}")
+                    stats['failed'] += 1
+                    continue
+                rows.append({
+                    'embedding_vector': vector,
+                    'source_type': source_type,
+                    'source_id': source_id,
+                    'model_name': model_name,
+                    'content_hash': content_hash,
+                    'file_id': file_id
+                })
+
+            inserted = self.db.create_nova_embeddings_batch(rows)
+            stats['embedded'] += inserted
+            stats['skipped'] += len(rows) - inserted
@@ -38,6 +38,7 @@ class ImportService:
                 # Import these here to avoid circular imports
                 from app.utils.validators import get_file_type, ValidationError
                 from app.utils.media_metadata import extract_media_metadata, MediaMetadataError
+                from app.utils.directory_walker import walk_files
 
                 try:
                     # Update job status
@@ -57,18 +58,45 @@ class ImportService:
                     errors = []
                     scanned = 0
 
-                    # First pass: count total files to scan
-                    total_files = 0
-                    if recursive:
-                        for root, dirs, files in os.walk(directory_path, followlinks=True):
-                            total_files += len(files)
-                    else:
-                        total_files = sum(1 for entry in os.scandir(directory_path) if entry.is_file())
-
-                    self.db.update_import_job_progress(job_id, total_files=total_files)
+                    # One lookup for everything already imported under this
+                    # directory instead of a query per file
+                    self.db.update_import_job(job_id, {
+                        'current_operation': 'Loading existing files...'
+                    })
+                    existing_paths = self.db.get_local_paths_under(os.path.abspath(directory_path))
+
+                    batch_size = self._get_batch_size()
+                    pending_records = []
+                    walk_stats = {}
+
+                    def flush_pending():
+                        nonlocal imported
+                        if pending_records:
+                            imported += self.db.create_source_files_bulk(pending_records)
+                            pending_records.clear()
+
+                    def estimated_total() -> int:
+                        # No separate count pass: extrapolate from the
+                        # directories listed so far (exact once the walk ends)
+                        listed = walk_stats.get('directories_listed', 0)
+                        found = walk_stats.get('directories_found', 0)
+                        if not listed:
+                            return scanned
+                        return max(scanned, round(scanned * found / listed))
+
+                    def update_progress(filename: str):
+                        self.db.update_import_job_progress(
+                            job_id,
+                            files_scanned=scanned,
+                            files_imported=imported,
+                            files_skipped_existing=skipped_existing,
+                            files_skipped_unsupported=skipped_unsupported,
+                            total_files=estimated_total(),
+                            current_operation=f'Importing files... ({filename})'
+                        )
 
                     def handle_file(file_path: str):
-                        nonlocal imported, skipped_existing, skipped_unsupported, scanned, errors
+                        nonlocal skipped_existing, skipped_unsupported, scanned, errors
 
                         # Check for cancellation
                         if self.db.is_import_job_cancelled(job_id):
@@ -82,46 +110,16 @@ class ImportService:
                             file_type = get_file_type(filename, allowed_video, allowed_image)
                         except ValidationError:
                             skipped_unsupported += 1
-                            # Update progress every 10 files
-                            if scanned % 10 == 0:
-                                self.db.update_import_job_progress(
-                                    job_id,
-                                    files_scanned=scanned,
-                                    files_imported=imported,
-                                    files_skipped_existing=skipped_existing,
-                                    files_skipped_unsupported=skipped_unsupported,
-                                    current_operation=f'Importing files... ({filename})'
-                                )
                             return True
 
-                        if self.db.get_file_by_local_path(abs_path):
+                        if abs_path in existing_paths:
                             skipped_existing += 1
-                            # Update progress every 10 files
-                            if scanned % 10 == 0:
-                                self.db.update_import_job_progress(
-                                    job_id,
-                                    files_scanned=scanned,
-                                    files_imported=imported,
-                                    files_skipped_existing=skipped_existing,
-                                    files_skipped_unsupported=skipped_unsupported,
-                                    current_operation=f'Importing files... ({filename})'
-                                )
                             return True
 
                         try:
                             file_stat = os.stat(abs_path)
                         except OSError as e:
                             errors.append({'path': abs_path, 'error': str(e)})
-                            # Update progress every 10 files
-                            if scanned % 10 == 0:
-                                self.db.update_import_job_progress(
-                                    job_id,
-                                    files_scanned=scanned,
-                                    files_imported=imported,
-                                    files_skipped_existing=skipped_existing,
-                                    files_skipped_unsupported=skipped_unsupported,
-                                    current_operation=f'Importing files... ({filename})'
-                                )
                             return True
 
                         content_type = mimetypes.guess_type(abs_path)[0] or 'application/octet-stream'
@@ -132,74 +130,47 @@ class ImportService:
                         except MediaMetadataError:
                             pass  # Continue without metadata
 
-                        self.db.create_source_file(
-                            filename=filename,
-                            s3_key=None,
-                            file_type=file_type,
-                            size_bytes=file_stat.st_size,
-                            content_type=content_type,
-                            local_path=abs_path,
-                            resolution_width=media_metadata.get('resolution_width'),
-                            resolution_height=media_metadata.get('resolution_height'),
-                            frame_rate=media_metadata.get('frame_rate'),
-                            codec_video=media_metadata.get('codec_video'),
-                            codec_audio=media_metadata.get('codec_audio'),
-                            duration_seconds=media_metadata.get('duration_seconds'),
-                            bitrate=media_metadata.get('bitrate'),
-                            metadata={
+                        pending_records.append({
+                            'filename': filename,
+                            's3_key': None,
+                            'file_type': file_type,
+                            'size_bytes': file_stat.st_size,
+                            'content_type': content_type,
+                            'local_path': abs_path,
+                            'resolution_width': media_metadata.get('resolution_width'),
+                            'resolution_height': media_metadata.get('resolution_height'),
+                            'frame_rate': media_metadata.get('frame_rate'),
+                            'codec_video': media_metadata.get('codec_video'),
+                            'codec_audio': media_metadata.get('codec_audio'),
+                            'duration_seconds': media_metadata.get('duration_seconds'),
+                            'bitrate': media_metadata.get('bitrate'),
+                            'metadata': {
                                 'imported_from': 'directory',
                                 'source_directory': directory_path,
                                 'original_size_bytes': file_stat.st_size,
                                 'file_mtime': file_stat.st_mtime,
                                 'file_ctime': file_stat.st_ctime
                             }
-                        )
-                        imported += 1
+                        })
+                        # A symlinked directory can reach the same path twice
+                        existing_paths.add(abs_path)
 
+                        if len(pending_records) >= batch_size:
+                            flush_pending()
+                        return True
+
+                    # Single pass: directories are listed in parallel as files stream in
+                    for walked in walk_files(directory_path, recursive=recursive,
+                                             stat_files=False, follow_symlinks=True,
+                                             stats=walk_stats):
+                        if not handle_file(walked.path):
+                            break
                         # Update progress every 10 files
                         if scanned % 10 == 0:
-                            self.db.update_import_job_progress(
-                                job_id,
-                                files_scanned=scanned,
-                                files_imported=imported,
-                                files_skipped_existing=skipped_existing,
-                                files_skipped_unsupported=skipped_unsupported,
-                                current_operation=f'Importing files... ({filename})'
-                            )
-
-                        return True
+                            update_progress(walked.name)
 
-                    # Process files
-                    cancelled = False
-                    if recursive:
-                        seen_dirs = set()
-                        for root, dirs, files in os.walk(directory_path, followlinks=True):
-                            real_root = os.path.realpath(root)
-                            if real_root in seen_dirs:
-                                dirs[:] = []
-                                continue
-                            seen_dirs.add(real_root)
-
-                            pruned_dirs = []
-                            for name in dirs:
-                                real_path = os.path.realpath(os.path.join(root, name))
-                                if real_path not in seen_dirs:
-                                    pruned_dirs.append(name)
-                            dirs[:] = pruned_dirs
-
-                            for name in files:
-                                if not handle_file(os.path.join(root, name)):
-                                    cancelled = True
-                                    break
-
-                            if cancelled:
-                                break
-                    else:
-                        for entry in os.scandir(directory_path):
-                            if entry.is_file():
-                                if not handle_file(entry.path):
-                                    cancelled = True
-                                    break
+                    # Rows from a cancelled job are kept, as before batching
+                    flush_pending()
 
                     # Final progress update
                     self.db.update_import_job_progress(
@@ -208,6 +179,7 @@ class ImportService:
                         files_imported=imported,
                         files_skipped_existing=skipped_existing,
                         files_skipped_unsupported=skipped_unsupported,
+                        total_files=scanned,
                         current_operation='Completed'
                     )
 
@@ -237,6 +209,14 @@ class ImportService:
         thread = threading.Thread(target=_run_job, daemon=True)
         thread.start()
 
+    @staticmethod
+    def _get_batch_size() -> int:
+        """New file rows per insert transaction (IMPORT_BATCH_SIZE, default 200)."""
+        try:
+            return max(1, int(os.getenv('IMPORT_BATCH_SIZE', '')))
+        except ValueError:
+            return 200
+
     @staticmethod
     def generate_job_id() -> str:
         """Generate a unique job ID."""
@@ -6,13 +6,20 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingPurpose(Enum):
     GENERIC_INDEX = "GENERIC_INDEX"
@@ -27,6 +34,37 @@ class NovaEmbeddingsError(Exception):
     pass
 
 
+class NovaEmbeddingsThrottledError(NovaEmbeddingsError):
+    """Bedrock throttled the request; safe to retry after backoff."""
+    pass
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting request rate across worker threads."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class NovaEmbeddingsService:
     """Service for generating Nova embeddings via Bedrock."""
 
@@ -42,13 +80,24 @@ class NovaEmbeddingsService:
     # Supported dimensions
     VALID_DIMENSIONS = [256, 384, 1024, 3072]
 
+    # Error codes worth retrying with backoff
+    THROTTLING_ERROR_CODES = (
+        'ThrottlingException',
+        'TooManyRequestsException',
+        'ServiceUnavailableException',
+        'ModelNotReadyException',
+    )
+
     def __init__(
         self,
         region: str = "us-east-1",
         dimension: int = 1024,
         aws_access_key: Optional[str] = None,
         aws_secret_key: Optional[str] = None,
-        s3_bucket: Optional[str] = None
+        s3_bucket: Optional[str] = None,
+        max_concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        max_retries: int = 5
     ):
         if dimension not in self.VALID_DIMENSIONS:
             raise ValueError(f"Invalid dimension {dimension}. Must be one of {self.VALID_DIMENSIONS}")
@@ -58,7 +107,13 @@ class NovaEmbeddingsService:
             session_kwargs['aws_access_key_id'] = aws_access_key
             session_kwargs['aws_secret_access_key'] = aws_secret_key
 
-        self.client = boto3.client('bedrock-runtime', **session_kwargs)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max(0, int(max_retries))
+        self.rate_limiter = TokenBucket(requests_per_second)
+
+        # Size the HTTP pool so concurrent workers don't queue on connections
+        client_config = Config(max_pool_connections=max(10, self.max_concurrency))
+        self.client = boto3.client('bedrock-runtime', config=client_config, **session_kwargs)
         self.dimension = dimension
         self.s3_bucket = s3_bucket
         self.region = region
@@ -142,6 +197,9 @@ class NovaEmbeddingsService:
                 contentType='application/json'
             )
         except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code')
+            if error_code in self.THROTTLING_ERROR_CODES:
+                raise NovaEmbeddingsThrottledError(f"Nova embeddings request throttled: {e}")
             raise NovaEmbeddingsError(f"Nova embeddings request failed: {e}")
 
         body = response.get('body')
@@ -155,6 +213,57 @@ class NovaEmbeddingsService:
 
         return self._extract_embedding(data)
 
+    def _embed_text_with_retry(
+        self,
+        text: str,
+        purpose: EmbeddingPurpose = EmbeddingPurpose.GENERIC_INDEX
+    ) -> List[float]:
+        """Rate-limited embed_text() that retries throttling with exponential backoff."""
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                return self.embed_text(text, purpose)
+            except NovaEmbeddingsThrottledError:
+                if attempt >= self.max_retries:
+                    raise
+                sleep_seconds = min(30.0, 0.5 * (2 ** attempt)) * (0.5 + random.random() / 2)
+                logger.warning(
+                    "Nova embeddings throttled. Retrying in %.1fs (attempt %s/%s).",
+                    sleep_seconds,
+                    attempt + 1,
+                    self.max_retries
+                )
+                time.sleep(sleep_seconds)
+                attempt += 1
+
+    def embed_texts(
+        self,
+        texts: List[str],
+        purpose: EmbeddingPurpose = EmbeddingPurpose.GENERIC_INDEX
+    ) -> List[Union[List[float], NovaEmbeddingsError]]:
+        """
+        Generate embeddings for many texts concurrently.
+
+        Calls run on a bounded thread pool (max_concurrency), share one token
+        bucket (requests_per_second) and retry throttling errors.
+
+        Returns:
+            List aligned with texts; each item is the embedding vector or the
+            NovaEmbeddingsError raised for that text.
+        """
+        def _embed(text: str) -> Union[List[float], NovaEmbeddingsError]:
+            try:
+                return self._embed_text_with_retry(text, purpose)
+            except NovaEmbeddingsError as e:
+                return e
+
+        if len(texts) <= 1 or self.max_concurrency == 1:
+            return [_embed(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(texts))) as executor:
+            return list(executor.map(_embed, texts))
+
     def embed_query(self, query: str) -> List[float]:
         """Generate embedding for a search query (optimized for retrieval)."""
         return self.embed_text(query, purpose=EmbeddingPurpose.GENERIC_RETRIEVAL)
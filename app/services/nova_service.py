@@ -8,9 +8,10 @@ import json
 import boto3
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from botocore.exceptions import ClientError
 from botocore.config import Config
-from typing import Dict, Any, Optional, List, Tuple, Callable, TYPE_CHECKING
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Callable, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -676,11 +677,98 @@ class NovaVideoService:
             'raw': response
         }
 
+    # Read size for streaming batch output objects line by line
+    BATCH_OUTPUT_READ_CHUNK_BYTES = 1024 * 1024
+
     def fetch_batch_results(self, s3_prefix: str, model: str,
                             analysis_types: List[str],
                             options: Dict[str, Any],
                             record_prefix: Optional[str] = None) -> Dict[str, Any]:
         """Fetch and parse batch results from S3."""
+        record_outputs = dict(self.iter_batch_records(s3_prefix, record_prefix))
+        return self.build_batch_results(record_outputs, model, analysis_types, options, s3_prefix)
+
+    def iter_batch_records(self, s3_prefix: str,
+                           record_prefix: Optional[str] = None,
+                           stats: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream (record_id, model output) pairs from a batch job's output objects.
+
+        Every object under the prefix is listed (paginated) and each
+        .jsonl/.jsonl.out body is read line by line, so memory stays bounded
+        by one record. With record_prefix, lines that can't hold a matching
+        recordId are skipped before JSON decoding, and the prefix is stripped
+        from the yielded record ids.
+
+        Args:
+            stats: Updated in place with 'objects', 'bytes' and 'records'
+                (records yielded)
+        """
+        if stats is not None:
+            for counter in ('objects', 'bytes', 'records'):
+                stats.setdefault(counter, 0)
+
+        if record_prefix is not None and not isinstance(record_prefix, str):
+            record_prefix = str(record_prefix)
+
+        # A line whose recordId starts with the prefix contains it as the
+        # opening of a JSON string; only trust that for prefixes JSON
+        # encodes verbatim
+        needle = None
+        if record_prefix and record_prefix.isascii() and json.dumps(record_prefix)[1:-1] == record_prefix:
+            needle = f'"{record_prefix}'.encode('utf-8')
+
+        prefix = self._normalize_s3_prefix(s3_prefix)
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                # Batch outputs end in .jsonl.out
+                if not (key.endswith('.jsonl') or key.endswith('.jsonl.out')):
+                    continue
+
+                body = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)['Body']
+                if stats is not None:
+                    stats['objects'] += 1
+                    stats['bytes'] += obj.get('Size', 0)
+                try:
+                    for line in body.iter_lines(chunk_size=self.BATCH_OUTPUT_READ_CHUNK_BYTES):
+                        if not line.strip():
+                            continue
+                        if needle is not None and needle not in line:
+                            continue
+                        try:
+                            payload = json.loads(line)
+                        except ValueError:
+                            continue
+                        record_id = payload.get('recordId') or payload.get('record_id')
+                        if not record_id:
+                            continue
+                        if record_prefix:
+                            if not isinstance(record_id, str):
+                                record_id = str(record_id)
+                            if not record_id.startswith(record_prefix):
+                                continue
+                            record_id = record_id[len(record_prefix):]
+                        output = payload.get('modelOutput') or payload.get('output') or payload.get('response') or {}
+                        if stats is not None:
+                            stats['records'] += 1
+                        yield record_id, output
+                finally:
+                    body.close()
+
+    def build_batch_results(self, record_outputs: Dict[str, Any], model: str,
+                            analysis_types: List[str],
+                            options: Dict[str, Any],
+                            s3_prefix: str = '') -> Dict[str, Any]:
+        """
+        Build analysis results from one file's batch record outputs.
+
+        Args:
+            record_outputs: Record id (without file prefix) -> model output,
+                e.g. from iter_batch_records()
+            s3_prefix: Output location, used in log messages
+        """
         requested_types, effective_types, use_combined = self._resolve_analysis_types(analysis_types)
         results = {
             'model': model,
@@ -693,40 +781,6 @@ class NovaVideoService:
         total_tokens = 0
         total_cost = 0.0
 
-        prefix = self._normalize_s3_prefix(s3_prefix)
-        response = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
-        objects = response.get('Contents', [])
-
-        lines = []
-        for obj in objects:
-            key = obj['Key']
-            # Batch outputs end in .jsonl.out
-            if not (key.endswith('.jsonl') or key.endswith('.jsonl.out')):
-                continue
-            obj_data = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            body = obj_data['Body'].read().decode('utf-8')
-            lines.extend([line for line in body.splitlines() if line.strip()])
-
-        record_outputs = {}
-        if record_prefix is not None and not isinstance(record_prefix, str):
-            record_prefix = str(record_prefix)
-        for line in lines:
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            record_id = payload.get('recordId') or payload.get('record_id')
-            if not record_id:
-                continue
-            if record_prefix:
-                if not isinstance(record_id, str):
-                    record_id = str(record_id)
-                if not record_id.startswith(record_prefix):
-                    continue
-                record_id = record_id[len(record_prefix):]
-            output = payload.get('modelOutput') or payload.get('output') or payload.get('response') or {}
-            record_outputs[record_id] = output
-
         if use_combined and 'combined' in record_outputs:
             output = record_outputs['combined']
             combined_text = self._extract_text_from_batch_output(output) or '{}'
@@ -1360,6 +1414,12 @@ class NovaVideoService:
         """
         Analyze long video using chunking strategy.
 
+        The source is downloaded once, all chunks are cut from it and uploaded
+        in parallel, then analyzed concurrently (NOVA_CHUNK_CONCURRENCY, or
+        options['chunk_concurrency']). With options['sequential_chunks'] the
+        chunks are analyzed one at a time, each with the previous chunk's
+        results as context.
+
         Args:
             s3_key: S3 key of the video
             model: Nova model to use
@@ -1383,45 +1443,66 @@ class NovaVideoService:
         if progress_callback:
             progress_callback(0, total_chunks, f"Splitting video into {total_chunks} chunks")
 
-        # Process each chunk
-        chunk_results = []
         chunk_s3_keys = []  # Track chunk files for cleanup
 
         try:
-            for i, chunk in enumerate(chunks):
-                chunk_index = chunk['index']
-                logger.info(f"Processing chunk {chunk_index + 1}/{total_chunks}")
-
-                if progress_callback:
-                    progress_callback(
-                        chunk_index,
-                        total_chunks,
-                        f"Processing chunk {chunk_index + 1}/{total_chunks}"
-                    )
-
-                # Extract video chunk
-                chunk_s3_key = self.chunker.get_chunk_s3_key(s3_key, chunk_index)
-                self.chunker.extract_video_segment(
-                    s3_key=s3_key,
-                    start_time=chunk['overlap_start'],
-                    end_time=chunk['overlap_end'],
-                    output_s3_key=chunk_s3_key
-                )
-                chunk_s3_keys.append(chunk_s3_key)
+            chunk_key_map = self.chunker.extract_video_segments(
+                s3_key, chunks,
+                upload_workers=int(os.getenv('NOVA_CHUNK_UPLOAD_CONCURRENCY', '4'))
+            )
+            chunk_s3_keys = list(chunk_key_map.values())
 
-                # Analyze chunk
-                chunk_result = self._analyze_chunk(
-                    chunk_s3_key=chunk_s3_key,
+            def analyze(chunk: Dict[str, Any], previous_context: Optional[Dict[str, Any]] = None):
+                return self._analyze_chunk(
+                    chunk_s3_key=chunk_key_map[chunk['index']],
                     chunk=chunk,
-                    chunk_index=chunk_index,
+                    chunk_index=chunk['index'],
                     total_chunks=total_chunks,
                     model=model,
                     analysis_types=analysis_types,
                     options=options,
-                    previous_context=chunk_results[-1] if chunk_results else None
+                    previous_context=previous_context
                 )
 
-                chunk_results.append(chunk_result)
+            # Process each chunk
+            chunk_results = []
+            if options.get('sequential_chunks'):
+                for chunk in chunks:
+                    chunk_index = chunk['index']
+                    logger.info(f"Processing chunk {chunk_index + 1}/{total_chunks}")
+                    if progress_callback:
+                        progress_callback(
+                            chunk_index,
+                            total_chunks,
+                            f"Processing chunk {chunk_index + 1}/{total_chunks}"
+                        )
+                    chunk_results.append(analyze(chunk, chunk_results[-1] if chunk_results else None))
+            else:
+                concurrency = int(
+                    options.get('chunk_concurrency') or os.getenv('NOVA_CHUNK_CONCURRENCY', '4')
+                )
+                concurrency = max(1, min(concurrency, total_chunks))
+                logger.info(f"Analyzing {total_chunks} chunks with {concurrency} workers")
+                if progress_callback:
+                    progress_callback(0, total_chunks, f"Analyzing {total_chunks} chunks")
+
+                # Callbacks run on this thread only; they may touch the database
+                pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='nova-chunk')
+                try:
+                    futures = [pool.submit(analyze, chunk) for chunk in chunks]
+                    for future in as_completed(futures):
+                        chunk_results.append(future.result())
+                        logger.info(f"Finished chunk {len(chunk_results)}/{total_chunks}")
+                        if progress_callback:
+                            progress_callback(
+                                len(chunk_results),
+                                total_chunks,
+                                f"Analyzed {len(chunk_results)}/{total_chunks} chunks"
+                            )
+                finally:
+                    # On failure, don't start chunks that are still queued
+                    pool.shutdown(wait=True, cancel_futures=True)
+                chunk_results.sort(key=lambda r: r['chunk_index'])
 
             # Aggregate results
             if progress_callback:
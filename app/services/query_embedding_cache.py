@@ -0,0 +1,193 @@
+"""
+Query embedding cache - two-tier (in-memory LRU + SQLite) cache for search query vectors.
+
+Semantic search embeds the query text with a live Bedrock call. The vector for a
+given (normalized query, model, dimension, purpose) never changes, so paging and
+repeated searches can reuse it.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU cache of query embeddings backed by the query_embedding_cache table."""
+
+    # Prune the persistent table every N stores
+    PRUNE_EVERY = 50
+
+    def __init__(
+        self,
+        db,
+        memory_size: int = 256,
+        max_entries: int = 5000,
+        ttl_seconds: float = 7 * 24 * 3600
+    ):
+        self.db = db
+        self.memory_size = max(0, int(memory_size))
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: OrderedDict[str, Tuple[List[float], float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stores_since_prune = 0
+        self._stats = {
+            'memory_hits': 0,
+            'db_hits': 0,
+            'misses': 0,
+            'saved_latency_ms': 0.0,
+            'embed_latency_ms': 0.0,
+        }
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize query text so trivially different inputs share an entry."""
+        return re.sub(r'\s+', ' ', (query or '').strip().lower())
+
+    @staticmethod
+    def make_key(normalized_query: str, model_id: str, dimension: int, purpose: str) -> str:
+        """Build the cache key for a normalized query."""
+        raw = f"{normalized_query}|{model_id}|{dimension}|{purpose}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _remember(self, key: str, vector: List[float], latency_ms: float, created_at: float):
+        if not self.memory_size:
+            return
+        with self._lock:
+            self._memory[key] = (vector, latency_ms, created_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get_or_compute(
+        self,
+        query: str,
+        model_id: str,
+        dimension: int,
+        purpose: str,
+        compute: Callable[[str], List[float]]
+    ) -> Tuple[List[float], Dict[str, Any]]:
+        """
+        Return the embedding for query, calling compute() only on a cache miss.
+
+        Returns:
+            (vector, info) where info has 'source' (memory/db/bedrock),
+            'lookup_ms', 'embed_ms' and 'saved_ms'.
+        """
+        start = time.perf_counter()
+        normalized = self.normalize_query(query)
+        key = self.make_key(normalized, model_id, dimension, purpose)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and now - entry[2] <= self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                self._stats['saved_latency_ms'] += entry[1] or 0.0
+                return entry[0], {
+                    'source': 'memory',
+                    'lookup_ms': round((time.perf_counter() - start) * 1000, 2),
+                    'embed_ms': 0.0,
+                    'saved_ms': round(entry[1] or 0.0, 2),
+                }
+            if entry:
+                del self._memory[key]
+
+        try:
+            row = self.db.get_cached_query_embedding(key, max_age_seconds=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Query embedding cache lookup failed: {e}")
+            row = None
+
+        if row and row.get('dimension') == dimension:
+            blob = row['embedding']
+            vector = list(struct.unpack(f'{len(blob) // 4}f', blob))
+            latency_ms = row.get('embed_latency_ms') or 0.0
+            self._remember(key, vector, latency_ms, row['created_at'])
+            with self._lock:
+                self._stats['db_hits'] += 1
+                self._stats['saved_latency_ms'] += latency_ms
+            return vector, {
+                'source': 'db',
+                'lookup_ms': round((time.perf_counter() - start) * 1000, 2),
+                'embed_ms': 0.0,
+                'saved_ms': round(latency_ms, 2),
+            }
+
+        lookup_ms = (time.perf_counter() - start) * 1000
+        embed_start = time.perf_counter()
+        vector = compute(query)
+        embed_ms = (time.perf_counter() - embed_start) * 1000
+
+        self._remember(key, vector, embed_ms, now)
+        with self._lock:
+            self._stats['misses'] += 1
+            self._stats['embed_latency_ms'] += embed_ms
+            self._stores_since_prune += 1
+            should_prune = self._stores_since_prune >= self.PRUNE_EVERY
+            if should_prune:
+                self._stores_since_prune = 0
+
+        try:
+            self.db.store_query_embedding(
+                cache_key=key,
+                normalized_query=normalized,
+                model_id=model_id,
+                dimension=dimension,
+                purpose=purpose,
+                embedding=struct.pack(f'{len(vector)}f', *vector),
+                embed_latency_ms=embed_ms
+            )
+            if should_prune:
+                self.db.prune_query_embedding_cache(self.max_entries, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Query embedding cache store failed: {e}")
+
+        return vector, {
+            'source': 'bedrock',
+            'lookup_ms': round(lookup_ms, 2),
+            'embed_ms': round(embed_ms, 2),
+            'saved_ms': 0.0,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get in-process hit/miss counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['db_hits'] + stats['misses']
+        hits = stats['memory_hits'] + stats['db_hits']
+        stats['hit_rate'] = round(hits / lookups, 4) if lookups else 0.0
+        stats['saved_latency_ms'] = round(stats['saved_latency_ms'], 2)
+        stats['embed_latency_ms'] = round(stats['embed_latency_ms'], 2)
+        return stats
+
+
+# Process-wide instance (routes build a new EmbeddingManager per request)
+_cache_instance: Optional[QueryEmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache(db) -> QueryEmbeddingCache:
+    """Get the shared QueryEmbeddingCache, creating it from environment settings."""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None or _cache_instance.db is not db:
+            _cache_instance = QueryEmbeddingCache(
+                db,
+                memory_size=int(os.getenv('QUERY_EMBED_CACHE_MEMORY_SIZE', '256')),
+                max_entries=int(os.getenv('QUERY_EMBED_CACHE_MAX_ENTRIES', '5000')),
+                ttl_seconds=float(os.getenv('QUERY_EMBED_CACHE_TTL_SECONDS', str(7 * 24 * 3600)))
+            )
+        return _cache_instance
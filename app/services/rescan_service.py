@@ -11,11 +11,16 @@ This service handles:
 import os
 import mimetypes
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Callable
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterator
 from datetime import datetime
 import uuid
 import threading
 
+from app.utils.content_fingerprint import compute_content_fingerprints
+from app.utils.directory_walker import (
+    WalkedFile, extension_filter, scan_directory_entries, walk_files
+)
+
 
 class RescanService:
     """Service for rescanning directories and reconciling file changes."""
@@ -24,32 +29,34 @@ class RescanService:
         """Initialize the rescan service with a database instance and optional app."""
         self.db = db
         self.app = app
+        self.last_scan_stats: Dict[str, int] = {}
 
     @staticmethod
     def get_file_fingerprint(filename: str, size_bytes: int, mtime: float) -> str:
         """Generate a fingerprint for file matching."""
         return f"{filename}|{size_bytes}|{int(mtime)}"
 
-    def scan_directory(self, directory_path: str, recursive: bool = True) -> List[Dict[str, Any]]:
+    def scan_directory(self, directory_path: str, recursive: bool = True,
+                       use_index: bool = True) -> List[Dict[str, Any]]:
         """
         Scan directory and return list of discovered files with fingerprints.
 
         Args:
             directory_path: Directory to scan
             recursive: Whether to scan subdirectories
+            use_index: Skip directories unchanged since the last scan (see _walk_directory)
 
         Returns:
             List of file dictionaries with metadata and fingerprints
         """
-        discovered_files = []
-        directory = Path(directory_path)
+        return self._walk_directory(directory_path, recursive=recursive, use_index=use_index)
 
-        if not directory.exists():
-            raise ValueError(f"Directory does not exist: {directory_path}")
-
-        if not directory.is_dir():
-            raise ValueError(f"Path is not a directory: {directory_path}")
+    # Reuse a directory's index row only if it was written this long after the
+    # directory's mtime (coarse mtimes can hide a change made during the scan)
+    SCAN_INDEX_MTIME_SLACK_SECONDS = 2.0
 
+    def _get_supported_extensions(self) -> set:
+        """Supported media extensions (with dot) from app config or defaults."""
         # Get allowed extensions from app config or use defaults
         if self.app:
             allowed_video = self.app.config.get('ALLOWED_VIDEO_EXTENSIONS',
@@ -61,37 +68,110 @@ class RescanService:
             allowed_image = {'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp'}
 
         # Build supported extensions set (config uses no dots, add dot prefix)
-        supported_extensions = {f'.{ext}' for ext in allowed_video | allowed_image}
+        return {f'.{ext}' for ext in allowed_video | allowed_image}
 
-        # Scan directory
-        pattern = '**/*' if recursive else '*'
-        for file_path in directory.glob(pattern):
-            if not file_path.is_file():
-                continue
+    def _walk_directory(self, directory_path: str, recursive: bool = True,
+                        use_index: bool = True,
+                        should_cancel: Optional[Callable[[], bool]] = None,
+                        on_progress: Optional[Callable[[int], None]] = None) -> List[Dict[str, Any]]:
+        """Collect iter_directory_files() into a list, reporting the running count."""
+        discovered_files = []
+        for file_info in self.iter_directory_files(directory_path, recursive, use_index, should_cancel):
+            discovered_files.append(file_info)
+            if on_progress:
+                on_progress(len(discovered_files))
+        return discovered_files
+
+    def iter_directory_files(self, directory_path: str, recursive: bool = True,
+                             use_index: bool = True,
+                             should_cancel: Optional[Callable[[], bool]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream supported files under a directory, reusing the persisted scan index.
+
+        Directories are listed in parallel by the shared walker
+        (app.utils.directory_walker). A directory whose mtime matches its index
+        row is not listed again: its stored file list is reused and only its
+        subdirectories are visited. Adding, removing or renaming an entry
+        updates a directory's mtime, so this finds new, deleted and moved
+        files; a file rewritten in place keeps its indexed size/mtime until its
+        directory changes (use use_index=False to force a full walk).
 
-            # Check if supported file type
-            if file_path.suffix.lower() not in supported_extensions:
-                continue
+        When the walk completes, the index is updated and self.last_scan_stats
+        is set (directories_scanned, directories_skipped, files_found).
 
+        Yields:
+            File dictionaries with metadata and fingerprints
+        """
+        directory = Path(directory_path)
+
+        if not directory.exists():
+            raise ValueError(f"Directory does not exist: {directory_path}")
+
+        if not directory.is_dir():
+            raise ValueError(f"Path is not a directory: {directory_path}")
+
+        supported_extensions = self._get_supported_extensions()
+        signature = ','.join(sorted(supported_extensions))
+        is_supported = extension_filter(supported_extensions)
+        root = os.path.abspath(directory_path)
+        index = self.db.get_directory_scan_index(root, signature) if use_index else {}
+
+        updated_entries = {}
+        visited = set()
+        stats = {'directories_scanned': 0, 'directories_skipped': 0, 'files_found': 0}
+        lock = threading.Lock()
+
+        def list_directory(current: str):
+            """Runs on walker threads."""
+            with lock:
+                visited.add(current)
             try:
-                stat = file_path.stat()
-                discovered_files.append({
-                    'path': str(file_path.absolute()),
-                    'filename': file_path.name,
-                    'size_bytes': stat.st_size,
-                    'mtime': stat.st_mtime,
-                    'fingerprint': self.get_file_fingerprint(
-                        file_path.name,
-                        stat.st_size,
-                        stat.st_mtime
-                    )
-                })
-            except (OSError, PermissionError) as e:
-                # Skip files that can't be accessed
-                print(f"Warning: Could not access {file_path}: {e}")
-                continue
+                mtime = os.stat(current).st_mtime
+            except OSError as e:
+                print(f"Warning: Could not access {current}: {e}")
+                return [], []
+
+            cached = index.get(current)
+            if (cached and cached['mtime'] == mtime
+                    and cached['scanned_at'] - mtime > self.SCAN_INDEX_MTIME_SLACK_SECONDS):
+                with lock:
+                    stats['directories_skipped'] += 1
+                files = [
+                    WalkedFile(os.path.join(current, name), name, size_bytes, file_mtime)
+                    for name, size_bytes, file_mtime in cached['files']
+                ]
+                return files, [os.path.join(current, name) for name in cached['subdirs']]
+
+            files, subdirs = scan_directory_entries(current, is_supported)
+            with lock:
+                stats['directories_scanned'] += 1
+                updated_entries[current] = {
+                    'mtime': mtime,
+                    'files': [[f.name, f.size, f.mtime] for f in files],
+                    'subdirs': [os.path.basename(path) for path in subdirs]
+                }
+            return files, subdirs
+
+        cancelled = False
+        for walked in walk_files(root, recursive=recursive, list_directory=list_directory,
+                                 should_cancel=should_cancel):
+            stats['files_found'] += 1
+            yield {
+                'path': walked.path,
+                'filename': walked.name,
+                'size_bytes': walked.size,
+                'mtime': walked.mtime,
+                'fingerprint': self.get_file_fingerprint(walked.name, walked.size, walked.mtime)
+            }
+        if should_cancel and should_cancel():
+            cancelled = True
 
-        return discovered_files
+        self.last_scan_stats = stats
+
+        # A cancelled walk hasn't seen every directory, so keep the old index
+        if not cancelled:
+            stale = [path for path in index if path not in visited] if recursive else []
+            self.db.save_directory_scan_index(root, signature, updated_entries, stale)
 
     def get_database_files_for_directory(self, directory_path: str) -> List[Dict[str, Any]]:
         """
@@ -156,6 +236,8 @@ class RescanService:
                     file['size_bytes'],
                     mtime
                 ),
+                'content_fingerprint': file.get('content_fingerprint'),
+                'content_fingerprint_mtime': file.get('content_fingerprint_mtime'),
                 'has_proxy': has_proxy,
                 'has_analysis': has_analysis,
                 'has_transcripts': has_transcripts,
@@ -169,13 +251,16 @@ class RescanService:
         """Normalize path separators for consistent comparison."""
         return path.replace('\\', '/') if path else path
 
-    def reconcile(self, directory_path: str, mode: str = 'smart') -> Dict[str, List]:
+    def reconcile(self, directory_path: str, mode: str = 'smart',
+                  content_fingerprints: Optional[bool] = None) -> Dict[str, List]:
         """
         Main reconciliation logic.
 
         Args:
             directory_path: Directory to rescan
             mode: 'smart' (fingerprint matching) or 'simple' (delete & reimport)
+            content_fingerprints: Also match by partial content hash (see
+                _match_files()); default RESCAN_CONTENT_FINGERPRINTS
 
         Returns:
             Dictionary with categorized file changes:
@@ -191,6 +276,30 @@ class RescanService:
         disk_files = self.scan_directory(directory_path)
         db_files = self.get_database_files_for_directory(directory_path)
 
+        return self._match_files(disk_files, db_files, mode,
+                                 self._use_content_fingerprints(content_fingerprints))
+
+    def _use_content_fingerprints(self, content_fingerprints: Optional[bool]) -> bool:
+        """Explicit flag, else RESCAN_CONTENT_FINGERPRINTS (default off)."""
+        if content_fingerprints is not None:
+            return content_fingerprints
+        return os.getenv('RESCAN_CONTENT_FINGERPRINTS', 'false').lower() in ('1', 'true', 'yes')
+
+    def _match_files(self, disk_files: List[Dict[str, Any]], db_files: List[Dict[str, Any]],
+                     mode: str = 'smart', use_content: bool = False) -> Dict[str, List]:
+        """
+        Categorize disk and database files (see reconcile()).
+
+        With use_content, partial content fingerprints
+        (app.utils.content_fingerprint) are used in smart mode to:
+        - narrow an ambiguous name/size/mtime match to the one candidate with
+          the same content
+        - match a missing file to a new file with the same content when the
+          name or mtime changed (e.g. a copy that reset mtime)
+        Database files only carry a content fingerprint once a rescan has
+        seen them in place, so unchanged files are hashed (once per mtime)
+        and cached in the files table.
+        """
         # Build fingerprint indexes with normalized paths for comparison
         disk_by_fingerprint = {}
         disk_by_path = {self.normalize_path(f['path']): f for f in disk_files}
@@ -201,15 +310,6 @@ class RescanService:
                 disk_by_fingerprint[fp] = []
             disk_by_fingerprint[fp].append(f)
 
-        db_by_fingerprint = {}
-        db_by_path = {self.normalize_path(f['local_path']): f for f in db_files}
-
-        for f in db_files:
-            fp = f['fingerprint']
-            if fp not in db_by_fingerprint:
-                db_by_fingerprint[fp] = []
-            db_by_fingerprint[fp].append(f)
-
         results = {
             'matched': [],
             'moved': [],
@@ -230,6 +330,40 @@ class RescanService:
                 matched_db_ids.add(db_file['id'])
                 matched_disk_paths.add(self.normalize_path(disk_file['path']))
 
+        use_content = use_content and mode == 'smart'
+        cache_updates = []
+
+        def add_content_fingerprints(files: List[Dict[str, Any]]):
+            missing = [f['path'] for f in files if 'content_fingerprint' not in f]
+            computed = compute_content_fingerprints(missing)
+            for f in files:
+                if f['path'] in computed:
+                    f['content_fingerprint'] = computed[f['path']]
+
+        def unmatched_disk_files(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return [f for f in files if self.normalize_path(f['path']) not in matched_disk_paths]
+
+        if use_content:
+            # Hash files still in place whose cached hash is missing or stale
+            stale = [
+                (db_file, disk_file) for db_file, disk_file in results['matched']
+                if not db_file.get('content_fingerprint')
+                or db_file.get('content_fingerprint_mtime') != disk_file['mtime']
+            ]
+            add_content_fingerprints([disk_file for _, disk_file in stale])
+            for db_file, disk_file in stale:
+                if disk_file.get('content_fingerprint'):
+                    cache_updates.append((db_file['id'], disk_file['content_fingerprint'], disk_file['mtime']))
+
+            # Candidates that a content check may have to tell apart
+            add_content_fingerprints([
+                f for db_file in db_files
+                if db_file['id'] not in matched_db_ids and db_file.get('content_fingerprint')
+                for candidates in [unmatched_disk_files(disk_by_fingerprint.get(db_file['fingerprint'], []))]
+                if len(candidates) > 1
+                for f in candidates
+            ])
+
         # Pass 2: Fingerprint matches (moved files) - only if smart mode
         if mode == 'smart':
             for db_file in db_files:
@@ -237,10 +371,15 @@ class RescanService:
                     continue
 
                 fp = db_file['fingerprint']
-                candidates = [
-                    f for f in disk_by_fingerprint.get(fp, [])
-                    if self.normalize_path(f['path']) not in matched_disk_paths
-                ]
+                candidates = unmatched_disk_files(disk_by_fingerprint.get(fp, []))
+
+                if len(candidates) > 1 and use_content and db_file.get('content_fingerprint'):
+                    same_content = [
+                        f for f in candidates
+                        if f.get('content_fingerprint') == db_file['content_fingerprint']
+                    ]
+                    if len(same_content) == 1:
+                        candidates = same_content
 
                 if len(candidates) == 1:
                     # Unique match - file was moved
@@ -252,6 +391,37 @@ class RescanService:
                     results['ambiguous'].append((db_file, candidates))
                     matched_db_ids.add(db_file['id'])
 
+        # Pass 2b: Content matches for files whose name or mtime changed
+        if use_content:
+            missing_by_size = {}
+            for db_file in db_files:
+                if db_file['id'] not in matched_db_ids and db_file.get('content_fingerprint'):
+                    missing_by_size.setdefault(db_file['size_bytes'], []).append(db_file)
+
+            # Only same-size files can share a content fingerprint
+            new_files = [f for f in unmatched_disk_files(disk_files) if f['size_bytes'] in missing_by_size]
+            add_content_fingerprints(new_files)
+            new_by_content = {}
+            for f in new_files:
+                if f.get('content_fingerprint'):
+                    new_by_content.setdefault(f['content_fingerprint'], []).append(f)
+
+            for same_size in missing_by_size.values():
+                for db_file in same_size:
+                    candidates = unmatched_disk_files(new_by_content.get(db_file['content_fingerprint'], []))
+                    if len(candidates) == 1:
+                        results['moved'].append((db_file, candidates[0]))
+                        matched_db_ids.add(db_file['id'])
+                        matched_disk_paths.add(self.normalize_path(candidates[0]['path']))
+                        # Same content; keep the cache valid at the new mtime
+                        cache_updates.append((db_file['id'], db_file['content_fingerprint'],
+                                              candidates[0]['mtime']))
+                    elif len(candidates) > 1:
+                        results['ambiguous'].append((db_file, candidates))
+                        matched_db_ids.add(db_file['id'])
+
+            self.db.set_content_fingerprints(cache_updates)
+
         # Pass 3: Identify deleted files (in DB, not on disk)
         for db_file in db_files:
             if db_file['id'] not in matched_db_ids:
@@ -265,10 +435,16 @@ class RescanService:
         return results
 
     def apply_changes(self, reconcile_results: Dict[str, List],
-                     options: Dict[str, Any]) -> Dict[str, Any]:
+                     options: Dict[str, Any],
+                     progress_callback: Optional[Callable[[str, int, int], None]] = None,
+                     should_cancel: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         Apply reconciliation changes to database.
 
+        Changes are written in chunks of RESCAN_APPLY_BATCH_SIZE rows, one
+        transaction per chunk: path updates with executemany, deletions with
+        bulk_delete_files_by_ids(), imports with create_source_files_bulk().
+
         Args:
             reconcile_results: Output from reconcile()
             options: {
@@ -280,8 +456,14 @@ class RescanService:
                     'moved': [file_ids],
                     'deleted': [file_ids],
                     'new': [file_paths]
-                }
+                },
+                'skip_metadata': None,      # None: skip ffprobe for >50 imports
+                'dry_run': False            # Only report what would change
             }
+            progress_callback: Called after each chunk with
+                (phase, done, total); phase is 'moved', 'deleted' or 'new'
+            should_cancel: Checked between chunks (and between imported
+                files); completed chunks stay applied
 
         Returns:
             {
@@ -289,152 +471,199 @@ class RescanService:
                 'deleted': int,
                 'imported': int,
                 'skipped': int,
-                'errors': [...]
+                'errors': [...],
+                'cancelled': bool
             }
+            With dry_run, the counts are what would be applied and 'diff'
+            lists the changes (see _plan_changes()).
         """
+        plan = self._plan_changes(reconcile_results, options)
+
+        if options.get('dry_run'):
+            return {
+                'dry_run': True,
+                'updated': len(plan['moved']),
+                'deleted': len(plan['deleted']),
+                'imported': len(plan['new']),
+                'skipped': plan['skipped'],
+                'errors': [],
+                'diff': {
+                    'moved': [
+                        {'file_id': file_id, 'from': old_path, 'to': new_path}
+                        for file_id, old_path, new_path in plan['moved']
+                    ],
+                    'deleted': [
+                        {'file_id': file_id, 'path': path}
+                        for file_id, path in plan['deleted']
+                    ],
+                    'new': [disk_file['path'] for disk_file in plan['new']]
+                }
+            }
+
         results = {
             'updated': 0,
             'deleted': 0,
             'imported': 0,
-            'skipped': 0,
-            'errors': []
+            'skipped': plan['skipped'],
+            'errors': [],
+            'cancelled': False
         }
+        batch_size = self._get_apply_batch_size()
 
-        selected = options.get('selected_files', {})
+        def cancelled() -> bool:
+            if should_cancel and should_cancel():
+                results['cancelled'] = True
+            return results['cancelled']
 
-        # Handle moved files
-        if options.get('update_moved', True):
-            moved_selection = set(selected.get('moved', [])) if selected.get('moved') else None
+        def report(phase: str, done: int, total: int):
+            if progress_callback:
+                progress_callback(phase, done, total)
 
-            for db_file, disk_file in reconcile_results['moved']:
-                # Skip if selection provided and this file not in it
-                if moved_selection is not None and db_file['id'] not in moved_selection:
-                    results['skipped'] += 1
-                    continue
+        # Handle moved files
+        moved = plan['moved']
+        for start in range(0, len(moved), batch_size):
+            if cancelled():
+                return results
+            chunk = moved[start:start + batch_size]
+            try:
+                updated_ids = set(self.db.bulk_update_file_local_paths([
+                    (file_id, new_path, str(Path(new_path).parent))
+                    for file_id, _, new_path in chunk
+                ]))
+                results['updated'] += len(updated_ids)
+                results['errors'].extend(
+                    {'file_id': file_id, 'error': 'Failed to update path'}
+                    for file_id, _, _ in chunk if file_id not in updated_ids
+                )
+            except Exception as e:
+                results['errors'].append({
+                    'file_ids': [file_id for file_id, _, _ in chunk],
+                    'error': f'Bulk update failed: {str(e)}'
+                })
+            report('moved', start + len(chunk), len(moved))
 
-                try:
-                    # Extract source directory from new path
-                    new_path = Path(disk_file['path'])
-                    new_source_dir = str(new_path.parent)
-
-                    success = self.db.update_file_local_path_and_metadata(
-                        db_file['id'],
-                        disk_file['path'],
-                        new_source_dir
-                    )
+        # Handle deleted files
+        deleted = plan['deleted']
+        for start in range(0, len(deleted), batch_size):
+            if cancelled():
+                return results
+            chunk = deleted[start:start + batch_size]
+            try:
+                results['deleted'] += self.db.bulk_delete_files_by_ids(
+                    [file_id for file_id, _ in chunk]
+                )
+            except Exception as e:
+                results['errors'].append({
+                    'error': f'Bulk delete failed: {str(e)}'
+                })
+            report('deleted', start + len(chunk), len(deleted))
 
-                    if success:
-                        results['updated'] += 1
-                    else:
+        # Handle new files - import them into the database
+        to_import = plan['new']
+        if to_import:
+            skip_metadata = options.get('skip_metadata')
+            if skip_metadata is None:
+                # Skip metadata extraction for bulk imports (>50 files) - much faster
+                skip_metadata = len(to_import) > 50
+            directory_path = options.get('directory_path', '')
+            existing_paths = (self.db.get_local_paths_under(os.path.abspath(directory_path))
+                              if directory_path else None)
+
+            for start in range(0, len(to_import), batch_size):
+                records = []
+                for disk_file in to_import[start:start + batch_size]:
+                    if cancelled():
+                        break
+                    try:
+                        record = self._build_import_record(
+                            disk_file['path'], directory_path, skip_metadata, existing_paths
+                        )
+                    except Exception as e:
                         results['errors'].append({
-                            'file_id': db_file['id'],
-                            'error': 'Failed to update path'
+                            'path': disk_file['path'],
+                            'error': str(e)
                         })
+                        continue
+                    if record is None:
+                        results['skipped'] += 1
+                        continue
+                    records.append(record)
+                    if existing_paths is not None:
+                        existing_paths.add(record['local_path'])
+
+                try:
+                    results['imported'] += self.db.create_source_files_bulk(records)
                 except Exception as e:
                     results['errors'].append({
-                        'file_id': db_file['id'],
-                        'error': str(e)
+                        'paths': [record['local_path'] for record in records],
+                        'error': f'Bulk import failed: {str(e)}'
                     })
+                if results['cancelled']:
+                    return results
+                report('new', min(start + batch_size, len(to_import)), len(to_import))
+
+        return results
+
+    def _plan_changes(self, reconcile_results: Dict[str, List],
+                      options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve apply_changes() options and selections into concrete changes.
+
+        Returns:
+            {
+                'moved': [(file_id, old_path, new_path)],
+                'deleted': [(file_id, path)],
+                'new': [disk_file],
+                'skipped': int   # entries left out by the selection
+            }
+        """
+        plan = {'moved': [], 'deleted': [], 'new': [], 'skipped': 0}
+        selected = options.get('selected_files', {})
+
+        if options.get('update_moved', True):
+            moved_selection = set(selected.get('moved', [])) if selected.get('moved') else None
+            for db_file, disk_file in reconcile_results['moved']:
+                # Skip if selection provided and this file not in it
+                if moved_selection is not None and db_file['id'] not in moved_selection:
+                    plan['skipped'] += 1
+                    continue
+                plan['moved'].append((db_file['id'], db_file.get('local_path'), disk_file['path']))
 
-        # Handle deleted files
         if options.get('delete_missing', True):
             deleted_selection = set(selected.get('deleted', [])) if selected.get('deleted') else None
-
-            file_ids_to_delete = []
             for db_file in reconcile_results['deleted']:
-                # Skip if selection provided and this file not in it
                 if deleted_selection is not None and db_file['id'] not in deleted_selection:
-                    results['skipped'] += 1
+                    plan['skipped'] += 1
                     continue
+                plan['deleted'].append((db_file['id'], db_file.get('local_path')))
 
-                file_ids_to_delete.append(db_file['id'])
-
-            if file_ids_to_delete:
-                try:
-                    deleted_count = self.db.bulk_delete_files_by_ids(file_ids_to_delete)
-                    results['deleted'] = deleted_count
-                except Exception as e:
-                    results['errors'].append({
-                        'error': f'Bulk delete failed: {str(e)}'
-                    })
-
-        # Handle new files - import them into the database
         if options.get('import_new', False):
-            new_selection = set(selected.get('new', [])) if selected.get('new') else None
-            directory_path = options.get('directory_path', '')
-
-            # Count files to import for skip_metadata decision
-            files_to_import = []
+            new_selection = selected.get('new')
             selection_normalized = {self.normalize_path(p) for p in new_selection} if new_selection else None
-
             for disk_file in reconcile_results['new']:
-                disk_path_normalized = self.normalize_path(disk_file['path'])
                 if selection_normalized is not None:
-                    if disk_path_normalized not in selection_normalized:
-                        results['skipped'] += 1
+                    if self.normalize_path(disk_file['path']) not in selection_normalized:
+                        plan['skipped'] += 1
                         continue
-                files_to_import.append(disk_file)
-
-            # Skip metadata extraction for bulk imports (>50 files) - much faster
-            skip_metadata = len(files_to_import) > 50
-
-            for disk_file in files_to_import:
-                try:
-                    imported = self.import_file(
-                        disk_file['path'],
-                        directory_path,
-                        skip_metadata=skip_metadata
-                    )
-                    if imported:
-                        results['imported'] += 1
-                    else:
-                        results['skipped'] += 1
-                except Exception as e:
-                    results['errors'].append({
-                        'path': disk_file['path'],
-                        'error': str(e)
-                    })
+                plan['new'].append(disk_file)
 
         # Handle ambiguous matches
         handle_ambiguous = options.get('handle_ambiguous', 'skip')
-        if handle_ambiguous == 'delete':
-            for db_file, candidates in reconcile_results['ambiguous']:
-                try:
-                    self.db.delete_file(db_file['id'])
-                    results['deleted'] += 1
-                except Exception as e:
-                    results['errors'].append({
-                        'file_id': db_file['id'],
-                        'error': str(e)
-                    })
-        elif handle_ambiguous == 'first_match':
-            for db_file, candidates in reconcile_results['ambiguous']:
-                if candidates:
-                    try:
-                        disk_file = candidates[0]
-                        new_path = Path(disk_file['path'])
-                        new_source_dir = str(new_path.parent)
-
-                        success = self.db.update_file_local_path_and_metadata(
-                            db_file['id'],
-                            disk_file['path'],
-                            new_source_dir
-                        )
+        for db_file, candidates in reconcile_results['ambiguous']:
+            if handle_ambiguous == 'delete':
+                plan['deleted'].append((db_file['id'], db_file.get('local_path')))
+            elif handle_ambiguous == 'first_match' and candidates:
+                plan['moved'].append((db_file['id'], db_file.get('local_path'), candidates[0]['path']))
 
-                        if success:
-                            results['updated'] += 1
-                        else:
-                            results['errors'].append({
-                                'file_id': db_file['id'],
-                                'error': 'Failed to update path'
-                            })
-                    except Exception as e:
-                        results['errors'].append({
-                            'file_id': db_file['id'],
-                            'error': str(e)
-                        })
+        return plan
 
-        return results
+    @staticmethod
+    def _get_apply_batch_size() -> int:
+        """Rows per apply_changes() transaction (RESCAN_APPLY_BATCH_SIZE, default 500)."""
+        try:
+            return max(1, int(os.getenv('RESCAN_APPLY_BATCH_SIZE', '')))
+        except ValueError:
+            return 500
 
     def import_file(self, file_path: str, source_directory: str = '',
                     skip_metadata: bool = False) -> bool:
@@ -449,6 +678,28 @@ class RescanService:
         Returns:
             True if imported successfully, False if skipped
         """
+        record = self._build_import_record(file_path, source_directory, skip_metadata)
+        if record is None:
+            return False
+
+        # Create file record
+        self.db.create_source_file(**record)
+        return True
+
+    def _build_import_record(self, file_path: str, source_directory: str = '',
+                             skip_metadata: bool = False,
+                             existing_paths: Optional[set] = None) -> Optional[Dict[str, Any]]:
+        """
+        Build the create_source_file() arguments for a file on disk.
+
+        Args:
+            existing_paths: Preloaded local_path set to check instead of
+                querying the database for this file
+
+        Returns:
+            Keyword arguments for create_source_file(), or None if the file is
+            unsupported, already in the database or unreadable
+        """
         from app.utils.validators import get_file_type, ValidationError
         from app.utils.media_metadata import extract_media_metadata, MediaMetadataError
 
@@ -469,17 +720,20 @@ class RescanService:
         try:
             file_type = get_file_type(filename, allowed_video, allowed_image)
         except ValidationError:
-            return False  # Unsupported file type
+            return None  # Unsupported file type
 
         # Check if already exists
-        if self.db.get_file_by_local_path(abs_path):
-            return False  # Already in database
+        if existing_paths is not None:
+            if abs_path in existing_paths:
+                return None
+        elif self.db.get_file_by_local_path(abs_path):
+            return None  # Already in database
 
         # Get file stats
         try:
             file_stat = os.stat(abs_path)
         except OSError:
-            return False
+            return None
 
         # Determine content type
         content_type = mimetypes.guess_type(abs_path)[0] or 'application/octet-stream'
@@ -496,35 +750,33 @@ class RescanService:
         if not source_directory:
             source_directory = str(Path(abs_path).parent)
 
-        # Create file record
-        self.db.create_source_file(
-            filename=filename,
-            s3_key=None,
-            file_type=file_type,
-            size_bytes=file_stat.st_size,
-            content_type=content_type,
-            local_path=abs_path,
-            resolution_width=media_metadata.get('resolution_width'),
-            resolution_height=media_metadata.get('resolution_height'),
-            frame_rate=media_metadata.get('frame_rate'),
-            codec_video=media_metadata.get('codec_video'),
-            codec_audio=media_metadata.get('codec_audio'),
-            duration_seconds=media_metadata.get('duration_seconds'),
-            bitrate=media_metadata.get('bitrate'),
-            metadata={
+        return {
+            'filename': filename,
+            's3_key': None,
+            'file_type': file_type,
+            'size_bytes': file_stat.st_size,
+            'content_type': content_type,
+            'local_path': abs_path,
+            'resolution_width': media_metadata.get('resolution_width'),
+            'resolution_height': media_metadata.get('resolution_height'),
+            'frame_rate': media_metadata.get('frame_rate'),
+            'codec_video': media_metadata.get('codec_video'),
+            'codec_audio': media_metadata.get('codec_audio'),
+            'duration_seconds': media_metadata.get('duration_seconds'),
+            'bitrate': media_metadata.get('bitrate'),
+            'metadata': {
                 'imported_from': 'rescan',
                 'source_directory': source_directory,
                 'original_size_bytes': file_stat.st_size,
                 'file_mtime': file_stat.st_mtime,
                 'file_ctime': file_stat.st_ctime
             }
-        )
-
-        return True
+        }
 
     def scan_directory_with_progress(self, directory_path: str, recursive: bool = True,
                                      progress_callback: Optional[Callable] = None,
-                                     job_id: Optional[str] = None) -> List[Dict[str, Any]]:
+                                     job_id: Optional[str] = None,
+                                     use_index: bool = True) -> List[Dict[str, Any]]:
         """
         Scan directory with progress tracking.
 
@@ -533,82 +785,37 @@ class RescanService:
             recursive: Whether to scan subdirectories
             progress_callback: Function to call with progress updates (files_scanned, total_estimate)
             job_id: Job ID for cancellation check
+            use_index: Skip directories unchanged since the last scan (see _walk_directory)
 
         Returns:
             List of file dictionaries with metadata and fingerprints
         """
-        discovered_files = []
-        directory = Path(directory_path)
-
-        if not directory.exists():
-            raise ValueError(f"Directory does not exist: {directory_path}")
-
-        if not directory.is_dir():
-            raise ValueError(f"Path is not a directory: {directory_path}")
-
-        # Get allowed extensions from app config or use defaults
-        if self.app:
-            allowed_video = self.app.config.get('ALLOWED_VIDEO_EXTENSIONS',
-                {'mp4', 'mov', 'avi', 'mkv', 'flv', 'wmv', 'webm', 'm4v'})
-            allowed_image = self.app.config.get('ALLOWED_IMAGE_EXTENSIONS',
-                {'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp'})
-        else:
-            allowed_video = {'mp4', 'mov', 'avi', 'mkv', 'flv', 'wmv', 'webm', 'm4v'}
-            allowed_image = {'jpg', 'jpeg', 'png', 'gif', 'bmp', 'tiff', 'webp'}
-
-        # Build supported extensions set (config uses no dots, add dot prefix)
-        supported_extensions = {f'.{ext}' for ext in allowed_video | allowed_image}
-
-        # Scan directory
-        pattern = '**/*' if recursive else '*'
-        files_scanned = 0
-
-        for file_path in directory.glob(pattern):
-            # Check for cancellation
-            if job_id and self.db.is_rescan_job_cancelled(job_id):
-                break
+        last_reported = [0]
 
-            if not file_path.is_file():
-                continue
+        def on_progress(files_scanned: int):
+            # Report progress every 10 files
+            if progress_callback and files_scanned // 10 > last_reported[0] // 10:
+                last_reported[0] = files_scanned
+                progress_callback(files_scanned, files_scanned)
 
-            # Check if supported file type
-            if file_path.suffix.lower() not in supported_extensions:
-                continue
-
-            try:
-                stat = file_path.stat()
-                discovered_files.append({
-                    'path': str(file_path.absolute()),
-                    'filename': file_path.name,
-                    'size_bytes': stat.st_size,
-                    'mtime': stat.st_mtime,
-                    'fingerprint': self.get_file_fingerprint(
-                        file_path.name,
-                        stat.st_size,
-                        stat.st_mtime
-                    )
-                })
-
-                files_scanned += 1
-
-                # Report progress every 10 files
-                if progress_callback and files_scanned % 10 == 0:
-                    progress_callback(files_scanned, len(discovered_files))
-
-            except (OSError, PermissionError) as e:
-                # Skip files that can't be accessed
-                print(f"Warning: Could not access {file_path}: {e}")
-                continue
+        discovered_files = self._walk_directory(
+            directory_path,
+            recursive=recursive,
+            use_index=use_index,
+            should_cancel=(lambda: self.db.is_rescan_job_cancelled(job_id)) if job_id else None,
+            on_progress=on_progress
+        )
 
         # Final progress update
         if progress_callback:
-            progress_callback(files_scanned, len(discovered_files))
+            progress_callback(len(discovered_files), len(discovered_files))
 
         return discovered_files
 
     def reconcile_with_progress(self, directory_path: str, mode: str = 'smart',
                                progress_callback: Optional[Callable] = None,
-                               job_id: Optional[str] = None) -> Dict[str, List]:
+                               job_id: Optional[str] = None,
+                               content_fingerprints: Optional[bool] = None) -> Dict[str, List]:
         """
         Reconcile with progress tracking.
 
@@ -617,6 +824,7 @@ class RescanService:
             mode: 'smart' (fingerprint matching) or 'simple' (delete & reimport)
             progress_callback: Function to call with progress updates
             job_id: Job ID for cancellation check
+            content_fingerprints: See reconcile()
 
         Returns:
             Dictionary with categorized file changes
@@ -667,78 +875,8 @@ class RescanService:
                 'current_operation': 'Reconciling files...'
             })
 
-        # Build fingerprint indexes with normalized paths for comparison
-        disk_by_fingerprint = {}
-        disk_by_path = {self.normalize_path(f['path']): f for f in disk_files}
-
-        for f in disk_files:
-            fp = f['fingerprint']
-            if fp not in disk_by_fingerprint:
-                disk_by_fingerprint[fp] = []
-            disk_by_fingerprint[fp].append(f)
-
-        db_by_fingerprint = {}
-        db_by_path = {self.normalize_path(f['local_path']): f for f in db_files}
-
-        for f in db_files:
-            fp = f['fingerprint']
-            if fp not in db_by_fingerprint:
-                db_by_fingerprint[fp] = []
-            db_by_fingerprint[fp].append(f)
-
-        results = {
-            'matched': [],
-            'moved': [],
-            'deleted': [],
-            'new': [],
-            'ambiguous': []
-        }
-
-        matched_db_ids = set()
-        matched_disk_paths = set()  # Store normalized paths
-
-        # Pass 1: Exact path matches (unchanged files)
-        for db_file in db_files:
-            normalized_db_path = self.normalize_path(db_file['local_path'])
-            if normalized_db_path in disk_by_path:
-                disk_file = disk_by_path[normalized_db_path]
-                results['matched'].append((db_file, disk_file))
-                matched_db_ids.add(db_file['id'])
-                matched_disk_paths.add(self.normalize_path(disk_file['path']))
-
-        # Pass 2: Fingerprint matches (moved files) - only if smart mode
-        if mode == 'smart':
-            for db_file in db_files:
-                if db_file['id'] in matched_db_ids:
-                    continue
-
-                fp = db_file['fingerprint']
-                candidates = [
-                    f for f in disk_by_fingerprint.get(fp, [])
-                    if self.normalize_path(f['path']) not in matched_disk_paths
-                ]
-
-                if len(candidates) == 1:
-                    # Unique match - file was moved
-                    results['moved'].append((db_file, candidates[0]))
-                    matched_db_ids.add(db_file['id'])
-                    matched_disk_paths.add(self.normalize_path(candidates[0]['path']))
-                elif len(candidates) > 1:
-                    # Multiple candidates - ambiguous
-                    results['ambiguous'].append((db_file, candidates))
-                    matched_db_ids.add(db_file['id'])
-
-        # Pass 3: Identify deleted files (in DB, not on disk)
-        for db_file in db_files:
-            if db_file['id'] not in matched_db_ids:
-                results['deleted'].append(db_file)
-
-        # Pass 4: Identify new files (on disk, not in DB)
-        for disk_file in disk_files:
-            if self.normalize_path(disk_file['path']) not in matched_disk_paths:
-                results['new'].append(disk_file)
-
-        return results
+        return self._match_files(disk_files, db_files, mode,
+                                 self._use_content_fingerprints(content_fingerprints))
 
     def run_rescan_job_async(self, job_id: str, directory_path: str, recursive: bool = True):
         """
@@ -773,7 +911,9 @@ class RescanService:
                     'moved': len(results['moved']),
                     'deleted': len(results['deleted']),
                     'new': len(results['new']),
-                    'ambiguous': len(results['ambiguous'])
+                    'ambiguous': len(results['ambiguous']),
+                    'directories_scanned': self.last_scan_stats.get('directories_scanned', 0),
+                    'directories_skipped': self.last_scan_stats.get('directories_skipped', 0)
                 }
 
                 # Store results
@@ -868,7 +1008,8 @@ class RescanService:
             job_id: Unique job identifier
             directory_path: Directory being processed
             selected_files: Dict with 'moved', 'deleted', 'new' lists
-            actions: Dict with action flags
+            actions: Dict with action flags (handle_ambiguous is ignored:
+                ambiguous matches are always skipped here)
         """
         def _run_job():
             try:
@@ -889,155 +1030,46 @@ class RescanService:
                 if self.db.is_import_job_cancelled(job_id):
                     return
 
-                # Prepare for apply
-                results = {
-                    'updated': 0,
-                    'deleted': 0,
-                    'imported': 0,
-                    'skipped': 0,
-                    'errors': []
+                options = {
+                    'update_moved': actions.get('update_moved', False),
+                    'delete_missing': actions.get('delete_missing', False),
+                    'import_new': actions.get('import_new', False),
+                    # Async jobs have always left ambiguous matches alone
+                    'handle_ambiguous': 'skip',
+                    'selected_files': selected_files or {},
+                    'directory_path': directory_path,
+                    'skip_metadata': False  # Full metadata for async imports
                 }
 
-                selected = selected_files or {}
-                total_operations = 0
-                completed_operations = 0
-
-                # Count total operations
-                if actions.get('update_moved', False) and selected.get('moved'):
-                    total_operations += len(selected['moved'])
-                if actions.get('delete_missing', False) and selected.get('deleted'):
-                    total_operations += len(selected['deleted'])
-                if actions.get('import_new', False) and selected.get('new'):
-                    total_operations += len(selected['new'])
-
-                self.db.update_import_job_progress(job_id, total_files=total_operations)
-
-                # Handle moved files
-                if actions.get('update_moved', False):
-                    moved_selection = set(selected.get('moved', [])) if selected.get('moved') else None
-
-                    self.db.update_import_job(job_id, {
-                        'current_operation': 'Updating moved files...'
-                    })
-
-                    for db_file, disk_file in reconcile_results['moved']:
-                        if self.db.is_import_job_cancelled(job_id):
-                            return
-
-                        if moved_selection is not None and db_file['id'] not in moved_selection:
-                            results['skipped'] += 1
-                            continue
-
-                        try:
-                            new_path = Path(disk_file['path'])
-                            new_source_dir = str(new_path.parent)
-                            success = self.db.update_file_local_path_and_metadata(
-                                db_file['id'], disk_file['path'], new_source_dir
-                            )
-                            if success:
-                                results['updated'] += 1
-                            else:
-                                results['errors'].append({
-                                    'file_id': db_file['id'],
-                                    'error': 'Failed to update path'
-                                })
-                        except Exception as e:
-                            results['errors'].append({
-                                'file_id': db_file['id'],
-                                'error': str(e)
-                            })
-
-                        completed_operations += 1
-                        self.db.update_import_job_progress(
-                            job_id,
-                            files_scanned=completed_operations,
-                            files_imported=results['imported']
-                        )
-
-                # Handle deleted files
-                if actions.get('delete_missing', False):
-                    deleted_selection = set(selected.get('deleted', [])) if selected.get('deleted') else None
-
-                    self.db.update_import_job(job_id, {
-                        'current_operation': 'Removing deleted files...'
-                    })
-
-                    file_ids_to_delete = []
-                    for db_file in reconcile_results['deleted']:
-                        if self.db.is_import_job_cancelled(job_id):
-                            return
-
-                        if deleted_selection is not None and db_file['id'] not in deleted_selection:
-                            results['skipped'] += 1
-                            completed_operations += 1
-                            continue
-
-                        file_ids_to_delete.append(db_file['id'])
-                        completed_operations += 1
-
-                    if file_ids_to_delete:
-                        try:
-                            deleted_count = self.db.bulk_delete_files_by_ids(file_ids_to_delete)
-                            results['deleted'] = deleted_count
-                        except Exception as e:
-                            results['errors'].append({
-                                'error': f'Bulk delete failed: {str(e)}'
-                            })
-
+                phase_labels = {
+                    'moved': 'Updating moved files',
+                    'deleted': 'Removing deleted files',
+                    'new': 'Importing new files'
+                }
+                phase_offsets = {}
+                plan = self._plan_changes(reconcile_results, options)
+                offset = 0
+                for phase in ('moved', 'deleted', 'new'):
+                    phase_offsets[phase] = offset
+                    offset += len(plan[phase])
+                self.db.update_import_job_progress(job_id, total_files=offset)
+
+                def on_progress(phase: str, done: int, total: int):
                     self.db.update_import_job_progress(
                         job_id,
-                        files_scanned=completed_operations,
-                        files_imported=results['imported']
+                        files_scanned=phase_offsets[phase] + done,
+                        current_operation=f'{phase_labels[phase]} {done}/{total}...'
                     )
 
-                # Handle new files - import with full metadata
-                if actions.get('import_new', False):
-                    new_selection = set(selected.get('new', [])) if selected.get('new') else None
-                    selection_normalized = {self.normalize_path(p) for p in new_selection} if new_selection else None
-
-                    # Build list of files to import
-                    files_to_import = []
-                    for disk_file in reconcile_results['new']:
-                        disk_path_normalized = self.normalize_path(disk_file['path'])
-                        if selection_normalized is not None:
-                            if disk_path_normalized not in selection_normalized:
-                                results['skipped'] += 1
-                                continue
-                        files_to_import.append(disk_file)
-
-                    # Import files one by one with progress updates
-                    for i, disk_file in enumerate(files_to_import):
-                        if self.db.is_import_job_cancelled(job_id):
-                            return
-
-                        # Update progress
-                        self.db.update_import_job(job_id, {
-                            'current_operation': f'Importing {i+1}/{len(files_to_import)}: {disk_file["filename"]}'
-                        })
+                results = self.apply_changes(
+                    reconcile_results, options,
+                    progress_callback=on_progress,
+                    should_cancel=lambda: self.db.is_import_job_cancelled(job_id)
+                )
+                if results.pop('cancelled'):
+                    return
 
-                        try:
-                            # Import with full metadata extraction
-                            imported = self.import_file(
-                                disk_file['path'],
-                                directory_path,
-                                skip_metadata=False  # Full metadata for async imports
-                            )
-                            if imported:
-                                results['imported'] += 1
-                            else:
-                                results['skipped'] += 1
-                        except Exception as e:
-                            results['errors'].append({
-                                'path': disk_file['path'],
-                                'error': str(e)
-                            })
-
-                        completed_operations += 1
-                        self.db.update_import_job_progress(
-                            job_id,
-                            files_scanned=completed_operations,
-                            files_imported=results['imported']
-                        )
+                self.db.update_import_job_progress(job_id, files_imported=results['imported'])
 
                 # Complete the job
                 self.db.complete_import_job(job_id, results)
@@ -0,0 +1,146 @@
+"""
+Semantic result cache - short-lived ranked KNN result sets for cursor paging.
+
+A semantic search runs the KNN once for a generous depth and keeps the ranked
+neighbour list in memory. Later pages are sliced from it via an opaque cursor,
+so deep paging only costs the enrichment of one page.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class RankedResultSet:
+    """Ranked KNN neighbours for one (query embedding, filters) combination."""
+    key: str
+    results: List[Dict[str, Any]]
+    k: int
+    at_max_depth: bool = False
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        True when no deeper neighbours can be fetched: the KNN returned fewer
+        than k rows, or k was already the deepest KNN the index allows.
+        """
+        return len(self.results) < self.k or self.at_max_depth
+
+    def covers(self, end: int) -> bool:
+        """Whether rows [0, end) are available without re-running the KNN."""
+        return end <= len(self.results) or self.exhausted
+
+
+class SemanticResultCache:
+    """Thread-safe TTL/LRU cache of RankedResultSet objects."""
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 64, default_depth: int = 200):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, int(max_entries))
+        self.default_depth = max(1, int(default_depth))
+        self._entries: OrderedDict[str, RankedResultSet] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query_vector: List[float], source_types: Optional[List[str]],
+                 min_similarity: float = 0.0) -> str:
+        """Build a key from the query embedding bytes and search filters."""
+        digest = hashlib.sha256(struct.pack(f'{len(query_vector)}f', *query_vector))
+        digest.update(json.dumps({
+            'source_types': sorted(source_types) if source_types else None,
+            'min_similarity': min_similarity
+        }, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[RankedResultSet]:
+        """Get a live result set, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.created_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, results: List[Dict[str, Any]], k: int,
+            at_max_depth: bool = False) -> RankedResultSet:
+        """
+        Store a ranked result set, evicting the least recently used entries.
+
+        k must be the depth the KNN actually ran with (after any cap), and
+        at_max_depth set when that cap was reached.
+        """
+        entry = RankedResultSet(key=key, results=results, k=k, at_max_depth=at_max_depth)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def depth_for(self, end: int, previous: Optional[RankedResultSet] = None,
+                  max_depth: Optional[int] = None) -> int:
+        """KNN depth to request so rows [0, end) are covered with headroom, capped at max_depth."""
+        depth = max(end, self.default_depth)
+        if previous is not None:
+            depth = max(depth, previous.k * 2)
+        if max_depth is not None:
+            depth = min(depth, max_depth)
+        return depth
+
+    @staticmethod
+    def cursor_scope(query: str, sources: Optional[List[str]]) -> str:
+        """Short digest of the request a cursor belongs to (query text and sources)."""
+        raw = json.dumps({
+            'q': (query or '').strip(),
+            'sources': sorted(set(sources)) if sources else None
+        }, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(raw).hexdigest()[:16]
+
+    @staticmethod
+    def encode_cursor(key: str, offset: int, scope: str) -> str:
+        """Encode an opaque page cursor bound to a cursor_scope()."""
+        raw = json.dumps({'rs': key, 'o': offset, 's': scope}, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Optional[Tuple[str, int, str]]:
+        """Decode a cursor into (result set key, offset, scope); None if malformed."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            offset = int(data['o'])
+            if offset < 0:
+                return None
+            return str(data['rs']), offset, str(data['s'])
+        except (ValueError, KeyError, TypeError):
+            return None
+
+
+_cache_instance: Optional[SemanticResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_result_cache() -> SemanticResultCache:
+    """Get the process-wide SemanticResultCache."""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = SemanticResultCache(
+                ttl_seconds=float(os.getenv('SEMANTIC_RESULT_CACHE_TTL_SECONDS', '300')),
+                max_entries=int(os.getenv('SEMANTIC_RESULT_CACHE_MAX_ENTRIES', '64')),
+                default_depth=int(os.getenv('SEMANTIC_RESULT_DEPTH', '200'))
+            )
+        return _cache_instance
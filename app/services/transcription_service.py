@@ -7,11 +7,14 @@ import sys
 import hashlib
 import time
 import tempfile
-from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable, Tuple
 from dataclasses import dataclass, field
 import threading
 import queue
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.directory_walker import extension_filter, walk_files
 
 # Add PyTorch lib directory to DLL search path for cuDNN 9 DLLs
 # Required for CTranslate2 4.6.2+ CUDA support on Windows
@@ -33,12 +36,25 @@ try:
 except ImportError:
     ffmpeg = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Whisper's input format: 16 kHz mono
+AUDIO_SAMPLE_RATE = 16000
+
 
 class TranscriptionError(Exception):
     """Base exception for transcription errors."""
     pass
 
 
+class TranscriptionCancelled(TranscriptionError):
+    """Raised when a batch is cancelled while a file is being decoded."""
+    pass
+
+
 @dataclass
 class TranscriptionProgress:
     """Progress tracking for batch transcription."""
@@ -89,6 +105,9 @@ class TranscriptionService:
     # Supported video extensions
     VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.mpg', '.mpeg'}
 
+    # Overlap either side of a window cut that couldn't be placed in a silence
+    WINDOW_OVERLAP_SECONDS = 5
+
     @staticmethod
     def calculate_text_metrics(text: str) -> Tuple[Optional[int], Optional[int]]:
         """
@@ -180,48 +199,61 @@ class TranscriptionService:
         if self._model is None:
             with self._model_lock:
                 if self._model is None:  # Double-check pattern
+                    self._model = self._create_model()
+        return self._model
+
+    def _create_model(self, cpu_threads: int = 0):
+        """
+        Construct a Whisper model for the current size, device and compute type.
+
+        Falls back to CPU (and updates self.device) when CUDA is requested but
+        cuDNN is missing.
+
+        Args:
+            cpu_threads: CTranslate2 threads for CPU inference (0 = library default)
+        """
+        try:
+            return WhisperModel(
+                self.model_size,
+                device=self.device,
+                compute_type=self.compute_type,
+                cpu_threads=cpu_threads
+            )
+        except Exception as e:
+            error_msg = str(e)
+
+            # Check for cuDNN-related errors
+            if 'cudnn' in error_msg.lower() or 'cudnn_ops' in error_msg.lower():
+                if self.device == 'cuda':
+                    # Try to fall back to CPU
+                    import logging
+                    logging.warning(
+                        f"CUDA device requested but cuDNN library not found. "
+                        f"Falling back to CPU mode. Error: {error_msg}"
+                    )
+                    self.device = 'cpu'
+                    self.compute_type = 'int8'
+
+                    # Retry with CPU
                     try:
-                        self._model = WhisperModel(
+                        return WhisperModel(
                             self.model_size,
-                            device=self.device,
-                            compute_type=self.compute_type
+                            device='cpu',
+                            compute_type='int8',
+                            cpu_threads=cpu_threads
                         )
-                    except Exception as e:
-                        error_msg = str(e)
-
-                        # Check for cuDNN-related errors
-                        if 'cudnn' in error_msg.lower() or 'cudnn_ops' in error_msg.lower():
-                            if self.device == 'cuda':
-                                # Try to fall back to CPU
-                                import logging
-                                logging.warning(
-                                    f"CUDA device requested but cuDNN library not found. "
-                                    f"Falling back to CPU mode. Error: {error_msg}"
-                                )
-                                self.device = 'cpu'
-                                self.compute_type = 'int8'
-
-                                # Retry with CPU
-                                try:
-                                    self._model = WhisperModel(
-                                        self.model_size,
-                                        device='cpu',
-                                        compute_type='int8'
-                                    )
-                                    return self._model
-                                except Exception as cpu_error:
-                                    raise TranscriptionError(
-                                        f"Failed to load model on CPU after CUDA failure: {str(cpu_error)}"
-                                    )
-                            else:
-                                raise TranscriptionError(
-                                    f"cuDNN library error: {error_msg}. "
-                                    f"Please install cuDNN or use CPU mode."
-                                )
-                        else:
-                            # Re-raise other errors
-                            raise TranscriptionError(f"Failed to load Whisper model: {error_msg}")
-        return self._model
+                    except Exception as cpu_error:
+                        raise TranscriptionError(
+                            f"Failed to load model on CPU after CUDA failure: {str(cpu_error)}"
+                        )
+                else:
+                    raise TranscriptionError(
+                        f"cuDNN library error: {error_msg}. "
+                        f"Please install cuDNN or use CPU mode."
+                    )
+            else:
+                # Re-raise other errors
+                raise TranscriptionError(f"Failed to load Whisper model: {error_msg}")
 
     def set_model_size(self, model_size: str):
         """
@@ -293,23 +325,89 @@ class TranscriptionService:
         except Exception as e:
             raise TranscriptionError(f"Failed to extract audio: {str(e)}")
 
+    def extract_audio_array(self, video_path: str):
+        """
+        Decode a video's audio straight into memory (no temp WAV).
+
+        ffmpeg writes 16 kHz mono float32 PCM to stdout, which is wrapped
+        without copying as the NumPy array faster-whisper accepts.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            float32 NumPy array of samples in [-1, 1]
+        """
+        if not os.path.exists(video_path):
+            raise TranscriptionError(f"Video file not found: {video_path}")
+        if np is None:
+            raise TranscriptionError("numpy not installed (required for streamed audio)")
+
+        try:
+            stream = ffmpeg.input(video_path)
+            stream = ffmpeg.output(
+                stream,
+                'pipe:',
+                format='f32le',
+                acodec='pcm_f32le',  # 32-bit float PCM
+                ac=1,  # Mono
+                ar=str(AUDIO_SAMPLE_RATE),
+                loglevel='error'
+            )
+            out, _ = ffmpeg.run(stream, capture_stdout=True, capture_stderr=True)
+            return np.frombuffer(out, dtype=np.float32)
+
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            raise TranscriptionError(f"FFmpeg error during audio extraction: {error_msg}")
+        except Exception as e:
+            raise TranscriptionError(f"Failed to extract audio: {str(e)}")
+
+    @staticmethod
+    def _use_audio_pipe(stream_audio: Optional[bool] = None) -> bool:
+        """Whether to decode audio in memory: argument, else TRANSCRIBE_AUDIO_MODE=pipe."""
+        if stream_audio is not None:
+            return stream_audio
+        return os.getenv('TRANSCRIBE_AUDIO_MODE', 'file').strip().lower() == 'pipe'
+
+    def _prepare_audio(self, video_path: str, stream_audio: Optional[bool] = None):
+        """Extract audio as a temp WAV path or, in pipe mode, an in-memory array."""
+        if self._use_audio_pipe(stream_audio):
+            return self.extract_audio_array(video_path)
+        return self.extract_audio(video_path)
+
+    @staticmethod
+    def _discard_audio(audio):
+        """Remove a temp WAV from _prepare_audio(); in-memory audio needs nothing."""
+        if isinstance(audio, str) and os.path.exists(audio):
+            try:
+                os.remove(audio)
+            except Exception:
+                pass  # Ignore cleanup errors
+
     def transcribe_file(
         self,
         video_path: str,
         language: Optional[str] = None,
         beam_size: int = 5,
         vad_filter: bool = True,
-        word_timestamps: bool = True
+        word_timestamps: bool = True,
+        stream_audio: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Transcribe a single video file.
 
+        With TRANSCRIBE_WINDOW_PROCESSES set, audio at least
+        TRANSCRIBE_WINDOW_MIN_SECONDS long goes through transcribe_windows().
+
         Args:
             video_path: Path to video file
             language: Language code (e.g., 'en', 'es', 'fr') or None for auto-detect
             beam_size: Beam size for decoding (higher = better quality but slower)
             vad_filter: Use voice activity detection to filter silence
             word_timestamps: Include word-level timestamps
+            stream_audio: Decode audio in memory instead of a temp WAV
+                (default: TRANSCRIBE_AUDIO_MODE)
 
         Returns:
             Dictionary with transcription results:
@@ -323,93 +421,227 @@ class TranscriptionService:
         if not os.path.exists(video_path):
             raise TranscriptionError(f"Video file not found: {video_path}")
 
-        audio_path = None
+        audio = None
         try:
-            # Extract audio
-            audio_path = self.extract_audio(video_path)
+            processes, window_seconds, min_seconds = self._get_window_settings()
+            if processes:
+                # Long audio is split into windows decoded in parallel processes
+                audio = self.extract_audio_array(video_path)
+                if len(audio) >= min_seconds * AUDIO_SAMPLE_RATE:
+                    return self.transcribe_windows(
+                        audio, processes, window_seconds,
+                        language=language,
+                        beam_size=beam_size,
+                        vad_filter=vad_filter,
+                        word_timestamps=word_timestamps
+                    )
+            else:
+                # Extract audio
+                audio = self._prepare_audio(video_path, stream_audio)
 
             # Load model
             model = self._load_model()
 
-            # Transcribe
-            start_time = time.time()
-            segments, info = model.transcribe(
-                audio_path,
+            return self._transcribe_audio(
+                model, audio,
                 language=language,
                 beam_size=beam_size,
                 vad_filter=vad_filter,
                 word_timestamps=word_timestamps
             )
 
-            # Process segments
-            transcript_segments = []
-            word_timestamps_list = []
-            full_text_parts = []
-            total_confidence = 0.0
-            segment_count = 0
-
-            for segment in segments:
-                segment_dict = {
-                    'id': segment.id,
-                    'start': segment.start,
-                    'end': segment.end,
-                    'text': segment.text.strip(),
-                    'avg_logprob': segment.avg_logprob,
-                    'no_speech_prob': segment.no_speech_prob
-                }
-
-                # Add words if available
-                if word_timestamps and hasattr(segment, 'words') and segment.words:
-                    segment_dict['words'] = [
-                        {
-                            'word': word.word,
-                            'start': word.start,
-                            'end': word.end,
-                            'probability': word.probability
-                        }
-                        for word in segment.words
-                    ]
-                    word_timestamps_list.extend(segment_dict['words'])
-
-                transcript_segments.append(segment_dict)
-                full_text_parts.append(segment.text.strip())
-
-                # Calculate average confidence (convert log probability to linear)
-                total_confidence += (1.0 - segment.no_speech_prob)
-                segment_count += 1
-
-            processing_time = time.time() - start_time
-
-            # Calculate average confidence
-            avg_confidence = total_confidence / segment_count if segment_count > 0 else 0.0
-
-            # Get audio duration (from last segment)
-            duration_seconds = transcript_segments[-1]['end'] if transcript_segments else 0.0
-
-            # Calculate character and word counts
-            full_text = ' '.join(full_text_parts)
-            character_count, word_count = self.calculate_text_metrics(full_text)
-
-            return {
-                'transcript_text': full_text,
-                'character_count': character_count,
-                'word_count': word_count,
-                'segments': transcript_segments,
-                'word_timestamps': word_timestamps_list if word_timestamps else None,
-                'language': info.language,
-                'duration_seconds': duration_seconds,
-                'confidence_score': avg_confidence,
-                'processing_time_seconds': processing_time,
-                'model_used': self.model_size
-            }
-
         finally:
             # Clean up temporary audio file
-            if audio_path and os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                except Exception:
-                    pass  # Ignore cleanup errors
+            self._discard_audio(audio)
+
+    def _transcribe_audio(
+        self,
+        model,
+        audio,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+        vad_filter: bool = True,
+        word_timestamps: bool = True,
+        should_cancel: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a loaded model over extracted audio and build the result dict.
+
+        Args:
+            model: WhisperModel to decode with
+            audio: Audio file path or 16 kHz float32 array
+            should_cancel: Checked between segments; raises TranscriptionCancelled when True
+
+        Returns:
+            Result dictionary as documented on transcribe_file()
+        """
+        # Transcribe
+        start_time = time.time()
+        segments, info = model.transcribe(
+            audio,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+            word_timestamps=word_timestamps
+        )
+
+        # Process segments
+        transcript_segments = []
+        word_timestamps_list = []
+        full_text_parts = []
+        total_confidence = 0.0
+        segment_count = 0
+
+        for segment in segments:
+            if should_cancel and should_cancel():
+                raise TranscriptionCancelled('Transcription cancelled')
+
+            segment_dict = {
+                'id': segment.id,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text.strip(),
+                'avg_logprob': segment.avg_logprob,
+                'no_speech_prob': segment.no_speech_prob
+            }
+
+            # Add words if available
+            if word_timestamps and hasattr(segment, 'words') and segment.words:
+                segment_dict['words'] = [
+                    {
+                        'word': word.word,
+                        'start': word.start,
+                        'end': word.end,
+                        'probability': word.probability
+                    }
+                    for word in segment.words
+                ]
+                word_timestamps_list.extend(segment_dict['words'])
+
+            transcript_segments.append(segment_dict)
+            full_text_parts.append(segment.text.strip())
+
+            # Calculate average confidence (convert log probability to linear)
+            total_confidence += (1.0 - segment.no_speech_prob)
+            segment_count += 1
+
+        processing_time = time.time() - start_time
+
+        # Calculate average confidence
+        avg_confidence = total_confidence / segment_count if segment_count > 0 else 0.0
+
+        # Get audio duration (from last segment)
+        duration_seconds = transcript_segments[-1]['end'] if transcript_segments else 0.0
+
+        # Calculate character and word counts
+        full_text = ' '.join(full_text_parts)
+        character_count, word_count = self.calculate_text_metrics(full_text)
+
+        return {
+            'transcript_text': full_text,
+            'character_count': character_count,
+            'word_count': word_count,
+            'segments': transcript_segments,
+            'word_timestamps': word_timestamps_list if word_timestamps else None,
+            'language': info.language,
+            'duration_seconds': duration_seconds,
+            'confidence_score': avg_confidence,
+            'processing_time_seconds': processing_time,
+            'model_used': self.model_size
+        }
+
+    @staticmethod
+    def _get_window_settings() -> Tuple[int, float, float]:
+        """(processes, window seconds, minimum audio seconds) for windowed transcription."""
+        try:
+            processes = max(0, int(os.getenv('TRANSCRIBE_WINDOW_PROCESSES', '0')))
+        except ValueError:
+            processes = 0
+        window_seconds = float(os.getenv('TRANSCRIBE_WINDOW_SECONDS', '600'))
+        min_seconds = float(os.getenv('TRANSCRIBE_WINDOW_MIN_SECONDS', str(window_seconds * 2)))
+        return processes, window_seconds, min_seconds
+
+    def transcribe_windows(
+        self,
+        audio,
+        processes: int,
+        window_seconds: float = 600,
+        language: Optional[str] = None,
+        beam_size: int = 5,
+        vad_filter: bool = True,
+        word_timestamps: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Transcribe long audio as VAD-split windows decoded in parallel processes.
+
+        Windows are cut at silences (see plan_audio_windows()), decoded on a
+        pool of `processes` workers with one model replica each, and stitched
+        back with absolute timestamps; where a window had to be cut mid-speech
+        the overlapping segments are de-duplicated.
+
+        Args:
+            audio: 16 kHz mono float32 array (extract_audio_array())
+            processes: Worker processes (model replicas)
+            window_seconds: Target window length
+
+        Returns:
+            Same result dictionary as transcribe_file()
+        """
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        start_time = time.time()
+        speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500))
+        windows = plan_audio_windows(
+            speech,
+            total_samples=len(audio),
+            window_samples=int(window_seconds * AUDIO_SAMPLE_RATE),
+            max_samples=int(window_seconds * 1.2 * AUDIO_SAMPLE_RATE),
+            overlap_samples=int(self.WINDOW_OVERLAP_SECONDS * AUDIO_SAMPLE_RATE)
+        )
+        processes = max(1, min(processes, len(windows)))
+        cpu_threads = max(1, (os.cpu_count() or 1) // processes)
+
+        transcribe_kwargs = {
+            'language': language,
+            'beam_size': beam_size,
+            'vad_filter': vad_filter,
+            'word_timestamps': word_timestamps,
+        }
+        # spawn: CTranslate2 and the app's threads don't survive fork()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_window_worker,
+            initargs=(self.model_size, self.device, self.compute_type, cpu_threads)
+        ) as pool:
+            futures = [
+                pool.submit(_transcribe_window, audio[window['start']:window['end']], transcribe_kwargs)
+                for window in windows
+            ]
+            window_results = [future.result() for future in futures]
+
+        transcript_segments, word_timestamps_list, languages = stitch_window_results(
+            windows, window_results
+        )
+
+        full_text = ' '.join(segment['text'] for segment in transcript_segments)
+        character_count, word_count = self.calculate_text_metrics(full_text)
+        confidences = [1.0 - segment['no_speech_prob'] for segment in transcript_segments]
+
+        return {
+            'transcript_text': full_text,
+            'character_count': character_count,
+            'word_count': word_count,
+            'segments': transcript_segments,
+            'word_timestamps': word_timestamps_list if word_timestamps else None,
+            'language': language or (languages.most_common(1)[0][0] if languages else None),
+            'duration_seconds': transcript_segments[-1]['end'] if transcript_segments else 0.0,
+            'confidence_score': sum(confidences) / len(confidences) if confidences else 0.0,
+            'processing_time_seconds': time.time() - start_time,
+            'model_used': self.model_size
+        }
 
     def scan_directory(
         self,
@@ -433,20 +665,17 @@ class TranscriptionService:
 
         if extensions is None:
             extensions = self.VIDEO_EXTENSIONS
-        else:
-            extensions = {ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions}
-
-        video_files = []
-        path = Path(directory_path)
-
-        if recursive:
-            for ext in extensions:
-                video_files.extend(path.rglob(f'*{ext}'))
-        else:
-            for ext in extensions:
-                video_files.extend(path.glob(f'*{ext}'))
 
-        return [str(f) for f in video_files]
+        # Directories are listed in parallel (fast on network mounts)
+        return [
+            walked.path
+            for walked in walk_files(
+                directory_path,
+                recursive=recursive,
+                file_filter=extension_filter(extensions),
+                stat_files=False
+            )
+        ]
 
     def batch_transcribe(
         self,
@@ -456,11 +685,21 @@ class TranscriptionService:
         progress_callback: Optional[Callable[[TranscriptionProgress], None]] = None,
         force: bool = False,
         model_size: Optional[str] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
         **transcribe_kwargs
     ) -> TranscriptionProgress:
         """
         Transcribe multiple files in batch.
 
+        With workers >= 1 (or TRANSCRIBE_WORKERS) the batch is pipelined: audio
+        for the next files is extracted while earlier ones decode, on that many
+        model replicas. Otherwise files are processed one at a time through
+        transcribe_file(). Pipelined workers decode each file whole on their
+        own replica, so TRANSCRIBE_WINDOW_PROCESSES windowing only applies to
+        the one-at-a-time loop.
+
         Args:
             file_paths: List of video file paths to transcribe
             job_id: Unique job ID for tracking
@@ -468,6 +707,9 @@ class TranscriptionService:
             progress_callback: Callback function(progress) for progress updates
             force: Reprocess files even if already transcribed
             model_size: Model size to use (if different from current, will reload model)
+            workers: Model replicas decoding in parallel (0 = serial loop)
+            prefetch: Files whose audio is extracted ahead of the decoders
+            cpu_threads: CPU threads per model replica (default: cores / workers)
             **transcribe_kwargs: Additional arguments for transcribe_file()
 
         Returns:
@@ -494,6 +736,42 @@ class TranscriptionService:
         self._batch_jobs[job_id] = progress
         self._cancel_flags[job_id] = False
 
+        workers, prefetch, cpu_threads = self._get_pipeline_settings(
+            workers, prefetch, cpu_threads, device=self.device
+        )
+        if workers:
+            self._batch_transcribe_pipelined(
+                file_paths, job_id, progress, db_callback, progress_callback,
+                workers, prefetch, cpu_threads, **transcribe_kwargs
+            )
+        else:
+            self._batch_transcribe_serial(
+                file_paths, job_id, progress, db_callback, progress_callback, **transcribe_kwargs
+            )
+
+        # Finalize
+        progress.end_time = time.time()
+        if progress.status == 'RUNNING':
+            progress.status = 'COMPLETED'
+
+        progress.current_file = None
+
+        # Notify final progress
+        if progress_callback:
+            progress_callback(progress)
+
+        return progress
+
+    def _batch_transcribe_serial(
+        self,
+        file_paths: List[str],
+        job_id: str,
+        progress: TranscriptionProgress,
+        db_callback: Optional[Callable[[str, Dict[str, Any]], None]],
+        progress_callback: Optional[Callable[[TranscriptionProgress], None]],
+        **transcribe_kwargs
+    ):
+        """Transcribe batch files one at a time with the shared model."""
         for file_path in file_paths:
             # Check for cancellation
             if self._cancel_flags.get(job_id, False):
@@ -541,18 +819,203 @@ class TranscriptionService:
             if progress_callback:
                 progress_callback(progress)
 
-        # Finalize
-        progress.end_time = time.time()
-        if progress.status == 'RUNNING':
-            progress.status = 'COMPLETED'
+    @staticmethod
+    def get_max_workers(device: Optional[str] = None) -> int:
+        """
+        Most model replicas a batch may use (TRANSCRIBE_MAX_WORKERS).
 
-        progress.current_file = None
+        Defaults to 1 on CUDA, where every replica is a full model in the same
+        GPU's memory, and to the CPU count otherwise.
+        """
+        try:
+            return max(1, int(os.getenv('TRANSCRIBE_MAX_WORKERS', '')))
+        except ValueError:
+            if device == 'cuda':
+                return 1
+            return max(1, os.cpu_count() or 1)
 
-        # Notify final progress
-        if progress_callback:
-            progress_callback(progress)
+    @staticmethod
+    def _get_pipeline_settings(workers: Optional[int], prefetch: Optional[int],
+                               cpu_threads: Optional[int],
+                               device: Optional[str] = None) -> Tuple[int, int, int]:
+        """
+        Resolve (workers, prefetch, cpu_threads) for pipelined batches.
 
-        return progress
+        Arguments win over TRANSCRIBE_WORKERS / TRANSCRIBE_PREFETCH /
+        TRANSCRIBE_CPU_THREADS. workers == 0 means the serial batch loop;
+        workers is capped at get_max_workers(device).
+        """
+        def resolve(value, env_name, default):
+            for candidate in (value, os.getenv(env_name)):
+                if candidate in (None, ''):
+                    continue
+                try:
+                    return max(0, int(candidate))
+                except (TypeError, ValueError):
+                    continue
+            return default
+
+        # Each replica holds a full model in memory
+        workers = min(resolve(workers, 'TRANSCRIBE_WORKERS', 0), TranscriptionService.get_max_workers(device))
+        prefetch = max(1, resolve(prefetch, 'TRANSCRIBE_PREFETCH', 2))
+        # Split the cores between replicas so they don't oversubscribe
+        cpu_threads = resolve(cpu_threads, 'TRANSCRIBE_CPU_THREADS', 0) or \
+            max(1, (os.cpu_count() or 1) // max(1, workers))
+        return workers, prefetch, cpu_threads
+
+    def _batch_transcribe_pipelined(
+        self,
+        file_paths: List[str],
+        job_id: str,
+        progress: TranscriptionProgress,
+        db_callback: Optional[Callable[[str, Dict[str, Any]], None]],
+        progress_callback: Optional[Callable[[TranscriptionProgress], None]],
+        workers: int,
+        prefetch: int,
+        cpu_threads: int,
+        **transcribe_kwargs
+    ):
+        """
+        Pipelined batch: audio extraction overlaps decoding.
+
+        A producer pool extracts audio for up to `prefetch` files ahead into a
+        bounded queue; `workers` decode threads, each with its own model
+        replica using `cpu_threads` threads, consume it. Results, db_callback
+        and progress_callback are handled on the calling thread, in completion
+        order. Files are not split into windows here (see transcribe_windows()),
+        whatever TRANSCRIBE_WINDOW_PROCESSES is.
+        """
+        stream_audio = transcribe_kwargs.pop('stream_audio', None)
+        audio_queue: queue.Queue = queue.Queue(maxsize=prefetch)
+        result_queue: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        def cancelled() -> bool:
+            return stop.is_set() or self._cancel_flags.get(job_id, False)
+
+        def file_size(file_path: str) -> int:
+            try:
+                return os.path.getsize(file_path)
+            except OSError:
+                return 0
+
+        def enqueue(item) -> bool:
+            while not cancelled():
+                try:
+                    audio_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def extract(file_path: str):
+            if cancelled():
+                return
+            audio, error = None, None
+            try:
+                audio = self._prepare_audio(file_path, stream_audio)
+            except Exception as e:
+                error = e
+            # Blocks while the queue is full, which bounds extraction to `prefetch` ahead
+            if not enqueue((file_path, audio, error)):
+                self._discard_audio(audio)
+
+        def produce():
+            with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='transcribe-extract') as pool:
+                futures = [pool.submit(extract, file_path) for file_path in file_paths]
+                for future in futures:
+                    future.result()
+            for _ in range(workers):
+                enqueue(None)
+
+        def consume():
+            try:
+                model, model_error = self._create_model(cpu_threads=cpu_threads), None
+            except Exception as e:
+                model, model_error = None, e
+
+            while not cancelled():
+                try:
+                    item = audio_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    break
+                file_path, audio, error = item
+                try:
+                    if cancelled():
+                        break
+                    progress.current_file = file_path
+                    if error is None:
+                        error = model_error
+                    if error is not None:
+                        result_queue.put((file_path, None, error))
+                        continue
+                    try:
+                        result = self._transcribe_audio(
+                            model, audio, should_cancel=cancelled, **transcribe_kwargs
+                        )
+                        result_queue.put((file_path, result, None))
+                    except TranscriptionCancelled:
+                        break
+                    except Exception as e:
+                        result_queue.put((file_path, None, e))
+                finally:
+                    self._discard_audio(audio)
+            result_queue.put(None)  # This worker has exited
+
+        producer = threading.Thread(target=produce, name=f'transcribe-producer-{job_id[:8]}', daemon=True)
+        consumers = [
+            threading.Thread(target=consume, name=f'transcribe-worker-{job_id[:8]}-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        producer.start()
+        for consumer in consumers:
+            consumer.start()
+
+        running = workers
+        while running:
+            item = result_queue.get()
+            if item is None:
+                running -= 1
+                continue
+            file_path, result, error = item
+
+            if error is None:
+                try:
+                    # Save to database if callback provided
+                    if db_callback:
+                        db_callback(file_path, result)
+                except Exception as e:
+                    error = e
+            progress.processed_files_sizes.append(file_size(file_path))
+            if error is None:
+                progress.completed_files += 1
+            else:
+                progress.failed_files += 1
+                progress.errors.append({
+                    'file_path': file_path,
+                    'error': str(error)
+                })
+
+            # Notify progress
+            if progress_callback:
+                progress_callback(progress)
+
+        if self._cancel_flags.get(job_id, False):
+            progress.status = 'CANCELLED'
+        # Unblock the producer if every worker has exited early
+        stop.set()
+        producer.join()
+
+        # Audio extracted for files that were never decoded (cancelled)
+        while True:
+            try:
+                item = audio_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._discard_audio(item[1])
 
     def get_batch_progress(self, job_id: str) -> Optional[TranscriptionProgress]:
         """Get progress for a batch job."""
@@ -579,6 +1042,130 @@ class TranscriptionService:
         self._cancel_flags.pop(job_id, None)
 
 
+def plan_audio_windows(
+    speech: List[Dict[str, int]],
+    total_samples: int,
+    window_samples: int,
+    max_samples: int,
+    overlap_samples: int
+) -> List[Dict[str, int]]:
+    """
+    Split audio into ~window_samples windows, cutting in silences where possible.
+
+    Each cut goes at the middle of the silence gap (between VAD speech
+    regions) nearest the target length, no later than max_samples into the
+    window. With no gap available the cut is hard and both neighbouring
+    windows extend overlap_samples past it so no word is lost.
+
+    Args:
+        speech: VAD speech regions as {'start', 'end'} sample offsets, in order
+        total_samples: Audio length in samples
+
+    Returns:
+        List of {'start', 'end', 'core_start', 'core_end'} sample offsets.
+        Segments are kept by the window whose core contains their midpoint.
+    """
+    gaps = []
+    previous_end = 0
+    for region in speech:
+        if region['start'] > previous_end:
+            gaps.append((previous_end + region['start']) // 2)
+        previous_end = max(previous_end, region['end'])
+    if previous_end < total_samples:
+        gaps.append((previous_end + total_samples) // 2)
+
+    windows = []
+    core_start = 0
+    lead_overlap = 0
+    while core_start < total_samples:
+        if total_samples - core_start <= max_samples:
+            core_end, trail_overlap = total_samples, 0
+        else:
+            target = core_start + window_samples
+            candidates = [
+                cut for cut in gaps
+                if core_start + window_samples // 2 < cut <= core_start + max_samples
+            ]
+            if candidates:
+                core_end = min(candidates, key=lambda cut: abs(cut - target))
+                trail_overlap = 0
+            else:
+                core_end, trail_overlap = target, overlap_samples
+
+        windows.append({
+            'start': max(0, core_start - lead_overlap),
+            'end': min(total_samples, core_end + trail_overlap),
+            'core_start': core_start,
+            'core_end': core_end,
+        })
+        core_start = core_end
+        lead_overlap = trail_overlap
+    return windows
+
+
+def stitch_window_results(
+    windows: List[Dict[str, int]],
+    window_results: List[Dict[str, Any]],
+    sample_rate: int = AUDIO_SAMPLE_RATE
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Counter]:
+    """
+    Merge per-window transcription results into one timeline.
+
+    Segment and word times are shifted from window-relative to absolute, and
+    each segment is kept only by the window whose core contains its midpoint,
+    so text in an overlap is not repeated. Segments are renumbered from 1.
+
+    Args:
+        windows: plan_audio_windows() output
+        window_results: _transcribe_audio() result per window, in the same order
+
+    Returns:
+        (segments, words, Counter of detected languages per window)
+    """
+    transcript_segments = []
+    word_timestamps_list = []
+    languages = Counter()
+    for window, result in zip(windows, window_results):
+        offset = window['start'] / sample_rate
+        core_start = window['core_start'] / sample_rate
+        core_end = window['core_end'] / sample_rate
+        if result.get('language'):
+            languages[result['language']] += 1
+        for segment in result['segments']:
+            segment = dict(segment)
+            segment['start'] += offset
+            segment['end'] += offset
+            midpoint = (segment['start'] + segment['end']) / 2
+            if not core_start <= midpoint < core_end:
+                continue
+            if segment.get('words'):
+                segment['words'] = [
+                    dict(word, start=word['start'] + offset, end=word['end'] + offset)
+                    for word in segment['words']
+                ]
+                word_timestamps_list.extend(segment['words'])
+            segment['id'] = len(transcript_segments) + 1
+            transcript_segments.append(segment)
+    return transcript_segments, word_timestamps_list, languages
+
+
+# Per-process state for windowed transcription workers
+_window_service = None
+_window_model = None
+
+
+def _init_window_worker(model_size: str, device: str, compute_type: str, cpu_threads: int):
+    """ProcessPoolExecutor initializer: load one model replica per process."""
+    global _window_service, _window_model
+    _window_service = TranscriptionService(model_size, device, compute_type)
+    _window_model = _window_service._create_model(cpu_threads=cpu_threads)
+
+
+def _transcribe_window(audio, transcribe_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Transcribe one audio window in a worker process (timestamps window-relative)."""
+    return _window_service._transcribe_audio(_window_model, audio, **transcribe_kwargs)
+
+
 def create_transcription_service(
     model_size: str = 'medium',
     device: str = 'auto',
@@ -3,9 +3,11 @@ Video chunking service for long video handling in AWS Nova analysis.
 Provides FFmpeg-based video segmentation with overlap support for context preservation.
 """
 import os
+import shutil
 import tempfile
 import logging
 import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List, Tuple, Optional
 from pathlib import Path
 from botocore.exceptions import ClientError
@@ -56,6 +58,10 @@ class VideoChunker:
         }
     }
 
+    # Presigned URL lifetime and network read timeout for ranged ffprobe
+    PROBE_URL_EXPIRY_SECONDS = 900
+    PROBE_RW_TIMEOUT_SECONDS = 60
+
     def __init__(self, bucket_name: str, region: str,
                  aws_access_key: str = None, aws_secret_key: str = None,
                  temp_dir: str = None):
@@ -86,75 +92,133 @@ class VideoChunker:
 
         logger.info(f"VideoChunker initialized for bucket: {bucket_name}, temp_dir: {self.temp_dir}")
 
-    def get_video_metadata(self, s3_key: str) -> Dict[str, Any]:
+    def get_video_metadata(self, s3_key: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Extract video metadata (duration, format, dimensions) from S3 video.
 
+        ffprobe reads the object through a presigned URL, so only the header
+        and index byte ranges are transferred rather than the whole file (a
+        full download is the fallback). Results are cached on the file's row
+        keyed by the object's ETag, so repeat calls cost one HEAD request.
+
         Args:
             s3_key: S3 key of the video file
+            use_cache: Read and write the files table probe cache
 
         Returns:
             Dict with video metadata (duration, format, width, height, fps, codec)
         """
-        temp_file = None
         try:
-            # Download video to temp file for ffprobe analysis
-            temp_file = os.path.join(self.temp_dir, f"temp_video_{os.urandom(8).hex()}.mp4")
-
-            logger.info(f"Downloading video from S3 for metadata extraction: {s3_key}")
-            self.s3_client.download_file(self.bucket_name, s3_key, temp_file)
-
-            # Use ffprobe to extract metadata
-            probe = ffmpeg.probe(temp_file)
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError as e:
+            raise VideoChunkerError(f"S3 error reading video: {str(e)}")
+        etag = (head.get('ETag') or '').strip('"')
 
-            # Find video stream
-            video_stream = next(
-                (stream for stream in probe['streams'] if stream['codec_type'] == 'video'),
-                None
-            )
-
-            if not video_stream:
-                raise VideoChunkerError("No video stream found in file")
-
-            # Extract duration (prefer container duration, fallback to stream duration)
-            duration = float(probe['format'].get('duration', 0))
-            if duration == 0 and 'duration' in video_stream:
-                duration = float(video_stream['duration'])
-
-            # Extract frame rate
-            fps_str = video_stream.get('r_frame_rate', '30/1')
-            fps_parts = fps_str.split('/')
-            fps = float(fps_parts[0]) / float(fps_parts[1]) if len(fps_parts) == 2 else 30.0
-
-            metadata = {
-                'duration_seconds': round(duration, 2),
-                'format': probe['format'].get('format_name', 'unknown'),
-                'width': int(video_stream.get('width', 0)),
-                'height': int(video_stream.get('height', 0)),
-                'fps': round(fps, 2),
-                'codec': video_stream.get('codec_name', 'unknown'),
-                'bitrate': int(probe['format'].get('bit_rate', 0)),
-                'size_bytes': int(probe['format'].get('size', 0))
-            }
+        if use_cache and etag:
+            cached = self._get_cached_metadata(s3_key, etag)
+            if cached:
+                logger.info(f"Video metadata cache hit: {s3_key}")
+                return cached
 
+        try:
+            try:
+                probe = self._probe_presigned(s3_key)
+            except ffmpeg.Error as e:
+                error_msg = e.stderr.decode() if e.stderr else str(e)
+                logger.warning(f"Ranged probe failed for {s3_key}, downloading instead: {error_msg.strip()[-300:]}")
+                probe = self._probe_download(s3_key)
+
+            metadata = self._parse_probe(probe, head.get('ContentLength', 0))
             logger.info(f"Video metadata: {metadata}")
-            return metadata
 
         except ffmpeg.Error as e:
             error_msg = e.stderr.decode() if e.stderr else str(e)
             raise VideoChunkerError(f"FFmpeg error during metadata extraction: {error_msg}")
         except ClientError as e:
             raise VideoChunkerError(f"S3 error downloading video: {str(e)}")
+        except VideoChunkerError:
+            raise
         except Exception as e:
             raise VideoChunkerError(f"Failed to extract video metadata: {str(e)}")
+
+        if use_cache and etag:
+            self._set_cached_metadata(s3_key, etag, metadata)
+        return metadata
+
+    def _probe_presigned(self, s3_key: str) -> Dict[str, Any]:
+        """ffprobe the object over HTTPS (ffprobe issues ranged reads as it seeks)."""
+        url = self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': s3_key},
+            ExpiresIn=self.PROBE_URL_EXPIRY_SECONDS
+        )
+        logger.info(f"Probing video via presigned URL: {s3_key}")
+        # rw_timeout is in microseconds
+        return ffmpeg.probe(url, rw_timeout=self.PROBE_RW_TIMEOUT_SECONDS * 1000000)
+
+    def _probe_download(self, s3_key: str) -> Dict[str, Any]:
+        """ffprobe a full local copy of the object (for sources ffprobe can't stream)."""
+        temp_file = os.path.join(self.temp_dir, f"temp_video_{os.urandom(8).hex()}.mp4")
+        try:
+            logger.info(f"Downloading video from S3 for metadata extraction: {s3_key}")
+            self.s3_client.download_file(self.bucket_name, s3_key, temp_file)
+            return ffmpeg.probe(temp_file)
         finally:
-            # Clean up temp file
-            if temp_file and os.path.exists(temp_file):
+            if os.path.exists(temp_file):
                 try:
                     os.remove(temp_file)
                 except Exception as e:
                     logger.warning(f"Failed to remove temp file {temp_file}: {e}")
 
+    @staticmethod
+    def _parse_probe(probe: Dict[str, Any], object_size: int = 0) -> Dict[str, Any]:
+        """Build the get_video_metadata() dict from ffprobe output."""
+        # Find video stream
+        video_stream = next(
+            (stream for stream in probe['streams'] if stream['codec_type'] == 'video'),
+            None
+        )
+
+        if not video_stream:
+            raise VideoChunkerError("No video stream found in file")
+
+        # Extract duration (prefer container duration, fallback to stream duration)
+        duration = float(probe['format'].get('duration', 0))
+        if duration == 0 and 'duration' in video_stream:
+            duration = float(video_stream['duration'])
+
+        # Extract frame rate
+        fps_str = video_stream.get('r_frame_rate', '30/1')
+        fps_parts = fps_str.split('/')
+        fps = float(fps_parts[0]) / float(fps_parts[1]) if len(fps_parts) == 2 else 30.0
+
+        return {
+            'duration_seconds': round(duration, 2),
+            'format': probe['format'].get('format_name', 'unknown'),
+            'width': int(video_stream.get('width', 0)),
+            'height': int(video_stream.get('height', 0)),
+            'fps': round(fps, 2),
+            'codec': video_stream.get('codec_name', 'unknown'),
+            'bitrate': int(probe['format'].get('bit_rate', 0)),
+            'size_bytes': int(probe['format'].get('size') or object_size or 0)
+        }
+
+    def _get_cached_metadata(self, s3_key: str, etag: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached probe; cache problems never fail the probe itself."""
+        try:
+            from app.database import get_db
+            return get_db().get_cached_probe_metadata(s3_key, etag)
+        except Exception as e:
+            logger.warning(f"Video metadata cache lookup failed for {s3_key}: {e}")
+            return None
+
+    def _set_cached_metadata(self, s3_key: str, etag: str, metadata: Dict[str, Any]) -> None:
+        try:
+            from app.database import get_db
+            get_db().set_cached_probe_metadata(s3_key, etag, metadata)
+        except Exception as e:
+            logger.warning(f"Failed to cache video metadata for {s3_key}: {e}")
+
     def calculate_chunk_parameters(self, model: str, video_duration: float) -> Dict[str, Any]:
         """
         Calculate optimal chunk size and overlap for given model and video duration.
@@ -324,6 +388,233 @@ class VideoChunker:
                     except Exception as e:
                         logger.warning(f"Failed to remove temp file {temp_file}: {e}")
 
+    def download_source(self, s3_key: str) -> str:
+        """
+        Download a source video to a temp file shared by all chunk cuts.
+
+        Args:
+            s3_key: Source video S3 key
+
+        Returns:
+            Local path of the downloaded file (caller removes it)
+        """
+        suffix = Path(s3_key).suffix or '.mp4'
+        local_path = os.path.join(self.temp_dir, f"source_{os.urandom(8).hex()}{suffix}")
+        logger.info(f"Downloading source video from S3: {s3_key}")
+        try:
+            self.s3_client.download_file(self.bucket_name, s3_key, local_path)
+        except ClientError as e:
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            raise VideoChunkerError(f"S3 error downloading source video: {str(e)}")
+        return local_path
+
+    def split_local_video(self, local_path: str, chunks: List[Dict[str, Any]],
+                          work_dir: str) -> Dict[int, str]:
+        """
+        Cut all chunks from a local video with one ffmpeg segment-muxer pass.
+
+        The segment muxer can't emit overlapping segments, so the source is cut
+        at every chunk edge (core and overlap) into contiguous pieces, and each
+        chunk is then stream-copied together from its pieces with the concat
+        demuxer. Cuts land on keyframes, as with extract_video_segment().
+
+        Args:
+            local_path: Local source video
+            chunks: Chunk dicts from generate_chunk_boundaries()
+            work_dir: Directory for the pieces and chunk files
+
+        Returns:
+            Dict of chunk index -> local chunk file path
+        """
+        video_end = max(chunk['overlap_end'] for chunk in chunks)
+        edges = sorted({
+            round(t, 3)
+            for chunk in chunks
+            for t in (chunk['overlap_start'], chunk['overlap_end'])
+            if 0 < t < video_end
+        })
+
+        try:
+            if edges:
+                piece_list = os.path.join(work_dir, 'pieces.csv')
+                logger.info(f"Cutting {local_path} into {len(edges) + 1} pieces at {edges}")
+                stream = ffmpeg.input(local_path)
+                stream = ffmpeg.output(
+                    stream,
+                    os.path.join(work_dir, 'piece_%04d.mp4'),
+                    codec='copy',
+                    f='segment',
+                    segment_times=','.join(f'{t:.3f}' for t in edges),
+                    segment_format='mp4',
+                    segment_list=piece_list,
+                    segment_list_type='csv',
+                    reset_timestamps=1,
+                    loglevel='error'
+                )
+                ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+                # (path, start) per piece; cuts snap to the next keyframe so a
+                # piece starts at or after the edge it was cut at (possibly
+                # past the following edge when keyframes are sparse)
+                pieces = []
+                with open(piece_list) as f:
+                    for line in f:
+                        name, start, _end = line.strip().rsplit(',', 2)
+                        pieces.append((os.path.join(work_dir, name), float(start)))
+            else:
+                pieces = [(local_path, 0.0)]
+
+            chunk_paths = {}
+            for chunk in chunks:
+                chunk_pieces = self._select_chunk_pieces(
+                    pieces, chunk['overlap_start'], chunk['overlap_end']
+                )
+                chunk_path = os.path.join(work_dir, f"chunk_{chunk['index']:03d}.mp4")
+                if not chunk_pieces:
+                    logger.warning(
+                        f"No segment pieces for chunk {chunk['index']}, cutting it directly"
+                    )
+                    self._cut_local_segment(
+                        local_path, chunk['overlap_start'], chunk['overlap_end'], chunk_path
+                    )
+                    chunk_paths[chunk['index']] = chunk_path
+                    continue
+
+                list_path = os.path.join(work_dir, f"chunk_{chunk['index']:03d}.txt")
+                with open(list_path, 'w') as f:
+                    for piece in chunk_pieces:
+                        escaped = piece.replace("'", "'\\''")
+                        f.write(f"file '{escaped}'\n")
+                stream = ffmpeg.input(list_path, f='concat', safe=0)
+                stream = ffmpeg.output(
+                    stream, chunk_path, codec='copy', movflags='+faststart', loglevel='error'
+                )
+                ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+
+                if not os.path.exists(chunk_path):
+                    raise VideoChunkerError(f"Chunk {chunk['index']} was not created")
+                chunk_paths[chunk['index']] = chunk_path
+
+            return chunk_paths
+
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            raise VideoChunkerError(f"FFmpeg error during segment extraction: {error_msg}")
+
+    @staticmethod
+    def _select_chunk_pieces(pieces: List[Tuple[str, float]], overlap_start: float,
+                             overlap_end: float) -> List[str]:
+        """
+        Pick the pieces that cover [overlap_start, overlap_end).
+
+        Cuts snap to the next keyframe, so the piece holding overlap_start may
+        start before it; coverage begins at the last piece starting at or
+        before overlap_start and runs through the last piece starting before
+        overlap_end.
+
+        Args:
+            pieces: (path, start seconds) per piece, in order
+
+        Returns:
+            Piece paths in order (empty only if there are no pieces)
+        """
+        tolerance = 0.001
+        first = 0
+        for i, (_path, start) in enumerate(pieces):
+            if start <= overlap_start + tolerance:
+                first = i
+            else:
+                break
+        return [
+            path for i, (path, start) in enumerate(pieces)
+            if i == first or (i > first and start < overlap_end - tolerance)
+        ]
+
+    def _cut_local_segment(self, local_path: str, start_time: float, end_time: float,
+                           output_path: str):
+        """Stream-copy [start_time, end_time) of a local video, as extract_video_segment() does."""
+        stream = ffmpeg.input(local_path, ss=start_time, to=end_time)
+        stream = ffmpeg.output(
+            stream,
+            output_path,
+            codec='copy',
+            avoid_negative_ts='make_zero',
+            loglevel='error'
+        )
+        ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+        if not os.path.exists(output_path):
+            raise VideoChunkerError(f"Video segment extraction failed - {output_path} not created")
+
+    def upload_chunks(self, chunk_files: Dict[str, str], max_workers: int = 4) -> List[str]:
+        """
+        Upload local chunk files to S3 in parallel.
+
+        Args:
+            chunk_files: Dict of destination S3 key -> local file path
+            max_workers: Concurrent uploads
+
+        Returns:
+            S3 keys uploaded (all of them, or an exception is raised)
+        """
+        def upload(s3_key: str, local_path: str) -> str:
+            self.s3_client.upload_file(
+                local_path,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={'ContentType': 'video/mp4'}
+            )
+            logger.info(f"Chunk uploaded successfully: {s3_key} ({os.path.getsize(local_path)} bytes)")
+            return s3_key
+
+        uploaded = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='chunk-upload') as pool:
+            futures = {pool.submit(upload, key, path): key for key, path in chunk_files.items()}
+            for future in as_completed(futures):
+                try:
+                    uploaded.append(future.result())
+                except Exception as e:
+                    errors.append(f"{futures[future]}: {e}")
+
+        if errors:
+            # Don't leave partial uploads behind
+            for s3_key in uploaded:
+                self.delete_chunk(s3_key)
+            raise VideoChunkerError(f"S3 error during chunk upload: {'; '.join(errors)}")
+        return uploaded
+
+    def extract_video_segments(self, s3_key: str, chunks: List[Dict[str, Any]],
+                               upload_workers: int = 4) -> Dict[int, str]:
+        """
+        Extract and upload all chunks of a video, downloading the source once.
+
+        Args:
+            s3_key: Source video S3 key
+            chunks: Chunk dicts from generate_chunk_boundaries()
+            upload_workers: Concurrent chunk uploads
+
+        Returns:
+            Dict of chunk index -> chunk S3 key
+        """
+        work_dir = tempfile.mkdtemp(prefix='chunks_', dir=self.temp_dir)
+        local_source = None
+        try:
+            local_source = self.download_source(s3_key)
+            chunk_paths = self.split_local_video(local_source, chunks, work_dir)
+            chunk_keys = {index: self.get_chunk_s3_key(s3_key, index) for index in chunk_paths}
+            self.upload_chunks(
+                {chunk_keys[index]: path for index, path in chunk_paths.items()},
+                max_workers=upload_workers
+            )
+            return chunk_keys
+        finally:
+            if local_source and os.path.exists(local_source):
+                try:
+                    os.remove(local_source)
+                except Exception as e:
+                    logger.warning(f"Failed to remove temp file {local_source}: {e}")
+            shutil.rmtree(work_dir, ignore_errors=True)
+
     def delete_chunk(self, s3_key: str) -> bool:
         """
         Delete chunk file from S3.
@@ -3473,6 +3473,8 @@ function renderRescanResults(data) {
     document.getElementById('rescanDeleted').textContent = summary.deleted;
     document.getElementById('rescanNew').textContent = summary.new;
     document.getElementById('rescanAmbiguous').textContent = summary.ambiguous;
+    document.getElementById('rescanDirsSkipped').textContent =
+        `${summary.directories_skipped || 0} of ${(summary.directories_skipped || 0) + (summary.directories_scanned || 0)}`;
 
     // Render moved files
     const movedSection = document.getElementById('rescanMovedSection');
@@ -0,0 +1,162 @@
+"""
+Parallel directory walker for large and network-mounted trees.
+
+On SMB/NFS every directory listing and stat() is a network round trip, so a
+single-threaded walk spends most of its time waiting. walk_files() lists
+directories on a thread pool (each worker stats the files of the directory it
+listed, which bounds in-flight stats to the pool size) and yields files as
+each directory completes, so callers can report progress and start work
+before the walk finishes.
+"""
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WalkedFile:
+    """A file found by the walker (stat fields are None when not requested)."""
+    path: str
+    name: str
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    ctime: Optional[float] = None
+
+
+# list_directory(dir_path) -> (files, subdirectory paths)
+DirectoryLister = Callable[[str], Tuple[List[WalkedFile], List[str]]]
+
+
+def default_walk_workers() -> int:
+    """Directory listing threads (WALK_WORKERS, default 8)."""
+    try:
+        return max(1, int(os.getenv('WALK_WORKERS', '')))
+    except ValueError:
+        return 8
+
+
+def extension_filter(extensions: Iterable[str]) -> Callable[[str], bool]:
+    """File name filter for a set of extensions (with or without the dot, any case)."""
+    normalized = {ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions}
+    return lambda name: os.path.splitext(name)[1].lower() in normalized
+
+
+def scan_directory_entries(dir_path: str,
+                           file_filter: Optional[Callable[[str], bool]] = None,
+                           stat_files: bool = True,
+                           follow_symlinks: bool = False) -> Tuple[List[WalkedFile], List[str]]:
+    """
+    List one directory with os.scandir.
+
+    Entries that can't be read are logged and skipped; an unreadable
+    directory lists as empty.
+
+    Returns:
+        (files passing file_filter, subdirectory paths)
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if file_filter and not file_filter(entry.name):
+                        continue
+                    if stat_files:
+                        stat = entry.stat()
+                        files.append(WalkedFile(entry.path, entry.name, stat.st_size,
+                                                stat.st_mtime, stat.st_ctime))
+                    else:
+                        files.append(WalkedFile(entry.path, entry.name))
+                except OSError as e:
+                    logger.warning(f"Could not access {entry.path}: {e}")
+    except OSError as e:
+        logger.warning(f"Could not list {dir_path}: {e}")
+    return files, subdirs
+
+
+def walk_files(root: str,
+               recursive: bool = True,
+               file_filter: Optional[Callable[[str], bool]] = None,
+               stat_files: bool = True,
+               follow_symlinks: bool = False,
+               workers: Optional[int] = None,
+               list_directory: Optional[DirectoryLister] = None,
+               should_cancel: Optional[Callable[[], bool]] = None,
+               stats: Optional[Dict[str, int]] = None) -> Iterator[WalkedFile]:
+    """
+    Yield files under root, listing directories in parallel.
+
+    Files arrive grouped by directory in completion order (not sorted).
+    Stopping iteration, or should_cancel() returning True (checked on the
+    caller's thread between directories), stops the walk.
+
+    Args:
+        root: Directory to walk
+        recursive: Descend into subdirectories
+        file_filter: Keep only file names for which this returns True
+        stat_files: Fill in size/mtime/ctime (one stat per kept file)
+        follow_symlinks: Descend into symlinked directories (each real
+            directory is visited once, so link loops are safe)
+        workers: Listing threads (default: default_walk_workers())
+        list_directory: Replaces scan_directory_entries() for each directory,
+            e.g. to serve unchanged directories from a cache
+        stats: Updated in place with 'directories_found' and
+            'directories_listed' as the walk goes, so callers can estimate
+            the total (files so far * found / listed) without a count pass
+    """
+    workers = workers or default_walk_workers()
+    if list_directory is None:
+        def list_directory(dir_path: str):
+            return scan_directory_entries(dir_path, file_filter, stat_files, follow_symlinks)
+
+    seen = set()
+
+    def first_visit(dir_path: str) -> bool:
+        if not follow_symlinks:
+            return True
+        real_path = os.path.realpath(dir_path)
+        if real_path in seen:
+            return False
+        seen.add(real_path)
+        return True
+
+    pending_dirs = deque([root] if first_visit(root) else [])
+    if stats is not None:
+        stats['directories_found'] = len(pending_dirs)
+        stats['directories_listed'] = 0
+    # Cap queued listings so a wide tree doesn't flood the executor
+    max_in_flight = workers * 4
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dir-walk')
+    in_flight = set()
+    try:
+        while pending_dirs or in_flight:
+            while pending_dirs and len(in_flight) < max_in_flight:
+                in_flight.add(pool.submit(list_directory, pending_dirs.popleft()))
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                if recursive:
+                    new_dirs = [d for d in subdirs if first_visit(d)]
+                    pending_dirs.extend(new_dirs)
+                    if stats is not None:
+                        stats['directories_found'] += len(new_dirs)
+                if stats is not None:
+                    stats['directories_listed'] += 1
+                yield from files
+
+            if should_cancel and should_cancel():
+                return
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
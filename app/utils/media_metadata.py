@@ -14,25 +14,15 @@ class MediaMetadataError(Exception):
     pass
 
 
-def extract_media_metadata(file_path: str) -> Dict[str, Any]:
+def probe_media(file_path: str) -> Dict[str, Any]:
     """
-    Extract comprehensive media metadata from a video or image file using FFprobe.
+    Run FFprobe once and return its raw JSON (format + streams).
 
-    Args:
-        file_path: Path to the media file
-
-    Returns:
-        Dictionary containing:
-        - resolution_width: int (video width in pixels)
-        - resolution_height: int (video height in pixels)
-        - frame_rate: float (frames per second)
-        - codec_video: str (video codec name)
-        - codec_audio: str (audio codec name, None if no audio)
-        - duration_seconds: float (duration in seconds)
-        - bitrate: int (bitrate in bits per second)
+    The result can be passed to parse_media_metadata(), select_audio_stream_index()
+    and derive_proxy_metadata() so a file is only probed once.
 
     Raises:
-        MediaMetadataError: If FFprobe is not available or extraction fails
+        MediaMetadataError: If FFprobe is not available or fails
     """
     if not shutil.which('ffprobe'):
         raise MediaMetadataError("ffprobe is not available on the system")
@@ -68,10 +58,36 @@ def extract_media_metadata(file_path: str) -> Dict[str, Any]:
         raise MediaMetadataError(f"FFprobe execution error: {str(e)}")
 
     try:
-        probe_data = json.loads(result.stdout)
+        return json.loads(result.stdout)
     except json.JSONDecodeError as e:
         raise MediaMetadataError(f"Failed to parse FFprobe output: {e}")
 
+
+def extract_media_metadata(file_path: str) -> Dict[str, Any]:
+    """
+    Extract comprehensive media metadata from a video or image file using FFprobe.
+
+    Args:
+        file_path: Path to the media file
+
+    Returns:
+        Dictionary containing:
+        - resolution_width: int (video width in pixels)
+        - resolution_height: int (video height in pixels)
+        - frame_rate: float (frames per second)
+        - codec_video: str (video codec name)
+        - codec_audio: str (audio codec name, None if no audio)
+        - duration_seconds: float (duration in seconds)
+        - bitrate: int (bitrate in bits per second)
+
+    Raises:
+        MediaMetadataError: If FFprobe is not available or extraction fails
+    """
+    return parse_media_metadata(probe_media(file_path))
+
+
+def parse_media_metadata(probe_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the extract_media_metadata() dictionary from probe_media() output."""
     # Extract metadata from probe data
     metadata = {
         'resolution_width': None,
@@ -163,6 +179,93 @@ def extract_media_metadata(file_path: str) -> Dict[str, Any]:
     return metadata
 
 
+def select_audio_stream_index(probe_data: Dict[str, Any]) -> Optional[int]:
+    """Index of the audio stream with the most channels, or None if there is no audio."""
+    candidates = []
+    for stream in probe_data.get('streams', []):
+        if stream.get('codec_type') != 'audio':
+            continue
+        codec_name = (stream.get('codec_name') or '').lower()
+        if not codec_name or codec_name == 'none':
+            continue
+        candidates.append((stream.get('channels') or 0, stream.get('index')))
+
+    if not candidates:
+        return None
+    candidates.sort(reverse=True)
+    return candidates[0][1]
+
+
+def _display_dimensions(video_stream: Dict[str, Any]) -> tuple[Optional[int], Optional[int]]:
+    """Width/height after applying rotation metadata (ffmpeg autorotates on encode)."""
+    width = video_stream.get('width')
+    height = video_stream.get('height')
+    rotation = (video_stream.get('tags') or {}).get('rotate')
+    for side_data in video_stream.get('side_data_list') or []:
+        if 'rotation' in side_data:
+            rotation = side_data['rotation']
+    try:
+        if rotation is not None and abs(int(float(rotation))) % 180 == 90:
+            width, height = height, width
+    except (ValueError, TypeError):
+        pass
+    return width, height
+
+
+def has_square_pixels(probe_data: Dict[str, Any]) -> bool:
+    """Whether the first video stream's sample aspect ratio is 1:1 (or unset)."""
+    video_stream = next(
+        (s for s in probe_data.get('streams', []) if s.get('codec_type') == 'video'), {}
+    )
+    sar = video_stream.get('sample_aspect_ratio')
+    if not sar or sar in ('0:1', 'N/A'):
+        return True
+    try:
+        num, den = (int(part) for part in str(sar).split(':'))
+    except ValueError:
+        return True
+    return num == 0 or den == 0 or num == den
+
+
+def derive_proxy_metadata(probe_data: Dict[str, Any], proxy_size_bytes: int,
+                          height: int = 720, frame_rate: float = 15.0,
+                          has_audio: bool = True) -> Dict[str, Any]:
+    """
+    Compute proxy metadata from the source probe instead of probing the proxy.
+
+    Mirrors the proxy encode (scale=-2:<height>, fps=<frame_rate>, H.264/AAC),
+    so the values match what ffprobe would report for the proxy. Only valid
+    for square-pixel sources (see has_square_pixels()); probe the proxy for
+    anything else.
+    """
+    source = parse_media_metadata(probe_data)
+    video_stream = next(
+        (s for s in probe_data.get('streams', []) if s.get('codec_type') == 'video'), {}
+    )
+    source_width, source_height = _display_dimensions(video_stream)
+
+    width = None
+    try:
+        if source_width and source_height:
+            # scale=-2 keeps the aspect ratio and rounds to an even width
+            width = int(round(int(source_width) * height / int(source_height) / 2.0)) * 2
+    except (ValueError, TypeError, ZeroDivisionError):
+        width = None
+
+    duration = source.get('duration_seconds')
+    bitrate = int(proxy_size_bytes * 8 / duration) if duration else None
+
+    return {
+        'resolution_width': width,
+        'resolution_height': height,
+        'frame_rate': float(frame_rate),
+        'codec_video': 'h264',
+        'codec_audio': 'aac' if has_audio else None,
+        'duration_seconds': duration,
+        'bitrate': bitrate
+    }
+
+
 def format_media_metadata(metadata: Dict[str, Any]) -> str:
     """
     Format media metadata as a human-readable string.
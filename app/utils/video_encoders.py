@@ -0,0 +1,180 @@
+"""
+H.264 encoder detection and selection for proxy encoding.
+
+Probes `ffmpeg -encoders` once per process, verifies hardware encoders with a
+tiny test encode (static ffmpeg builds list h264_nvenc even without a GPU),
+and picks the first usable encoder from NVENC, VAAPI, QSV and libx264.
+"""
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    """ffmpeg arguments for one H.264 encoder at proxy quality."""
+    name: str
+    hardware: bool
+    # Arguments placed before -i (device setup)
+    input_args: List[str] = field(default_factory=list)
+    # Appended to the proxy filter chain (pixel format / hardware upload)
+    filter_suffix: str = ''
+    # Encoder arguments (rate control roughly equivalent to NVENC -cq 28)
+    output_args: List[str] = field(default_factory=list)
+    # Threads per encode when PROXY_ENCODER_THREADS is unset (None = by CPU share)
+    default_threads: Optional[int] = None
+
+
+VAAPI_DEVICE = os.getenv('PROXY_VAAPI_DEVICE', '/dev/dri/renderD128')
+
+# Preference order for auto-selection
+ENCODER_PROFILES = {
+    'h264_nvenc': EncoderProfile(
+        name='h264_nvenc',
+        hardware=True,
+        output_args=['-c:v', 'h264_nvenc', '-preset', 'p4', '-cq', '28', '-pix_fmt', 'yuv420p'],
+        default_threads=2,
+    ),
+    'h264_vaapi': EncoderProfile(
+        name='h264_vaapi',
+        hardware=True,
+        input_args=['-vaapi_device', VAAPI_DEVICE],
+        filter_suffix=',format=nv12,hwupload',
+        output_args=['-c:v', 'h264_vaapi', '-rc_mode', 'CQP', '-qp', '26'],
+        default_threads=2,
+    ),
+    'h264_qsv': EncoderProfile(
+        name='h264_qsv',
+        hardware=True,
+        filter_suffix=',format=nv12',
+        output_args=['-c:v', 'h264_qsv', '-preset', 'faster', '-global_quality', '26'],
+        default_threads=2,
+    ),
+    'libx264': EncoderProfile(
+        name='libx264',
+        hardware=False,
+        output_args=['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '26', '-pix_fmt', 'yuv420p'],
+    ),
+}
+
+_lock = threading.Lock()
+_available: Optional[Set[str]] = None
+_selected: Optional[EncoderProfile] = None
+
+
+def list_ffmpeg_encoders() -> Set[str]:
+    """Names of the video encoders compiled into ffmpeg (cached)."""
+    global _available
+    with _lock:
+        if _available is not None:
+            return _available
+        encoders = set()
+        if shutil.which('ffmpeg'):
+            try:
+                result = subprocess.run(
+                    ['ffmpeg', '-hide_banner', '-encoders'],
+                    capture_output=True, text=True, check=False, timeout=15
+                )
+                for line in result.stdout.splitlines():
+                    parts = line.split()
+                    # Lines look like " V....D libx264   libx264 H.264 ..."
+                    if len(parts) >= 2 and parts[0].startswith('V'):
+                        encoders.add(parts[1])
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Could not list ffmpeg encoders: {e}")
+        _available = encoders
+        return encoders
+
+
+def _encoder_works(profile: EncoderProfile) -> bool:
+    """Run a tiny test encode to confirm the encoder's device is usable."""
+    if profile.name == 'h264_vaapi' and not os.path.exists(VAAPI_DEVICE):
+        return False
+    command = [
+        'ffmpeg', '-hide_banner', '-v', 'error',
+        *profile.input_args,
+        '-f', 'lavfi', '-i', 'color=c=black:s=256x256:r=15:d=0.2',
+        '-vf', f'null{profile.filter_suffix}',
+        *profile.output_args,
+        '-frames:v', '2', '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=False, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+def get_video_encoder() -> EncoderProfile:
+    """
+    Get the encoder profile for proxy encoding (selected once, then cached).
+
+    PROXY_VIDEO_ENCODER forces an encoder (h264_nvenc, h264_vaapi, h264_qsv,
+    libx264); the default 'auto' uses the first one that passes a test encode.
+    """
+    global _selected
+    if _selected is not None:
+        return _selected
+
+    available = list_ffmpeg_encoders()
+    with _lock:
+        if _selected is not None:
+            return _selected
+
+        preferred = os.getenv('PROXY_VIDEO_ENCODER', 'auto').strip().lower()
+        if preferred in ENCODER_PROFILES:
+            candidates = [preferred]
+        else:
+            if preferred != 'auto':
+                logger.warning(f"Unknown PROXY_VIDEO_ENCODER '{preferred}', using auto-detection")
+            candidates = list(ENCODER_PROFILES)
+
+        selected = ENCODER_PROFILES['libx264']
+        for name in candidates:
+            profile = ENCODER_PROFILES[name]
+            if name not in available:
+                continue
+            if not profile.hardware or _encoder_works(profile):
+                selected = profile
+                break
+            logger.info(f"Encoder {name} is listed by ffmpeg but failed a test encode, skipping")
+
+        _selected = selected
+        logger.info(f"Proxy video encoder: {selected.name}")
+        return selected
+
+
+def get_fallback_encoder() -> EncoderProfile:
+    """Software encoder used when a hardware encode fails at runtime."""
+    return ENCODER_PROFILES['libx264']
+
+
+def default_video_concurrency() -> int:
+    """Default number of concurrent proxy encodes (BATCH_PROXY_VIDEO_CONCURRENCY)."""
+    try:
+        return max(1, int(os.getenv('BATCH_PROXY_VIDEO_CONCURRENCY', '')))
+    except ValueError:
+        return max(1, (os.cpu_count() or 1) // 8)
+
+
+def get_encoder_threads(profile: EncoderProfile, concurrency: Optional[int] = None) -> int:
+    """
+    Threads for one encode so concurrent encodes don't oversubscribe cores.
+
+    PROXY_ENCODER_THREADS wins; otherwise hardware encoders get their fixed
+    default and libx264 gets an even share of the CPUs across `concurrency`
+    simultaneous encodes (default: default_video_concurrency()).
+    """
+    try:
+        return max(1, int(os.getenv('PROXY_ENCODER_THREADS', '')))
+    except ValueError:
+        pass
+    if profile.default_threads is not None:
+        return profile.default_threads
+    return max(1, (os.cpu_count() or 1) // max(1, concurrency or default_video_concurrency()))
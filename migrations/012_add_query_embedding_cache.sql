@@ -0,0 +1,19 @@
+-- Migration 012: Add persistent cache for search query embeddings
+-- Repeated searches and result paging reuse the stored vector instead of calling Bedrock
+
+CREATE TABLE IF NOT EXISTS query_embedding_cache (
+    cache_key TEXT PRIMARY KEY,           -- sha256 of normalized query|model|dimension|purpose
+    normalized_query TEXT NOT NULL,
+    model_id TEXT NOT NULL,
+    dimension INTEGER NOT NULL,
+    purpose TEXT NOT NULL,                -- EmbeddingPurpose value
+    embedding BLOB NOT NULL,              -- float32 vector bytes
+    embed_latency_ms REAL,                -- Bedrock latency when first computed
+    created_at REAL NOT NULL,             -- Unix epoch seconds (TTL)
+    last_used_at REAL NOT NULL,           -- Unix epoch seconds (LRU eviction)
+    hit_count INTEGER DEFAULT 0
+);
+
+-- Index for least-recently-used eviction
+CREATE INDEX IF NOT EXISTS idx_query_embedding_cache_last_used
+ON query_embedding_cache(last_used_at DESC);
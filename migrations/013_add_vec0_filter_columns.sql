@@ -0,0 +1,39 @@
+-- Migration 013: Rebuild nova_embeddings with vec0 filter columns (sqlite-vec v0.1.6+)
+-- Lets semantic search filter by source type / model / file inside the KNN
+-- instead of post-filtering the top-k neighbours.
+--
+-- Prefer the script, which checks the sqlite-vec version and is idempotent:
+--   python -m scripts.migrate_vec0_filter_columns
+--
+-- NOTE: sqlite-vec extension must be loaded first (.load /path/to/vec0).
+-- Set the embedding dimension to match NOVA_EMBED_DIMENSION (default 1024).
+
+BEGIN IMMEDIATE;
+
+CREATE TABLE nova_embeddings_migration (
+    rowid INTEGER PRIMARY KEY,
+    embedding BLOB NOT NULL
+);
+
+INSERT INTO nova_embeddings_migration (rowid, embedding)
+SELECT rowid, embedding FROM nova_embeddings;
+
+DROP TABLE nova_embeddings;
+
+CREATE VIRTUAL TABLE nova_embeddings USING vec0(
+    embedding float[1024],
+    source_type text partition key,  -- 'nova_analysis' or 'transcript'
+    model_name text,
+    file_id integer                  -- 0 when the embedding has no file
+);
+
+-- Vectors without metadata rows are dropped
+INSERT INTO nova_embeddings (rowid, embedding, source_type, model_name, file_id)
+SELECT v.rowid, v.embedding, m.source_type, m.model_name, COALESCE(m.file_id, 0)
+FROM nova_embeddings_migration v
+JOIN nova_embedding_metadata m ON m.rowid = v.rowid
+ORDER BY v.rowid;
+
+DROP TABLE nova_embeddings_migration;
+
+COMMIT;
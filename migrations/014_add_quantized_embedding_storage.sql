@@ -0,0 +1,13 @@
+-- Migration 014: Optional int8 / binary quantized embedding storage
+-- Quantized vec0 tables run the coarse KNN; the float32 vectors kept here
+-- re-rank the candidates by exact L2 distance.
+--
+-- Switch modes with the script, which copies and re-quantizes the vectors:
+--   python -m scripts.migrate_embedding_storage --mode int8
+--
+-- Table is created on app start; it stays empty in float mode.
+
+CREATE TABLE IF NOT EXISTS nova_embedding_vectors (
+    rowid INTEGER PRIMARY KEY,   -- same rowid as nova_embeddings / nova_embedding_metadata
+    embedding BLOB NOT NULL      -- float32 vector bytes
+);
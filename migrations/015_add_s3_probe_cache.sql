@@ -0,0 +1,6 @@
+-- Migration 015: Cache S3 video probe results on the files table
+-- VideoChunker.get_video_metadata() reuses the stored result while the
+-- object's ETag is unchanged, so repeat analyses skip ffprobe entirely.
+
+ALTER TABLE files ADD COLUMN probe_etag TEXT;         -- S3 ETag the probe was taken from
+ALTER TABLE files ADD COLUMN probe_metadata JSON;     -- get_video_metadata() result
@@ -0,0 +1,17 @@
+-- Migration 016: Persisted directory scan index for incremental rescans
+-- A rescan reuses a directory's stored listing when the directory's mtime is
+-- unchanged (entries added, removed or renamed bump it), so only changed
+-- directories are listed and their files stat()ed.
+
+CREATE TABLE IF NOT EXISTS directory_scan_index (
+    path TEXT PRIMARY KEY,            -- absolute directory path
+    root_path TEXT NOT NULL,          -- rescan root it was last scanned under
+    mtime REAL NOT NULL,              -- directory st_mtime at scan time
+    scanned_at REAL NOT NULL,         -- Unix epoch seconds
+    extensions TEXT NOT NULL,         -- sorted supported extensions the listing was filtered by
+    files JSON NOT NULL,              -- [[name, size_bytes, mtime], ...] of supported files
+    subdirs JSON NOT NULL             -- [name, ...] of subdirectories
+);
+
+CREATE INDEX IF NOT EXISTS idx_directory_scan_index_root
+ON directory_scan_index(root_path);
@@ -0,0 +1,7 @@
+-- Migration 017: Cache partial content fingerprints on the files table
+-- Rescans hash the size plus start/middle/end 1 MB samples of a file to
+-- resolve ambiguous fingerprint matches and find moves whose mtime was reset
+-- by a copy. The hash is reused while the file's mtime is unchanged.
+
+ALTER TABLE files ADD COLUMN content_fingerprint TEXT;        -- '<algorithm>:<size>:<hex digest>'
+ALTER TABLE files ADD COLUMN content_fingerprint_mtime REAL;  -- file st_mtime the hash was taken at
@@ -0,0 +1,8 @@
+-- Migration 018: Persist the batch poller's per-job check schedule
+-- The poller backs off per job based on Bedrock status and age. Storing the
+-- next check time lets a restart resume the schedule instead of re-checking
+-- every pending job at once.
+
+ALTER TABLE bedrock_batch_jobs ADD COLUMN next_check_at TIMESTAMP;        -- UTC, when the job is due for a status check
+ALTER TABLE bedrock_batch_jobs ADD COLUMN check_count INTEGER DEFAULT 0;  -- consecutive checks with last_bedrock_status unchanged
+ALTER TABLE bedrock_batch_jobs ADD COLUMN last_bedrock_status TEXT;       -- status Bedrock reported at the last check
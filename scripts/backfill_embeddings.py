@@ -99,10 +99,15 @@ def main():
     parser.add_argument('--transcripts-only', action='store_true')
     parser.add_argument('--nova-only', action='store_true')
     parser.add_argument('--limit', type=int, help='Limit number of items')
+    parser.add_argument('--concurrency', type=int,
+                        help='Concurrent Bedrock embedding calls (default: NOVA_EMBED_CONCURRENCY)')
     args = parser.parse_args()
 
     db = Database()
-    manager = EmbeddingManager(db)
+    # Passed to the service constructor so the Bedrock client's connection pool matches
+    manager = EmbeddingManager(
+        db, max_concurrency=max(1, args.concurrency) if args.concurrency else None
+    )
 
     # Check vector extension
     with db.get_connection() as conn:
@@ -114,6 +119,7 @@ def main():
     logger.info("Starting embedding backfill...")
     logger.info(f"Dimension: {manager.embeddings_service.dimension}")
     logger.info(f"Model: {manager.embeddings_service.MODEL_ID}")
+    logger.info(f"Concurrency: {manager.embeddings_service.max_concurrency}")
 
     if not args.nova_only:
         logger.info("\n=== Processing Transcripts ===")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""Compare recall and latency of the embedding storage modes on our data.
+
+Copies the stored embeddings into a scratch database, then for each mode
+(float, int8, bit) rebuilds the vec0 table and runs the same KNN queries.
+Recall@k is measured against the float (exact) results. The source database
+is only read.
+
+Query vectors are sampled from the stored embeddings, so each query's own
+vector is always its nearest neighbour; recall reflects the remaining k-1.
+
+Usage:
+    python -m scripts.benchmark_embedding_storage [--queries 100] [--k 20]
+        [--modes float,int8,bit] [--max-vectors N] [--rerank-factor N]
+"""
+import argparse
+import os
+import random
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import Database
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def copy_embeddings(source: Database, target: Database, max_vectors=None, batch_size=500):
+    """Copy embeddings (float32) from source into target. Returns the copied vectors."""
+    vectors = []
+    batch = []
+    for metadata, blob in source.iter_embedding_vectors(batch_size=batch_size):
+        vector = list(struct.unpack(f'{len(blob) // 4}f', blob))
+        vectors.append(vector)
+        batch.append({
+            'embedding_vector': vector,
+            'source_type': metadata['source_type'],
+            'source_id': metadata['source_id'],
+            'model_name': metadata['model_name'],
+            'content_hash': metadata['content_hash'],
+            'file_id': metadata['file_id'],
+        })
+        if len(batch) >= batch_size:
+            target.create_nova_embeddings_batch(batch)
+            batch = []
+        if max_vectors and len(vectors) >= max_vectors:
+            break
+    if batch:
+        target.create_nova_embeddings_batch(batch)
+    return vectors
+
+
+def vector_storage_bytes(db: Database) -> int:
+    """Bytes used by the vec0 table (dbstat), falling back to the file size."""
+    with db.get_connection() as conn:
+        try:
+            row = conn.execute(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE 'nova_embeddings%'"
+            ).fetchone()
+            if row[0]:
+                return row[0]
+        except Exception:
+            pass
+    return db.db_path.stat().st_size
+
+
+def run_queries(db: Database, queries, k):
+    """Run each query, returning (rowid lists, latencies in ms)."""
+    results = []
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        matches = db.search_embeddings(query_vector=query, limit=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([m['rowid'] for m in matches])
+    return results, latencies
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark embedding storage modes')
+    parser.add_argument('--queries', type=int, default=100, help='Number of query vectors')
+    parser.add_argument('--k', type=int, default=20, help='Neighbours per query')
+    parser.add_argument('--modes', default='float,int8,bit', help='Comma-separated modes')
+    parser.add_argument('--max-vectors', type=int, default=None, help='Copy at most N embeddings')
+    parser.add_argument('--rerank-factor', type=int, default=None,
+                        help='Override NOVA_EMBED_RERANK_FACTOR for quantized modes')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in modes if m not in Database.EMBEDDING_STORAGE_MODES]
+    if unknown:
+        parser.error(f"Unknown modes: {', '.join(unknown)}")
+    if 'float' in modes:
+        modes.remove('float')
+    modes.insert(0, 'float')  # Ground truth
+    if args.rerank_factor:
+        os.environ['NOVA_EMBED_RERANK_FACTOR'] = str(args.rerank_factor)
+
+    db_path = os.getenv('DATABASE_PATH', 'data/app.db')
+    source = Database(db_path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bench = Database(Path(tmp) / 'benchmark.db')
+        bench.rebuild_embedding_index(storage='float')
+
+        print(f"Copying embeddings from {db_path}...")
+        vectors = copy_embeddings(source, bench, max_vectors=args.max_vectors)
+        if not vectors:
+            print("No embeddings found")
+            return
+        random.seed(args.seed)
+        queries = random.sample(vectors, min(args.queries, len(vectors)))
+        print(f"  {len(vectors)} vectors, {len(queries)} queries, k={args.k}\n")
+
+        truth = None
+        print(f"{'mode':<6} {'vec0 MB':>9} {'p50 ms':>8} {'p95 ms':>8} {f'recall@{args.k}':>10}")
+        for mode in modes:
+            bench.rebuild_embedding_index(storage=mode)
+            with bench.get_connection() as conn:
+                conn.execute('VACUUM')
+            size_mb = vector_storage_bytes(bench) / (1024 * 1024)
+
+            run_queries(bench, queries[:5], args.k)  # Warm the page cache
+            results, latencies = run_queries(bench, queries, args.k)
+            if truth is None:
+                truth = results
+            recall = statistics.mean(
+                len(set(found) & set(expected)) / max(1, len(expected))
+                for found, expected in zip(results, truth)
+            )
+            print(f"{mode:<6} {size_mb:>9.2f} {percentile(latencies, 50):>8.2f} "
+                  f"{percentile(latencies, 95):>8.2f} {recall:>10.3f}")
+
+        bench.close_pool()
+
+
+if __name__ == '__main__':
+    main()
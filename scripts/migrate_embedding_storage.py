@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Switch the nova_embeddings vector storage mode.
+
+Modes:
+    float   float32 vectors in vec0 (default, exact KNN)
+    int8    int8-quantized vectors in vec0, re-ranked with float32 copies
+    bit     binary-quantized vectors in vec0 (hamming KNN), re-ranked with float32 copies
+
+Quantized modes keep the float32 vectors in nova_embedding_vectors and cut the
+vec0 table to 1/4 (int8) or 1/32 (bit) of its size. Set NOVA_EMBED_STORAGE to
+the same mode so fresh databases are created with it. Safe to re-run.
+
+Restart the app after migrating so running processes pick up the new layout.
+
+Usage:
+    python -m scripts.migrate_embedding_storage --mode int8
+"""
+import argparse
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import Database
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Switch the nova_embeddings vector storage mode')
+    parser.add_argument('--mode', required=True, choices=list(Database.EMBEDDING_STORAGE_MODES),
+                        help='Vector storage mode')
+    args = parser.parse_args()
+
+    db_path = os.getenv('DATABASE_PATH', 'data/app.db')
+    db = Database(db_path)
+
+    print(f"Migrating nova_embeddings in {db_path} to {args.mode} storage...")
+    start = time.time()
+    try:
+        result = db.rebuild_embedding_index(storage=args.mode)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.time() - start
+
+    if result['status'] == 'already_migrated':
+        print(f"Already using {args.mode} storage, nothing to do")
+        return
+
+    print(f"  Migrated: {result['migrated']} vectors")
+    if result['dropped']:
+        print(f"  Dropped:  {result['dropped']} vectors without metadata")
+    print(f"Done in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
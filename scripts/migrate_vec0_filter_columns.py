@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Rebuild the nova_embeddings vec0 table with filter columns.
+
+Adds source_type (partition key), model_name and file_id to the vector table
+so semantic search filters run inside the KNN. Requires sqlite-vec v0.1.6 or
+newer; older builds keep working with the over-fetch fallback. Safe to re-run.
+
+Restart the app after migrating so running processes pick up the new layout.
+
+Usage:
+    python -m scripts.migrate_vec0_filter_columns
+"""
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import Database
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def main():
+    db_path = os.getenv('DATABASE_PATH', 'data/app.db')
+    db = Database(db_path)
+
+    print(f"Migrating nova_embeddings in {db_path}...")
+    start = time.time()
+    try:
+        result = db.migrate_embeddings_to_filtered_vec0()
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = time.time() - start
+
+    if result['status'] == 'already_migrated':
+        print("Already migrated, nothing to do")
+        return
+
+    print(f"  Migrated: {result['migrated']} vectors")
+    if result['dropped']:
+        print(f"  Dropped:  {result['dropped']} vectors without metadata")
+    print(f"Done in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""Rebuild the FTS5 full-text search indexes.
+
+The indexes are created and populated automatically on app start and kept in
+sync by triggers. Run this after bulk edits made outside the app (e.g. with
+triggers dropped) or to compact the indexes.
+
+Usage:
+    python -m scripts.rebuild_search_index [--no-optimize]
+
+Options:
+    --no-optimize   Skip merging index segments after the rebuild
+"""
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import Database
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def main():
+    optimize = '--no-optimize' not in sys.argv
+    db_path = os.getenv('DATABASE_PATH', 'data/app.db')
+    db = Database(db_path)
+
+    print(f"Rebuilding search indexes in {db_path}...")
+    start = time.time()
+    counts = db.rebuild_search_index(optimize=optimize)
+    elapsed = time.time() - start
+
+    for table, count in counts.items():
+        print(f"  {table}: {count} rows")
+    print(f"Done in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Check scheduling of BatchPollerService."""
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.batch_poller_service import BatchPollerService
+
+NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _job(age_seconds):
+    submitted = datetime.fromtimestamp(NOW - age_seconds, tz=timezone.utc)
+    return {'submitted_at': submitted.strftime('%Y-%m-%d %H:%M:%S')}
+
+
+@pytest.fixture
+def poller(monkeypatch):
+    for name in ('BATCH_CHECK_INTERVAL', 'BATCH_CHECK_MAX_INTERVAL'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr('app.services.batch_poller_service.time.time', lambda: NOW)
+    return BatchPollerService(app=None)
+
+
+def test_delay_doubles_per_unchanged_check_up_to_max(poller):
+    job = _job(24 * 3600)
+
+    delays = [poller._next_check_delay(job, 'InProgress', count) for count in range(7)]
+
+    assert delays == [60, 120, 240, 480, 960, 1800, 1800]
+
+
+def test_delay_uses_status_multiplier(poller):
+    job = _job(24 * 3600)
+
+    assert poller._next_check_delay(job, 'Submitted', 0) == 30
+    assert poller._next_check_delay(job, 'Scheduled', 0) == 120
+    assert poller._next_check_delay(job, 'Stopping', 0) == 30
+
+
+def test_young_job_is_checked_relative_to_its_age(poller):
+    assert poller._next_check_delay(_job(2000), 'InProgress', 5) == 500
+    # Never below batch_check_interval
+    assert poller._next_check_delay(_job(10), 'InProgress', 5) == 30
+
+
+def test_almost_done_job_is_checked_often(poller):
+    poller._typical_duration = 10000.0
+
+    assert poller._next_check_delay(_job(8000), 'InProgress', 5) == 60
+    assert poller._next_check_delay(_job(7000), 'InProgress', 5) == 1750
+    # Only InProgress jobs are close to completion
+    assert poller._next_check_delay(_job(8000), 'Scheduled', 5) == 1800
+
+
+def test_job_without_submitted_at_uses_backoff_only(poller):
+    assert poller._next_check_delay({}, 'InProgress', 3) == 480
@@ -0,0 +1,80 @@
+"""CUR Parquet aggregation of BillingService."""
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from app.services.billing_service import (
+    CUR_LINE_ITEM_TYPE,
+    CUR_USAGE_START,
+    CUR_VALUE_COLUMNS,
+    BillingService,
+)
+
+
+def _batch(columns):
+    return pa.RecordBatch.from_pydict(columns)
+
+
+def _rows(table):
+    return sorted(table.to_pylist(), key=lambda row: (row['usage_date'], row['service_code']))
+
+
+def test_batch_is_summed_per_group_within_date_range():
+    batch = _batch({
+        CUR_USAGE_START: [
+            '2025-12-01T00:00:00Z', '2025-12-01 10:00:00', '2025-12-02T00:00:00Z',
+            '2025-11-30T23:00:00Z', None,
+        ],
+        CUR_VALUE_COLUMNS['service_code']: ['AmazonS3', 'AmazonS3', None, 'AmazonS3', 'AmazonS3'],
+        CUR_VALUE_COLUMNS['cost']: [1.5, 2.0, None, 9.0, 9.0],
+        CUR_VALUE_COLUMNS['operation']: ['PutObject'] * 5,
+        CUR_VALUE_COLUMNS['usage_type']: ['Requests'] * 5,
+        CUR_VALUE_COLUMNS['usage_amount']: [10.0, 5.0, 1.0, 1.0, 1.0],
+    })
+
+    table = BillingService._aggregate_cur_batch(batch, '2025-12-01', '2025-12-31')
+
+    assert _rows(table) == [
+        {'service_code': 'AmazonS3', 'usage_date': '2025-12-01', 'operation': 'PutObject',
+         'usage_type': 'Requests', 'cost': 3.5, 'usage_amount': 15.0, 'line_items': 2},
+        {'service_code': 'Unknown', 'usage_date': '2025-12-02', 'operation': 'PutObject',
+         'usage_type': 'Requests', 'cost': 0.0, 'usage_amount': 1.0, 'line_items': 1},
+    ]
+
+
+def test_missing_columns_get_defaults_and_timestamps_are_formatted():
+    batch = _batch({
+        CUR_USAGE_START: pa.array(
+            [datetime(2025, 12, 5, 8), datetime(2025, 12, 5, 20)], type=pa.timestamp('ms')
+        ),
+        CUR_VALUE_COLUMNS['service_code']: ['', 'AmazonBedrock'],
+        CUR_VALUE_COLUMNS['cost']: [0.25, 0.75],
+    })
+
+    table = BillingService._aggregate_cur_batch(batch, '2025-12-01', '2025-12-31')
+
+    assert table.column_names == [
+        'service_code', 'usage_date', 'operation', 'usage_type', 'cost', 'usage_amount', 'line_items'
+    ]
+    assert _rows(table) == [
+        {'service_code': 'AmazonBedrock', 'usage_date': '2025-12-05', 'operation': '',
+         'usage_type': '', 'cost': 0.75, 'usage_amount': 0.0, 'line_items': 1},
+        {'service_code': 'Unknown', 'usage_date': '2025-12-05', 'operation': '',
+         'usage_type': '', 'cost': 0.25, 'usage_amount': 0.0, 'line_items': 1},
+    ]
+
+
+def test_scan_filter_keeps_usage_items_near_the_range():
+    table = pa.table({
+        CUR_LINE_ITEM_TYPE: ['Usage', 'Usage', 'Tax', 'Usage', 'Usage'],
+        CUR_USAGE_START: pa.array([
+            datetime(2025, 12, 1), datetime(2025, 11, 30, 12), datetime(2025, 12, 1),
+            datetime(2025, 11, 29), datetime(2026, 1, 2),
+        ], type=pa.timestamp('us')),
+    })
+
+    expression = BillingService._cur_scan_filter(table.schema, '2025-12-01', '2025-12-31')
+    kept = ds.dataset(table).to_table(filter=expression)
+
+    assert kept[CUR_USAGE_START].to_pylist() == [datetime(2025, 12, 1), datetime(2025, 11, 30, 12)]
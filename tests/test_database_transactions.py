@@ -0,0 +1,56 @@
+"""Transaction behaviour of DatabaseBase.get_connection."""
+import sqlite3
+
+import pytest
+
+from app.database.base import DatabaseBase
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = DatabaseBase(tmp_path / 'test.db')
+    with database.get_connection() as conn:
+        conn.execute('CREATE TABLE items (name TEXT)')
+    yield database
+    database.close_pool()
+
+
+def _names(db):
+    # Separate connection: only committed rows are visible
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        return [row[0] for row in conn.execute('SELECT name FROM items ORDER BY name')]
+    finally:
+        conn.close()
+
+
+def test_outer_rollback_undoes_nested_writes(db):
+    with pytest.raises(RuntimeError):
+        with db.get_connection():
+            with db.get_connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('a')")
+            with db.get_connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('b')")
+            raise RuntimeError('abort')
+
+    assert _names(db) == []
+
+
+def test_nested_writes_commit_with_outer_context(db):
+    with db.get_connection():
+        with db.get_connection() as conn:
+            conn.execute("INSERT INTO items VALUES ('a')")
+        assert _names(db) == []
+
+    assert _names(db) == ['a']
+
+
+def test_nested_failure_only_undoes_inner_work(db):
+    with db.get_connection() as outer:
+        outer.execute("INSERT INTO items VALUES ('a')")
+        with pytest.raises(RuntimeError):
+            with db.get_connection() as conn:
+                conn.execute("INSERT INTO items VALUES ('b')")
+                raise RuntimeError('abort')
+
+    assert _names(db) == ['a']
@@ -0,0 +1,23 @@
+"""Proxy metadata derived from a source probe."""
+from app.utils.media_metadata import derive_proxy_metadata, has_square_pixels
+
+
+def _probe(width, height, sar=None):
+    stream = {'codec_type': 'video', 'width': width, 'height': height}
+    if sar is not None:
+        stream['sample_aspect_ratio'] = sar
+    return {'streams': [stream], 'format': {'duration': '10.0'}}
+
+
+def test_square_pixels():
+    assert has_square_pixels(_probe(1920, 1080))
+    assert has_square_pixels(_probe(1920, 1080, '1:1'))
+    assert has_square_pixels(_probe(1920, 1080, '0:1'))
+    assert not has_square_pixels(_probe(720, 480, '8:9'))
+    assert not has_square_pixels(_probe(1440, 1080, '4:3'))
+
+
+def test_derived_proxy_width_is_even():
+    metadata = derive_proxy_metadata(_probe(1920, 1080), proxy_size_bytes=1000)
+
+    assert (metadata['resolution_width'], metadata['resolution_height']) == (1280, 720)
@@ -0,0 +1,70 @@
+"""Change planning in RescanService."""
+from app.services.rescan_service import RescanService
+
+
+def _reconcile_results():
+    return {
+        'moved': [],
+        'deleted': [],
+        'new': [],
+        'ambiguous': [({'id': 7, 'local_path': '/old/a.mp4'}, [{'path': '/new/a.mp4'}])],
+    }
+
+
+def test_plan_ambiguous_matches():
+    service = RescanService(db=None)
+
+    assert service._plan_changes(_reconcile_results(), {'handle_ambiguous': 'skip'})['moved'] == []
+    assert service._plan_changes(_reconcile_results(), {'handle_ambiguous': 'first_match'})['moved'] == [
+        (7, '/old/a.mp4', '/new/a.mp4')
+    ]
+    assert service._plan_changes(_reconcile_results(), {'handle_ambiguous': 'delete'})['deleted'] == [
+        (7, '/old/a.mp4')
+    ]
+
+
+class _JobDB:
+    def __init__(self):
+        self.completed = None
+
+    def update_import_job_status(self, *args, **kwargs):
+        pass
+
+    def update_import_job(self, *args, **kwargs):
+        pass
+
+    def update_import_job_progress(self, *args, **kwargs):
+        pass
+
+    def is_import_job_cancelled(self, job_id):
+        return False
+
+    def complete_import_job(self, job_id, results, error_message=None):
+        self.completed = (results, error_message)
+
+
+def test_async_apply_leaves_ambiguous_matches_alone(monkeypatch):
+    db = _JobDB()
+    service = RescanService(db)
+    applied = {}
+    monkeypatch.setattr(service, 'reconcile', lambda *args, **kwargs: _reconcile_results())
+
+    def apply_changes(reconcile_results, options, **kwargs):
+        applied['plan'] = service._plan_changes(reconcile_results, options)
+        return {'updated': 0, 'deleted': 0, 'imported': 0, 'skipped': 0, 'errors': [], 'cancelled': False}
+
+    monkeypatch.setattr(service, 'apply_changes', apply_changes)
+
+    class _InlineThread:
+        def __init__(self, target, daemon=None):
+            self.target = target
+
+        def start(self):
+            self.target()
+
+    monkeypatch.setattr('app.services.rescan_service.threading.Thread', _InlineThread)
+
+    service.run_apply_job_async('job', '/media', {}, {'update_moved': True, 'handle_ambiguous': 'delete'})
+
+    assert db.completed[1] is None
+    assert applied['plan']['moved'] == [] and applied['plan']['deleted'] == []
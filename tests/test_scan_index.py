@@ -0,0 +1,43 @@
+"""Subtree lookups in the directory scan index."""
+import pytest
+
+from app.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / 'test.db')
+    yield database
+    database.close_pool()
+
+
+def _entry():
+    return {'mtime': 1.0, 'files': [], 'subdirs': []}
+
+
+def test_subtree_lookup_is_case_sensitive(db):
+    db.save_directory_scan_index('/media/clips', 'mp4', {
+        '/media/clips': _entry(), '/media/clips/a': _entry()
+    })
+    db.save_directory_scan_index('/media/Clips', 'mp4', {
+        '/media/Clips': _entry(), '/media/Clips/b': _entry()
+    })
+
+    assert sorted(db.get_directory_scan_index('/media/clips', 'mp4')) == ['/media/clips', '/media/clips/a']
+
+
+def test_wildcards_and_siblings_are_not_matched(db):
+    db.save_directory_scan_index('/media', 'mp4', {
+        '/media/a_b': _entry(), '/media/a_b/c': _entry(), '/media/axb/c': _entry(),
+        '/media/a_b2': _entry(), '/media/a_b%/d': _entry()
+    })
+
+    assert sorted(db.get_directory_scan_index('/media/a_b/', 'mp4')) == ['/media/a_b', '/media/a_b/c']
+
+
+def test_windows_separators(db):
+    db.save_directory_scan_index('C:\\media', 'mp4', {
+        'C:\\media': _entry(), 'C:\\media\\a': _entry(), 'C:\\media2': _entry()
+    })
+
+    assert sorted(db.get_directory_scan_index('C:\\media', 'mp4')) == ['C:\\media', 'C:\\media\\a']
@@ -0,0 +1,68 @@
+"""Keyword search over the FTS5 indexes."""
+import pytest
+
+from app.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / 'test.db')
+    yield database
+    database.close_pool()
+
+
+def _add_file(db, filename):
+    with db.get_connection() as conn:
+        conn.execute(
+            'INSERT INTO files (filename, file_type, size_bytes, content_type, local_path) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (filename, 'video', 1, 'video/mp4', f'/media/{filename}')
+        )
+
+
+def test_trigram_match_expression(db):
+    db.fts_tokenizer = 'trigram'
+
+    assert db._build_fts_match('water fall') == '"water" "fall"'
+    assert db._build_fts_match('  ') is None
+    # Too short for trigrams: the LIKE search handles it
+    assert db._build_fts_match('a fall') is None
+
+
+def test_prefix_match_expression_without_trigram(db):
+    db.fts_tokenizer = 'unicode61'
+
+    assert db._build_fts_match('water fal') == '"water"* "fal"*'
+
+
+def test_keyword_search_matches_substrings(db):
+    if db.fts_tokenizer != 'trigram':
+        pytest.skip('SQLite without the trigram tokenizer')
+    _add_file(db, 'Big Waterfall.mp4')
+    _add_file(db, 'falls.mp4')
+    _add_file(db, 'river.mp4')
+
+    titles = sorted(r['title'] for r in db.search_all('fall', sources=['file']))
+
+    assert titles == ['Big Waterfall.mp4', 'falls.mp4']
+    assert db.count_search_results('FALL', sources=['file'])['file'] == 2
+
+
+def test_index_built_with_other_tokenizer_is_recreated(tmp_path):
+    database = Database(tmp_path / 'test.db')
+    if database.fts_tokenizer != 'trigram':
+        pytest.skip('SQLite without the trigram tokenizer')
+    _add_file(database, 'Big Waterfall.mp4')
+    with database.get_connection() as conn:
+        conn.execute('DROP TABLE files_fts')
+        conn.execute(
+            "CREATE VIRTUAL TABLE files_fts USING fts5(filename, local_path, metadata, "
+            "codec_video, codec_audio, content='files', content_rowid='id')"
+        )
+    database.close_pool()
+
+    database = Database(tmp_path / 'test.db')
+    try:
+        assert [r['title'] for r in database.search_all('fall', sources=['file'])] == ['Big Waterfall.mp4']
+    finally:
+        database.close_pool()
@@ -0,0 +1,64 @@
+"""Paging and cursor contract of SemanticResultCache."""
+from app.services.semantic_result_cache import SemanticResultCache
+
+VEC_MAX_K = 4096
+
+
+def _rows(n):
+    return [{'source_id': i} for i in range(n)]
+
+
+def test_cursor_round_trip():
+    cache = SemanticResultCache()
+    scope = cache.cursor_scope('waterfall', ['nova'])
+    cursor = cache.encode_cursor('abc', 40, scope)
+
+    assert cache.decode_cursor(cursor) == ('abc', 40, scope)
+
+
+def test_malformed_cursors_are_rejected():
+    cache = SemanticResultCache()
+
+    assert cache.decode_cursor('not-a-cursor') is None
+    assert cache.decode_cursor(cache.encode_cursor('abc', -1, 'x')) is None
+
+
+def test_cursor_scope_binds_query_and_sources():
+    scope = SemanticResultCache.cursor_scope
+
+    assert scope('waterfall', ['nova', 'transcript']) == scope(' waterfall ', ['transcript', 'nova'])
+    assert scope('waterfall', ['nova']) != scope('river', ['nova'])
+    assert scope('waterfall', ['nova']) != scope('waterfall', ['transcript'])
+    assert scope('waterfall', None) != scope('waterfall', ['nova'])
+
+
+def test_short_result_set_is_exhausted():
+    cache = SemanticResultCache(default_depth=200)
+    result_set = cache.put('k', _rows(150), 200)
+
+    assert result_set.exhausted
+    assert result_set.covers(1000)
+
+
+def test_full_result_set_needs_deeper_knn():
+    cache = SemanticResultCache(default_depth=200)
+    result_set = cache.put('k', _rows(200), 200)
+
+    assert not result_set.exhausted
+    assert result_set.covers(200)
+    assert not result_set.covers(220)
+    assert cache.depth_for(220, previous=result_set) == 400
+
+
+def test_depth_is_capped_and_capped_set_is_exhausted():
+    cache = SemanticResultCache(default_depth=200)
+    previous = cache.put('k', _rows(3000), 3000)
+
+    depth = cache.depth_for(3020, previous=previous, max_depth=VEC_MAX_K)
+    assert depth == VEC_MAX_K
+
+    result_set = cache.put('k', _rows(VEC_MAX_K), depth, at_max_depth=depth >= VEC_MAX_K)
+    assert result_set.exhausted
+    # Pages past the cap are empty and final instead of re-running the KNN
+    assert result_set.covers(VEC_MAX_K + 20)
+    assert result_set.results[VEC_MAX_K:VEC_MAX_K + 20] == []
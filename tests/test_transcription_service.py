@@ -0,0 +1,78 @@
+"""Pure helpers of TranscriptionService."""
+from app.services.transcription_service import (
+    TranscriptionService,
+    plan_audio_windows,
+    stitch_window_results,
+)
+
+
+def test_worker_cap_defaults_to_one_replica_on_cuda(monkeypatch):
+    monkeypatch.delenv('TRANSCRIBE_MAX_WORKERS', raising=False)
+    monkeypatch.delenv('TRANSCRIBE_WORKERS', raising=False)
+    monkeypatch.setattr('os.cpu_count', lambda: 16)
+
+    assert TranscriptionService.get_max_workers('cuda') == 1
+    assert TranscriptionService.get_max_workers('cpu') == 16
+    assert TranscriptionService._get_pipeline_settings(16, None, None, device='cuda')[0] == 1
+    assert TranscriptionService._get_pipeline_settings(64, None, None, device='cpu')[0] == 16
+
+
+def test_worker_cap_setting_wins(monkeypatch):
+    monkeypatch.setenv('TRANSCRIBE_MAX_WORKERS', '2')
+
+    assert TranscriptionService.get_max_workers('cuda') == 2
+    workers, _prefetch, cpu_threads = TranscriptionService._get_pipeline_settings(
+        8, None, None, device='cpu'
+    )
+    assert workers == 2
+
+
+def test_windows_cut_in_silence_without_overlap():
+    speech = [{'start': 0, 'end': 28}, {'start': 32, 'end': 58}, {'start': 62, 'end': 100}]
+
+    windows = plan_audio_windows(speech, 100, window_samples=30, max_samples=45, overlap_samples=5)
+
+    assert [(w['core_start'], w['core_end']) for w in windows] == [(0, 30), (30, 60), (60, 100)]
+    assert all(w['start'] == w['core_start'] and w['end'] == w['core_end'] for w in windows)
+
+
+def test_windows_hard_cut_overlaps_both_neighbours():
+    speech = [{'start': 0, 'end': 100}]
+
+    windows = plan_audio_windows(speech, 100, window_samples=30, max_samples=45, overlap_samples=5)
+
+    assert windows == [
+        {'start': 0, 'end': 35, 'core_start': 0, 'core_end': 30},
+        {'start': 25, 'end': 65, 'core_start': 30, 'core_end': 60},
+        {'start': 55, 'end': 100, 'core_start': 60, 'core_end': 100},
+    ]
+
+
+def test_stitching_keeps_overlapping_segments_once():
+    windows = [
+        {'start': 0, 'end': 35, 'core_start': 0, 'core_end': 30},
+        {'start': 25, 'end': 60, 'core_start': 30, 'core_end': 60},
+    ]
+    window_results = [
+        {'language': 'en', 'segments': [
+            {'start': 0.0, 'end': 26.0, 'text': 'a'},
+            {'start': 26.0, 'end': 29.0, 'text': 'b',
+             'words': [{'start': 26.0, 'end': 29.0, 'word': 'b'}]},
+            {'start': 31.0, 'end': 34.0, 'text': 'c'},
+        ]},
+        {'language': 'en', 'segments': [
+            {'start': 1.0, 'end': 4.0, 'text': 'b',
+             'words': [{'start': 1.0, 'end': 4.0, 'word': 'b'}]},
+            {'start': 6.0, 'end': 9.0, 'text': 'c',
+             'words': [{'start': 6.0, 'end': 9.0, 'word': 'c'}]},
+            {'start': 9.0, 'end': 35.0, 'text': 'd'},
+        ]},
+    ]
+
+    segments, words, languages = stitch_window_results(windows, window_results, sample_rate=1)
+
+    assert [s['text'] for s in segments] == ['a', 'b', 'c', 'd']
+    assert [s['id'] for s in segments] == [1, 2, 3, 4]
+    assert (segments[2]['start'], segments[2]['end']) == (31.0, 34.0)
+    assert [(w['word'], w['start'], w['end']) for w in words] == [('b', 26.0, 29.0), ('c', 31.0, 34.0)]
+    assert languages.most_common(1) == [('en', 2)]
@@ -0,0 +1,34 @@
+"""Piece selection for VideoChunker.split_local_video."""
+from app.services.video_chunker import VideoChunker
+
+
+def _select(pieces, overlap_start, overlap_end):
+    return VideoChunker._select_chunk_pieces(pieces, overlap_start, overlap_end)
+
+
+def test_pieces_on_exact_edges():
+    pieces = [('p0', 0.0), ('p1', 100.0), ('p2', 110.0), ('p3', 200.0), ('p4', 210.0)]
+
+    assert _select(pieces, 0.0, 110.0) == ['p0', 'p1']
+    assert _select(pieces, 100.0, 210.0) == ['p1', 'p2', 'p3']
+    assert _select(pieces, 200.0, 300.0) == ['p3', 'p4']
+
+
+def test_piece_containing_start_is_included_when_cut_snapped_late():
+    # Cut at 100 snapped to a keyframe at 104: the chunk starting at 100
+    # needs the piece that began at 0 to cover 100-104
+    pieces = [('p0', 0.0), ('p1', 104.0), ('p2', 113.0), ('p3', 203.0)]
+
+    assert _select(pieces, 100.0, 210.0) == ['p0', 'p1', 'p2', 'p3']
+
+
+def test_sparse_keyframes_without_piece_start_in_window():
+    # One keyframe every 300s: no piece starts inside [100, 210)
+    pieces = [('p0', 0.0), ('p1', 300.0)]
+
+    assert _select(pieces, 100.0, 210.0) == ['p0']
+    assert _select(pieces, 200.0, 400.0) == ['p0', 'p1']
+
+
+def test_no_pieces_falls_back():
+    assert _select([], 0.0, 100.0) == []